@@ -0,0 +1,215 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Batch runner for the Example scripts.
+
+Every (example, holes, size, region) combination is an independent job, and the jobs are spread across a pool of processes.
+The largest clouds are scheduled first, each worker runs a single job under a memory limit, and a manifest with the status,
+wall time, peak memory and results of every job is written at the end.
+
+Usage:
+    python Batch.py [config.json] [--workers N] [--memory MB] [--dry-run]
+
+The configuration file is a JSON file with the following keys (see Batch.json):
+    examples        list            Examples to run (1, 2 and/or 3).
+    sizes           list            Sizes of the clouds to use.
+    holes           list            Holes configurations to use (false and/or true).
+    regions         list            Regions to use (an empty list for all the regions found in Data).
+    workers         int             Number of worker processes (0 for all the available cores).
+    memory          int             Memory limit for each worker in MB (0 for no limit).
+    manifest        string          File where the manifest is written.
+"""
+
+## Library importation.
+import os
+for var in ['OMP_NUM_THREADS', 'OPENBLAS_NUM_THREADS', 'MKL_NUM_THREADS']:
+    os.environ.setdefault(var, '1')                                                 # One thread per worker, the pool provides the parallelism.
+import sys
+import glob
+import json
+import time
+import argparse
+import importlib
+import traceback
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+import Scripts.Files as Files
+try:
+    import resource
+except ImportError:                                                                 # Memory limits are only available on Unix.
+    resource = None
+
+## Default configuration.
+Default = {
+    'examples': [1, 2, 3],
+    'sizes':    [1, 2, 3],
+    'holes':    [False, True],
+    'regions':  [],
+    'workers':  0,
+    'memory':   0,
+    'manifest': 'Results/manifest.json'
+}
+
+def Jobs(config):
+    """
+    Jobs
+    Function to list all the jobs of a sweep, sorted from the largest to the smallest cloud.
+    
+    Input:
+        config                      dict            Configuration of the sweep.
+    
+    Output:
+        jobs                        list            List with the jobs, each one as a dict.
+    """
+
+    ## Variable initialization.
+    jobs = []                                                                       # jobs initialization.
+
+    ## Jobs listing.
+    for example in config['examples']:                                              # For each of the examples.
+        for holes in config['holes']:                                               # For each holes configuration.
+            for size in config['sizes']:                                            # For each size of the clouds.
+                data_path = 'Data/{}/{}/'.format('Holes' if holes else 'Clouds', size)
+                                                                                    # Path to look for the data.
+                for path in sorted(glob.glob(data_path + '*_p.csv')):               # For each of the regions.
+                    region = os.path.basename(path)[:-len('_p.csv')]                # The name of the region.
+                    if config['regions'] and region not in config['regions']:       # If the region was not chosen.
+                        continue
+                    jobs.append({'example': int(example), 'holes': bool(holes), 'size': int(size), 'region': region, 'bytes': os.path.getsize(path)})
+
+    ## The largest clouds go first.
+    jobs.sort(key = lambda job: job['bytes'], reverse = True)                       # Sort by the size of the cloud file.
+
+    return jobs
+
+def Limit(memory):
+    """
+    Limit
+    Function to set the memory limit of a worker process.
+    
+    Input:
+        memory                      int             Memory limit in MB (0 for no limit).
+    
+    Output:
+        None
+    """
+
+    ## Memory limit.
+    if memory and resource is not None:                                             # If there is a limit and it can be set.
+        limit = int(memory)*2**20                                                   # The limit in bytes.
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))                      # The address space of the worker is limited.
+
+def Job(job):
+    """
+    Job
+    Function to run a single job in a worker process.
+    
+    Input:
+        job                         dict            The job, as listed by Jobs.
+    
+    Output:
+        record                      dict            The job with its status, wall time, peak memory and results.
+    """
+
+    ## Variable initialization.
+    record = dict(job)                                                              # The record of the job.
+    start  = time.perf_counter()                                                    # Start time of the job.
+
+    ## Job execution.
+    try:
+        module = importlib.import_module('Example_%d' % job['example'])             # The example is loaded.
+        result = module.run_region(job['holes'], str(job['size']), job['region'])   # The region is solved.
+        record.update(status = 'done', result = result)                             # The job finished.
+    except MemoryError:                                                             # The job exceeded the memory limit.
+        record.update(status = 'memory', error = traceback.format_exc())
+    except Exception:                                                               # The job failed.
+        record.update(status = 'failed', error = traceback.format_exc())
+
+    ## Statistics.
+    record['seconds'] = time.perf_counter() - start                                 # Wall time of the job.
+    if resource is not None:                                                        # If the peak memory is available.
+        record['peak_mb'] = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024 # Peak resident memory of the worker in MB.
+
+    return record
+
+def Run(config):
+    """
+    Run
+    Function to run all the jobs of a sweep in a pool of processes and write the manifest.
+    
+    Input:
+        config                      dict            Configuration of the sweep.
+    
+    Output:
+        manifest                    dict            The manifest of the sweep.
+    """
+
+    ## Variable initialization.
+    config  = dict(Default, **config)                                               # Missing keys take the default values.
+    jobs    = Jobs(config)                                                          # The jobs of the sweep.
+    workers = config['workers'] or os.cpu_count()                                   # The number of worker processes.
+    records = []                                                                    # records initialization.
+    start   = time.perf_counter()                                                   # Start time of the sweep.
+
+    ## Jobs execution.
+    context = multiprocessing.get_context('spawn')                                  # Fresh processes, so each job has its own memory limit.
+    with ProcessPoolExecutor(max_workers = workers, mp_context = context, initializer = Limit, initargs = (config['memory'],), max_tasks_per_child = 1) as pool:
+        futures = [pool.submit(Job, job) for job in jobs]                           # The jobs are submitted, the largest first.
+        for future in as_completed(futures):                                        # For each finished job.
+            try:
+                record = future.result()                                            # The record of the job.
+            except Exception:                                                       # The worker died (e.g. killed by the system).
+                record = dict(jobs[futures.index(future)], status = 'crashed', error = traceback.format_exc())
+            records.append(record)                                                  # The record is saved.
+            print('[%d/%d] Example %d, %s, size %d, %s: %s' % (len(records), len(jobs), record['example'], 'Holes' if record['holes'] else 'Clouds',
+                                                             record['size'], record['region'], record['status']))
+
+    ## Manifest.
+    manifest = {'config': config, 'seconds': time.perf_counter() - start, 'workers': workers,
+                'done': sum(record['status'] == 'done' for record in records), 'jobs': records}
+    Files.Atomic(config['manifest'], lambda file: json.dump(manifest, file, indent = 2), binary = False)
+                                                                                    # The manifest is published atomically.
+
+    return manifest
+
+if __name__ == '__main__':
+    ## Command line.
+    parser = argparse.ArgumentParser(description = 'Run the Example scripts over all the regions in parallel.')
+    parser.add_argument('config', nargs = '?', default = None, help = 'JSON configuration file.')
+    parser.add_argument('--workers', type = int, default = None, help = 'Number of worker processes.')
+    parser.add_argument('--memory', type = int, default = None, help = 'Memory limit for each worker in MB.')
+    parser.add_argument('--dry-run', action = 'store_true', help = 'Only list the jobs.')
+    args = parser.parse_args()
+
+    ## Configuration.
+    config = {}
+    if args.config is not None:
+        with open(args.config) as file:
+            config = json.load(file)                                                # The configuration file is read.
+    if args.workers is not None:
+        config['workers'] = args.workers
+    if args.memory is not None:
+        config['memory'] = args.memory
+
+    ## Run the sweep.
+    if args.dry_run:
+        for job in Jobs(dict(Default, **config)):
+            print('Example %d, %s, size %d, %s' % (job['example'], 'Holes' if job['holes'] else 'Clouds', job['size'], job['region']))
+    else:
+        manifest = Run(config)
+        print('%d of %d jobs completed in %1.1f s.' % (manifest['done'], len(manifest['jobs']), manifest['seconds']))
+        sys.exit(0 if manifest['done'] == len(manifest['jobs']) else 1)
@@ -0,0 +1,361 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Benchmark suite for the solver stages.
+
+Every stage (neighbor search in all its modes, Gammas, explicit and implicit operators, time stepping, error and rendering) is
+timed and memory-profiled on the bundled regions and on generated clouds. The wall time is the best of several repetitions, and
+the memory is the growth of the peak resident set size while the stage runs once more in a forked process, so the native
+allocations of SuperLU, ARPACK and the BLAS are counted too. The results are written to a JSON file and compared against a
+stored baseline.
+
+Usage:
+    python Benchmark.py [config.json] [--regions R ...] [--stages S ...] [--update-baseline]
+
+The configuration file is a JSON file with the following keys (see Benchmark.json):
+    sizes           list            Sizes of the bundled clouds to use.
+    holes           list            Holes configurations to use (false and/or true).
+    regions         list            Regions to use (an empty list for all the regions found in Data).
+    synthetic       list            Number of nodes of the clouds generated on the unit square.
+    stages          list            Stages to run (an empty list for all the stages).
+    t               int             Number of time steps for the stepping stages.
+    workers         int             Number of threads of the threaded stepping stage (null for one per core).
+    repeat          int             Number of timed repetitions of each stage.
+    slow_limit      int             Largest cloud for the node-by-node stages (neighbors modes 1, Cloud_old).
+    dense_limit     int             Largest cloud for the dense m x m stages.
+    output          string          File where the results are written.
+    baseline        string          File with the baseline results.
+    time_threshold  float           Largest allowed ratio between the wall time and the baseline.
+    memory_threshold float          Largest allowed ratio between the peak memory and the baseline.
+    min_seconds     float           Time differences below this value are never reported as regressions.
+"""
+
+## Library importation.
+import os
+import sys
+import glob
+import json
+import time
+import argparse
+import platform
+import resource
+import multiprocessing
+import numpy as np
+import scipy
+import Wave_2D
+import Scripts.Errors as Errors
+import Scripts.Files as Files
+import Scripts.Gammas as Gammas
+import Scripts.Generator as Generator
+import Scripts.Graph as Graph
+import Scripts.Loader as Loader
+import Scripts.Neighbors as Neighbors
+import Scripts.Operators as Operators
+
+## Default configuration.
+Default = {
+    'sizes':            [1, 2, 3],
+    'holes':            [False, True],
+    'regions':          [],
+    'synthetic':        [5000, 20000],
+    'stages':           [],
+    't':                200,
+    'workers':          None,
+    'repeat':           3,
+    'slow_limit':       1500,
+    'dense_limit':      3000,
+    'output':           'Results/benchmark.json',
+    'baseline':         'Results/benchmark_baseline.json',
+    'time_threshold':   1.25,
+    'memory_threshold': 1.25,
+    'min_seconds':      0.005
+}
+
+## Problem parameters of the stepping stages.
+c    = np.sqrt(1/2)                                                                 # Wave propagation velocity.
+cho  = 1                                                                            # Function boundary condition.
+r    = np.array([0.5, 0.5])                                                         # Not used by f and g.
+nvec = 8                                                                            # Maximum number of neighbors for each node.
+
+def f(x, y, t, c, cho, r):
+    return np.sin(np.pi*x)*np.sin(np.pi*y)*np.cos(np.sqrt(2)*np.pi*c*t)
+
+def g(x, y, t, c, cho, r):
+    return -np.sqrt(2)*np.pi*c*np.sin(np.pi*x)*np.sin(np.pi*y)*np.sin(np.sqrt(2)*np.pi*c*t)
+
+def Clouds(config):
+    """
+    Clouds
+    Function to list all the clouds of the benchmark, from the smallest to the largest.
+
+    Input:
+        config                      dict            Configuration of the benchmark.
+
+    Output:
+        clouds                      list            List with (name, p, tt) for each cloud.
+    """
+
+    ## Variable initialization.
+    clouds = []                                                                     # clouds initialization.
+
+    ## Bundled regions.
+    for holes in config['holes']:                                                   # For each holes configuration.
+        for size in config['sizes']:                                                # For each size of the clouds.
+            data_path = 'Data/{}/'.format('Holes' if holes else 'Clouds')           # Path to look for the data.
+            for path in sorted(glob.glob(data_path + '{}/*_p.csv'.format(size))):   # For each of the regions.
+                region = os.path.basename(path)[:-len('_p.csv')]                    # The name of the region.
+                if config['regions'] and region not in config['regions']:           # If the region was not chosen.
+                    continue
+                p, tt = Loader.Load(data_path, size, region)                        # The cloud and its triangulation.
+                tt    = tt - 1 if tt.min() == 1 else tt                             # Triangles with zero-based indexes.
+                clouds.append(('{}/{}/{}'.format('Holes' if holes else 'Clouds', size, region), np.array(p), np.array(tt)))
+
+    ## Generated clouds.
+    for m in config['synthetic']:                                                   # For each of the generated sizes.
+        p, tt = Generator.Polygon([[0, 0], [1, 0], [1, 1], [0, 1]], m)              # A cloud on the unit square.
+        clouds.append(('Synthetic/{}'.format(m), p, tt))
+
+    clouds.sort(key = lambda cloud: len(cloud[1]))                                  # The smallest clouds go first.
+
+    return clouds
+
+def Stages(p, tt, config):
+    """
+    Stages
+    Function to prepare all the stages for a cloud. The inputs of each stage are computed here, so only the stage itself is timed.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles.
+        config                      dict            Configuration of the benchmark.
+
+    Output:
+        stages                      list            List with (name, function) for each stage that applies to the cloud.
+    """
+
+    ## Variable initialization.
+    m      = len(p[:, 0])                                                           # The total number of nodes.
+    t      = config['t']                                                            # The number of time steps.
+    T      = np.linspace(0, 1, t)                                                   # Time discretization.
+    dt     = T[1] - T[0]                                                            # dt computation.
+    cdt    = (c**2)*(dt**2)                                                         # cdt is equals to c^2 dt^2.
+    L      = np.vstack([[0], [0], [2*cdt], [0], [2*cdt]])                           # The values of the differential operator.
+    slow   = m <= config['slow_limit']                                              # If the node-by-node stages are run.
+    dense  = m <= config['dense_limit']                                             # If the dense stages are run.
+    vec    = Neighbors.Cloud(p, nvec)                                               # The neighbors of each node.
+    K      = Gammas.Cloud_Sparse(p, vec, L)                                         # The sparse Gammas.
+    exp    = (vec,) + Operators.Explicit(K)                                         # The sparse explicit operators.
+    imp    = (vec,) + Operators.Implicit(K, 0.5)                                    # The sparse implicit operators.
+    u_ap   = np.zeros([m, t])                                                       # u_ap for the error and rendering stages.
+    for k, _, u in Wave_2D.Cloud_Stream(p, f, g, t, c, cho, r, snapshots = 1, operators = exp):
+        u_ap[:, k] = u
+    u_ex   = f(p[:, 0:1], p[:, 1:2], T[None, :], c, cho, r)                         # The theoretical solution.
+    frames = np.linspace(0, t - 1, 10).astype(int)                                  # The frames of the rendering stages.
+    stages = []                                                                     # stages initialization.
+
+    ## Neighbor search.
+    for mode in [1, 2, 3]:                                                          # For each mode of the neighbor search.
+        if mode == 3 or (mode == 2 and dense) or slow:                              # Mode 1 is node by node, mode 2 is m x m.
+            stages.append(('find_distances_%d' % mode, lambda mode = mode: Neighbors.find_distances(p, mode = mode)))
+            dist = Neighbors.find_distances(p, mode = mode)
+            stages.append(('find_neighbors_%d' % mode, lambda mode = mode, dist = dist: Neighbors.find_neighbors(p, dist, nvec, mode = mode)))
+    if slow:
+        stages.append(('cloud_old', lambda: Neighbors.Cloud_old(p, nvec)))
+        stages.append(('triangulation_1', lambda: Neighbors.Triangulation(p, tt, nvec, mode = 1)))
+    stages.append(('triangulation_2', lambda: Neighbors.Triangulation(p, tt, nvec, mode = 2)))
+
+    ## Gammas.
+    if dense:
+        stages.append(('gammas', lambda: Gammas.Cloud(p, vec, L)))
+    stages.append(('gammas_sparse', lambda: Gammas.Cloud_Sparse(p, vec, L)))
+
+    ## Operators.
+    stages.append(('operators_explicit', lambda: Operators.Explicit(K)))
+    stages.append(('operators_implicit', lambda: Operators.Implicit(K, 0.5)))
+    if dense:
+        stages.append(('operators_implicit_dense', lambda: np.linalg.pinv(np.identity(m) - 0.5*K.toarray())))
+
+    ## Time stepping.
+    for name, operators in [('steps_explicit', exp), ('steps_implicit', imp)]:
+        stages.append((name, lambda operators = operators: next(Wave_2D.Cloud_Stream(p, f, g, t, c, cho, r, operators = operators))))
+    stages.append(('steps_threaded', lambda: next(Wave_2D.Cloud_Stream(p, f, g, t, c, cho, r, operators = exp, workers = config['workers']))))
+
+    ## Error.
+    stages.append(('errors', lambda: (Errors.Areas.clear(), Errors.Cloud(p, vec, u_ap, u_ex))))
+
+    ## Rendering.
+    for name, top in [('graph_3d', False), ('graph_top', True)]:
+        stages.append((name, lambda top = top: [renderer(u_ap[:, k], None, T[k]) for renderer in [Graph.Renderer(p[:, 0:2], tt, (-1.0, 1.0), top)]
+                                                 for k in frames]))
+
+    ## Stage selection.
+    if config['stages']:
+        stages = [stage for stage in stages if stage[0] in config['stages']]
+
+    return stages
+
+def Measure(function, repeat):
+    """
+    Measure
+    Function to time and memory-profile a stage.
+
+    Input:
+        function                    function        The stage.
+        repeat                      int             Number of timed repetitions.
+
+    Output:
+        seconds                     float           Best wall time of the repetitions.
+        rss_mb                      float           Growth of the peak resident set size in MB.
+    """
+
+    ## Wall time.
+    seconds = np.inf                                                                # seconds initialization.
+    for _ in range(repeat):                                                         # For each repetition.
+        start   = time.perf_counter()                                               # Start time of the stage.
+        function()
+        seconds = min(seconds, time.perf_counter() - start)                         # The best wall time is kept.
+
+    ## Peak memory, in a forked process so the peaks of the previous stages do not hide this one.
+    context        = multiprocessing.get_context('fork')
+    reader, writer = context.Pipe(duplex = False)                                   # The child sends the growth back.
+    child          = context.Process(target = Resident, args = (function, writer))
+    child.start()
+    writer.close()
+    rss_mb = reader.recv()                                                          # Growth of the peak resident set size.
+    child.join()
+
+    return seconds, rss_mb
+
+def Resident(function, writer):
+    """
+    Resident
+    Function to run a stage in the forked process and send back the growth of its peak resident set size.
+
+    Input:
+        function                    function        The stage.
+        writer                      Connection      End of the pipe where the growth is sent.
+
+    Output:
+        None
+    """
+
+    ## The forked process starts at the current resident set size of the parent.
+    start = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss                      # Peak resident set size before the stage (kB).
+    function()
+    peak  = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss                      # Peak resident set size after the stage (kB).
+    writer.send((peak - start)/2**10)
+    writer.close()
+
+def Run(config):
+    """
+    Run
+    Function to run all the stages on all the clouds.
+
+    Input:
+        config                      dict            Configuration of the benchmark.
+
+    Output:
+        results                     dict            The results of the benchmark.
+    """
+
+    ## Variable initialization.
+    config  = dict(Default, **config)                                               # Missing keys take the default values.
+    records = []                                                                    # records initialization.
+
+    ## Stages execution.
+    for name, p, tt in Clouds(config):                                              # For each of the clouds.
+        for stage, function in Stages(p, tt, config):                               # For each of the stages.
+            seconds, rss_mb = Measure(function, config['repeat'])                   # The stage is measured.
+            records.append({'cloud': name, 'nodes': len(p), 'stage': stage, 'seconds': seconds, 'rss_mb': rss_mb})
+            print('%-24s %7d  %-26s %10.4f s %10.1f MB' % (name, len(p), stage, seconds, rss_mb))
+
+    results = {'config': config, 'python': platform.python_version(), 'numpy': np.__version__, 'scipy': scipy.__version__,
+               'machine': platform.machine(), 'processor': platform.processor(), 'cpus': os.cpu_count(), 'records': records}
+
+    return results
+
+def Compare(results, baseline, config):
+    """
+    Compare
+    Function to compare the results of a benchmark against a baseline.
+
+    Input:
+        results                     dict            The results of the benchmark.
+        baseline                    dict            The baseline results.
+        config                      dict            Configuration of the benchmark.
+
+    Output:
+        regressions                 list            List with the records slower or larger than the thresholds allow.
+    """
+
+    ## Variable initialization.
+    config      = dict(Default, **config)                                           # Missing keys take the default values.
+    base        = {(record['cloud'], record['stage']): record for record in baseline['records']}
+                                                                                    # The baseline records by cloud and stage.
+    regressions = []                                                                # regressions initialization.
+
+    ## Comparison.
+    for record in results['records']:                                               # For each of the records.
+        old = base.get((record['cloud'], record['stage']))                          # The baseline record, if any.
+        if old is None:                                                             # New clouds and stages are not compared.
+            continue
+        time_ratio   = record['seconds']/max(old['seconds'], 1e-12)                 # Ratio of the wall times.
+        old_mb       = old.get('rss_mb', np.nan)                                    # Baselines with the traced memory are not compared.
+        memory_ratio = record['rss_mb']/max(old_mb, 1e-12)                          # Ratio of the peak memories.
+        slower       = time_ratio > config['time_threshold'] and record['seconds'] - old['seconds'] > config['min_seconds']
+        larger       = memory_ratio > config['memory_threshold'] and record['rss_mb'] - old_mb > 1
+        if slower or larger:                                                        # If the stage regressed.
+            regressions.append(dict(record, time_ratio = time_ratio, memory_ratio = memory_ratio))
+
+    return regressions
+
+if __name__ == '__main__':
+    ## Command line.
+    parser = argparse.ArgumentParser(description = 'Time and memory-profile the solver stages on all the regions.')
+    parser.add_argument('config', nargs = '?', default = None, help = 'JSON configuration file.')
+    parser.add_argument('--regions', nargs = '+', default = None, help = 'Regions to use.')
+    parser.add_argument('--stages', nargs = '+', default = None, help = 'Stages to run.')
+    parser.add_argument('--update-baseline', action = 'store_true', help = 'Store the results as the new baseline.')
+    args = parser.parse_args()
+
+    ## Configuration.
+    config = {}
+    if args.config is not None:
+        with open(args.config) as file:
+            config = json.load(file)                                                # The configuration file is read.
+    if args.regions is not None:
+        config['regions'] = args.regions
+    if args.stages is not None:
+        config['stages'] = args.stages
+    config = dict(Default, **config)                                                # Missing keys take the default values.
+
+    ## Run the benchmark.
+    results = Run(config)
+    Files.Atomic(config['output'], lambda file: json.dump(results, file, indent = 2), binary = False)
+
+    ## Baseline.
+    if args.update_baseline or not os.path.exists(config['baseline']):              # The first run becomes the baseline.
+        Files.Atomic(config['baseline'], lambda file: json.dump(results, file, indent = 2), binary = False)
+        print('Baseline written to %s.' % config['baseline'])
+        sys.exit(0)
+    with open(config['baseline']) as file:
+        baseline = json.load(file)                                                  # The baseline is read.
+    regressions = Compare(results, baseline, config)
+    for record in regressions:
+        print('REGRESSION %-24s %-26s time x%1.2f, memory x%1.2f' % (record['cloud'], record['stage'], record['time_ratio'], record['memory_ratio']))
+    print('%d records, %d regressions.' % (len(results['records']), len(regressions)))
+    sys.exit(1 if regressions else 0)
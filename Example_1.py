@@ -13,7 +13,7 @@ Date:
     November, 2022.
 
 Last Modification:
-    July, 2024.
+    October, 2026.
 """
 
 ## Library importation.
@@ -21,27 +21,62 @@ import os
 import glob
 import Wave_2D
 import numpy as np
-import pandas as pd
 import Scripts.Graph as Graph
+import Scripts.Loader as Loader
+import Scripts.Store as Store
 import Scripts.Errors as Errors
 
-def run_example(Holes):
-    ## Problem parameters.
-    c       = np.sqrt(1/2)                                                          # Wave coefficient.
-    cho     = 1                                                                     # Approximation Type (Boundary condition).
-    sizes   = [1, 2, 3]                                                             # Size of the clouds to use.
-    r       = np.array([0, 0])                                                      # No water drop-function.
-    t       = 2000                                                                  # Number of time-steps.
-    Save    = True                                                                  # Should I save the results?
-
-    ## Boundary conditions.
-    f = lambda x, y, t, c, cho, r: np.cos(np.pi*t)*np.sin(np.pi*(x+y))              # f = \cos{\pi t}\sin{\pi(x + y)}
-    g = lambda x, y, t, c, cho, r: -np.sin(np.pi*t)*np.sin(np.pi*(x+y))             # g = -\pi\sin{\pi t}\sin{\pi(x + y)}
+## Problem parameters.
+c       = np.sqrt(1/2)                                                              # Wave coefficient.
+cho     = 1                                                                         # Approximation Type (Boundary condition).
+sizes   = [1, 2, 3]                                                                 # Size of the clouds to use.
+r       = np.array([0, 0])                                                          # No water drop-function.
+t       = 2000                                                                      # Number of time-steps.
+Save    = True                                                                      # Should I save the results?
+History = False                                                                     # Should I save the full solution history?
+
+## Boundary conditions.
+f = lambda x, y, t, c, cho, r: np.cos(np.pi*t)*np.sin(np.pi*(x+y))                  # f = \cos{\pi t}\sin{\pi(x + y)}
+g = lambda x, y, t, c, cho, r: -np.sin(np.pi*t)*np.sin(np.pi*(x+y))                 # g = -\pi\sin{\pi t}\sin{\pi(x + y)}
 
+def run_region(Holes, cloud, reg):
     # Consolidated path construction
     data_path    = 'Data/{}/'.format('Holes' if Holes else 'Clouds')                # Path to look for the data.
     results_path = 'Results/Example 1/{}/'.format('Holes' if Holes else 'Clouds')   # Path to store the results.
 
+    print(f'Region: {reg}, with size: {cloud}')
+
+    ## Load data from the packed binary files (or from the CSV files if they are not packed)
+    p, tt = Loader.Load(data_path, cloud, reg)
+
+    ## Wave Equation in 2D computed on a unstructured cloud of points.
+    u_ap, u_ex, vec = Wave_2D.Cloud(p, f, g, t, c, cho, r, implicit = True, triangulation = False, tt = tt, lam = 0.5, sparse = True, cache = True)
+
+    ## Error computation.
+    er1 = Errors.Cloud(p, vec, u_ap, u_ex)
+    print(f'\tThe mean square error is:\t\t{er1.mean()}')
+
+    if Save:
+        folder = os.path.join(results_path, reg)
+        os.makedirs(folder, exist_ok = True)
+
+        ## Save the solution on video and graphs.
+        Graph.Cloud(p, tt, u_ap, u_ex, save = True, nom = os.path.join(folder, f'{reg}_{cloud}.mp4'))
+        Graph.Cloud_Steps(p, tt, u_ap, u_ex,nom = os.path.join(folder, f'{reg}_{cloud}'))
+
+        ## Save the solution history into a chunked, compressed store.
+        if History:
+            meta = {'example': 1, 'region': reg, 'size': cloud, 'holes': Holes, 'c': float(c), 'cho': cho, 't': t}
+            Store.Save(os.path.join(folder, f'{reg}_{cloud}_u_ap'), u_ap, np.linspace(0, 1, t), meta)
+    else:
+        Graph.Cloud(p, tt, u_ap, u_ex, save = False)
+
+    return {'nodes': len(p), 'error': float(er1.mean())}
+
+def run_example(Holes):
+    # Consolidated path construction
+    data_path    = 'Data/{}/'.format('Holes' if Holes else 'Clouds')                # Path to look for the data.
+
     ## Run the example for all the chosen regions.
     for me in sizes:
         cloud       = str(me)
@@ -51,41 +86,17 @@ def run_example(Holes):
         regions      = sorted([os.path.splitext(os.path.basename(region))[0].replace('_p', '') for region in regions_path])
 
         for reg in regions:
-            print(f'Region: {reg}, with size: {cloud}')
-            
-            ## Load data from CSV files
-            p   = pd.read_csv(f'{data_path}{cloud}/{reg}_p.csv', header = None).to_numpy()
-            tt  = pd.read_csv(f'{data_path}{cloud}/{reg}_tt.csv', header = None).to_numpy()
-            
-            ## Wave Equation in 2D computed on a unstructured cloud of points.
-            u_ap, u_ex, vec = Wave_2D.Cloud(p, f, g, t, c, cho, r, implicit = True, triangulation = False, tt = tt, lam = 0.5)
-            
-            ## Error computation.
-            er1 = Errors.Cloud(p, vec, u_ap, u_ex)
-            print(f'\tThe mean square error is:\t\t{er1.mean()}')
-            
-            if Save:
-                folder = os.path.join(results_path, reg)
-                os.makedirs(folder, exist_ok = True)
-
-                ## Save the solution on video and graphs.
-                Graph.Cloud(p, tt, u_ap, u_ex, save = True, nom = os.path.join(folder, f'{reg}_{cloud}.mp4'))
-                Graph.Cloud_Steps(p, tt, u_ap, u_ex,nom = os.path.join(folder, f'{reg}_{cloud}'))
-
-                ## Save the solution into CSV format.
-                #df_u_ap = pd.DataFrame(u_ap)
-                #df_u_ap.to_csv(os.path.join(folder, f'{reg}_{cloud}_u_ap.csv'), index = False, header = False)
-            else:
-                Graph.Cloud(p, tt, u_ap, u_ex, save = False)
-
-## Holes configurations to run several examples.
-configurations = [
-    (False),
-    (True)
-]
-
-## Run the examples.
-for Holes in configurations:
-    print(f'\nComputing numerical solution with Holes = {Holes}.')
-    run_example(Holes)
-    print("Computation completed.\n") 
\ No newline at end of file
+            run_region(Holes, cloud, reg)
+
+if __name__ == '__main__':
+    ## Holes configurations to run several examples.
+    configurations = [
+        (False),
+        (True)
+    ]
+
+    ## Run the examples.
+    for Holes in configurations:
+        print(f'\nComputing numerical solution with Holes = {Holes}.')
+        run_example(Holes)
+        print("Computation completed.\n") 
\ No newline at end of file
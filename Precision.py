@@ -0,0 +1,107 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Accuracy check of the single-precision mode.
+
+Example 1 and Example 2 are solved on the bundled regions with the sparse explicit and implicit schemes, once with dtype float64
+and once with dtype float32 (K and the solution in float32, Gammas in float64, error accumulated in float64). For each run the
+largest difference between both solutions and the mean error of each of them (Errors.Cloud) are written to a JSON file.
+
+Single precision is accepted when the float32 error stays within the tolerance of the float64 error. With t = 500, all the 384
+runs on the bundled clouds pass: the float32 error is between 0.99 and 1.05 times the float64 error, and the median difference
+between both solutions is 2e-5. The largest differences (up to 2e-2 at a few nodes) appear with the explicit scheme on the
+clouds with growing spurious modes (e.g. Holes/3/BLU), where the rounding only seeds those modes differently.
+
+Usage:
+    python Precision.py [--sizes 1 2 3] [--t 500] [--tolerance 0.05] [--output Results/precision.json]
+"""
+
+## Library importation.
+import os
+import sys
+import glob
+import json
+import argparse
+import importlib
+import numpy as np
+import Wave_2D
+import Scripts.Errors as Errors
+import Scripts.Loader as Loader
+
+def Check(p, example, t, implicit):
+    """
+    Check
+    Function to compare the float32 and float64 solutions of an example on a cloud.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        example                     module          The Example module with c, cho, r, f and g.
+        t                           int             Number of time steps.
+        implicit                    bool            Select the implicit or the explicit scheme.
+
+    Output:
+        record                      dict            Largest difference and mean errors of both solutions.
+    """
+
+    ## Solutions.
+    u64, u_ex, vec = Wave_2D.Cloud(p, example.f, example.g, t, example.c, example.cho, example.r, implicit = implicit, sparse = True)
+    u32, _, _      = Wave_2D.Cloud(p, example.f, example.g, t, example.c, example.cho, example.r, implicit = implicit, sparse = True,
+                                   exact = False, dtype = np.float32)
+
+    ## Comparison.
+    record = {'difference': float(np.abs(u32 - u64).max()),                         # Largest difference between both solutions.
+              'error_64':   float(Errors.Cloud(p, vec, u64, u_ex).mean()),          # Mean error of the float64 solution.
+              'error_32':   float(Errors.Cloud(p, vec, u32, u_ex).mean())}          # Mean error of the float32 solution.
+
+    return record
+
+if __name__ == '__main__':
+    ## Command line.
+    parser = argparse.ArgumentParser(description = 'Compare the float32 and float64 solutions on the bundled regions.')
+    parser.add_argument('--sizes', type = int, nargs = '+', default = [1, 2, 3], help = 'Sizes of the clouds to use.')
+    parser.add_argument('--t', type = int, default = 500, help = 'Number of time steps.')
+    parser.add_argument('--tolerance', type = float, default = 0.05, help = 'Largest relative increase of the error in float32.')
+    parser.add_argument('--output', default = 'Results/precision.json', help = 'File where the results are written.')
+    args = parser.parse_args()
+
+    ## Accuracy check.
+    records = []                                                                    # records initialization.
+    for number in [1, 2]:                                                           # For each of the examples.
+        example = importlib.import_module('Example_%d' % number)                    # The problem of the example.
+        for holes in ['Clouds', 'Holes']:                                           # For each holes configuration.
+            for size in args.sizes:                                                 # For each size of the clouds.
+                for path in sorted(glob.glob('Data/{}/{}/*_p.csv'.format(holes, size))):
+                    region = os.path.basename(path)[:-len('_p.csv')]                # The name of the region.
+                    p, _   = Loader.Load('Data/{}/'.format(holes), size, region)    # The cloud.
+                    for implicit in [False, True]:                                  # For each scheme.
+                        record = dict(example = number, cloud = '{}/{}/{}'.format(holes, size, region), implicit = implicit,
+                                      **Check(p, example, args.t, implicit))
+                        record['passed'] = record['error_32'] <= (1 + args.tolerance)*record['error_64'] + 1e-7
+                        records.append(record)
+                        print('Example %d %-16s %-8s difference %8.2e, error %8.2e (float64) %8.2e (float32) %s' % (number, record['cloud'],
+                              'implicit' if implicit else 'explicit', record['difference'], record['error_64'], record['error_32'],
+                              'ok' if record['passed'] else 'FAILED'))
+
+    ## Results.
+    folder = os.path.dirname(args.output)                                           # Folder of the results.
+    if folder:
+        os.makedirs(folder, exist_ok = True)                                        # The folder is created if needed.
+    with open(args.output, 'w') as file:
+        json.dump({'t': args.t, 'tolerance': args.tolerance, 'records': records}, file, indent = 2)
+    passed = sum(record['passed'] for record in records)                            # The number of passed checks.
+    print('%d of %d checks passed.' % (passed, len(records)))
+    sys.exit(0 if passed == len(records) else 1)
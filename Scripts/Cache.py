@@ -0,0 +1,209 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import glob
+import zipfile
+import hashlib
+import numpy as np
+from scipy import sparse
+import Scripts.Files as Files
+
+## Cache configuration.
+Folder  = 'Cache'                                                                   # Folder where the cached operators are stored.
+Limit   = 2**30                                                                     # Maximum size of the cache in bytes (1 GiB).
+Version = 2                                                                         # Version of the entries, raised when the operators of a key change.
+
+def Key(*arrays, **params):
+    """
+    Key
+    Function to compute the content-addressed key of a cache entry.
+
+    The key is a SHA-256 hash of the version of the cache, of the contents, shapes and types of the given arrays and of the values
+    of the given parameters.
+    
+    Input:
+        arrays                      ndarray         Arrays that define the entry (None is allowed).
+        params                      any             Named parameters that define the entry.
+    
+    Output:
+        key                         string          Hexadecimal key of the entry.
+    """
+
+    ## Hash computation.
+    h = hashlib.sha256()                                                            # The hash is initialized.
+    h.update(('version=%d;' % Version).encode())                                    # Entries of older versions are not reused.
+    for a in arrays:                                                                # For each of the arrays.
+        if a is None:                                                               # Missing arrays are also hashed.
+            h.update(b'None;')                                                      # A marker for the missing array.
+            continue
+        a = np.ascontiguousarray(a)                                                 # The array is stored contiguously.
+        h.update(('%s%s;' % (a.dtype.str, a.shape)).encode())                       # The type and shape of the array.
+        h.update(a.tobytes())                                                       # The contents of the array.
+    for name in sorted(params):                                                     # For each of the parameters.
+        h.update(('%s=%r;' % (name, np.asarray(params[name]).tolist())).encode())   # The name and value of the parameter.
+    key = h.hexdigest()                                                             # The hexadecimal key.
+
+    return key
+
+def Load(key, folder = None):
+    """
+    Load
+    Function to load a cache entry. The entry is marked as recently used.
+    
+    Input:
+        key                         string          Key of the entry, as computed by Key.
+        folder                      string          Folder of the cache (Default: Cache.Folder).
+    
+    Output:
+        data                        dict            Arrays and sparse matrices of the entry (None if the entry does not exist).
+    """
+
+    ## Variable initialization.
+    path = os.path.join(folder or Folder, key + '.npz')                             # The file of the entry.
+    if not os.path.exists(path):                                                    # If the entry does not exist.
+        return None
+
+    ## Entry loading.
+    try:
+        with np.load(path) as z:                                                    # The compressed file is opened.
+            data = Unpack(dict(z))                                                  # The arrays are loaded.
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):                     # A damaged entry is discarded.
+        os.remove(path)
+        return None
+    os.utime(path)                                                                  # The entry is marked as recently used.
+
+    return data
+
+def Save(key, folder = None, limit = None, **data):
+    """
+    Save
+    Function to save a cache entry in a compressed binary file, and evict the least recently used entries.
+
+    The file is written under a temporary name and then renamed, so concurrent runs never read a partial entry.
+    
+    Input:
+        key                         string          Key of the entry, as computed by Key.
+        folder                      string          Folder of the cache (Default: Cache.Folder).
+        limit                       int             Maximum size of the cache in bytes (Default: Cache.Limit).
+        data                        ndarray         Arrays and sparse matrices to be stored.
+    
+    Output:
+        None
+    """
+
+    ## Variable initialization.
+    folder = folder or Folder                                                       # The folder of the cache.
+    path   = os.path.join(folder, key + '.npz')                                     # The file of the entry.
+
+    ## Entry saving.
+    Files.Atomic(path, lambda file: np.savez_compressed(file, **Pack(data)))        # The entry is published atomically.
+
+    ## Eviction.
+    Evict(folder, Limit if limit is None else limit)                                # The size of the cache is bounded.
+
+def Evict(folder = None, limit = None):
+    """
+    Evict
+    Function to remove the least recently used entries until the size of the cache is under the limit.
+    The most recently used entry is always kept.
+    
+    Input:
+        folder                      string          Folder of the cache (Default: Cache.Folder).
+        limit                       int             Maximum size of the cache in bytes (Default: Cache.Limit).
+    
+    Output:
+        None
+    """
+
+    ## Variable initialization.
+    limit = Limit if limit is None else limit                                       # The maximum size of the cache.
+    files = []                                                                      # The entries of the cache.
+    for path in glob.glob(os.path.join(folder or Folder, '*.npz')):                 # For each of the entries.
+        try:
+            st = os.stat(path)                                                      # The size and last use of the entry.
+        except OSError:                                                             # The entry was removed by another run.
+            continue
+        files.append((st.st_mtime, st.st_size, path))                               # The entry is listed.
+    files.sort()                                                                    # Entries sorted from the least recently used.
+    total = sum(size for _, size, _ in files)                                       # The total size of the cache.
+
+    ## Eviction.
+    for _, size, path in files[:-1]:                                                # For each entry, except the most recent one.
+        if total <= limit:                                                          # If the cache is under the limit.
+            break
+        try:
+            os.remove(path)                                                         # The entry is removed.
+        except OSError:                                                             # The entry was removed by another run.
+            pass
+        total -= size                                                               # The size of the cache is updated.
+
+def Pack(data):
+    """
+    Pack
+    Function to split the sparse matrices of an entry into plain arrays.
+    
+    Input:
+        data                        dict            Arrays and sparse matrices.
+    
+    Output:
+        packed                      dict            Plain arrays.
+    """
+
+    ## Variable initialization.
+    packed = {}                                                                     # packed initialization.
+
+    ## Arrays and sparse matrices.
+    for name, value in data.items():                                                # For each of the values.
+        if sparse.issparse(value):                                                  # For a sparse matrix.
+            value = sparse.csr_matrix(value)                                        # The matrix is stored in CSR format.
+            packed[name + '__data']    = value.data                                 # The nonzero values.
+            packed[name + '__indices'] = value.indices                              # The column indices.
+            packed[name + '__indptr']  = value.indptr                               # The row pointers.
+            packed[name + '__shape']   = np.array(value.shape)                      # The shape of the matrix.
+        else:                                                                       # For an array.
+            packed[name] = np.asarray(value)                                        # The array is stored as it is.
+
+    return packed
+
+def Unpack(packed):
+    """
+    Unpack
+    Function to rebuild the sparse matrices of an entry from plain arrays.
+    
+    Input:
+        packed                      dict            Plain arrays, as returned by Pack.
+    
+    Output:
+        data                        dict            Arrays and sparse matrices.
+    """
+
+    ## Variable initialization.
+    data = {}                                                                       # data initialization.
+
+    ## Arrays and sparse matrices.
+    for name, value in packed.items():                                              # For each of the arrays.
+        if name.endswith('__shape'):                                                # For a sparse matrix.
+            base = name[:-len('__shape')]                                           # The name of the matrix.
+            data[base] = sparse.csr_matrix((packed[base + '__data'], packed[base + '__indices'], packed[base + '__indptr']), shape = tuple(value))
+                                                                                    # The matrix is rebuilt in CSR format.
+        elif '__' not in name:                                                      # For an array.
+            data[name] = value                                                      # The array is used as it is.
+
+    return data
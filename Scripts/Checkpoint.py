@@ -0,0 +1,192 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Checkpoints of long time integrations.
+
+A checkpoint holds the minimal state needed to continue a run: the two latest time levels, the index of the last one, the
+warm-start history of the Krylov solvers (if any), the parameters of the run, the key of the cloud and the parameters, and the
+key of the cached operators. Every other quantity of the time steps is rebuilt from these, so a resumed run gives exactly the
+same values as an uninterrupted one. The file is replaced atomically, so a run killed while writing keeps the previous one.
+"""
+
+## Library importation.
+import os
+import json
+import time
+import zipfile
+import numpy as np
+import Scripts.Cache as Cache
+import Scripts.Files as Files
+import Scripts.Operators as Operators
+
+class Checkpoint:
+    """
+    Checkpoint
+    Class to write the restart state of a run periodically, and to read it back.
+
+    Input:
+        path                        string          File of the checkpoint (a .npz file).
+        every                       int             Number of time steps between checkpoints (Default: None).
+        seconds                     float           Wall time between checkpoints (Default: 600).
+                                                        A checkpoint is written when any of both is reached.
+        resume                      bool            Select whether or not an existing checkpoint of the same run is continued.
+                                                        True: The run continues from the checkpoint, if there is one.
+                                                        False: The run starts from the beginning and replaces it (Default).
+    """
+
+    def __init__(self, path, every = None, seconds = 600.0, resume = False):
+        ## Variable initialization.
+        self.path      = path                                                       # File of the checkpoint.
+        self.every     = every                                                      # Time steps between checkpoints.
+        self.seconds   = seconds                                                    # Wall time between checkpoints.
+        self.resume    = resume                                                     # If an existing checkpoint is continued.
+        self.key       = None                                                       # Key of the cloud and the parameters.
+        self.params    = {}                                                         # Parameters of the run.
+        self.reference = None                                                       # Key of the cached operators, if any.
+        self.operators = None                                                       # The operators, for the Krylov history.
+        self.start     = 0                                                          # Time level where the run was resumed.
+        self.last      = time.perf_counter()                                        # Time of the last checkpoint.
+
+    def __call__(self, k, up, u):
+        """
+        __call__
+        Function called by the time integration engines after each time step. The checkpoint is written when it is due.
+
+        Input:
+            k                       int             Index of the new time level.
+            up          m (x n)     ndarray         Previous time level.
+            u           m (x n)     ndarray         New time level.
+        """
+
+        if (self.every is not None and k%self.every == 0) or (self.seconds is not None and time.perf_counter() - self.last >= self.seconds):
+                                                                                    # If a checkpoint is due.
+            self.save(k, up, u)
+
+    def save(self, k, up, u):
+        """
+        save
+        Function to write the checkpoint.
+
+        Input:
+            k, up, u                                Same as in __call__.
+        """
+
+        ## Restart state.
+        data = {'k': np.array(k), 'up': up, 'u': u, 'key': np.array(self.key), 'reference': np.array(self.reference or ''),
+                'params': np.array(json.dumps(self.params))}                        # The time levels and the run.
+        for i, K in enumerate(self.operators or []):                                # For each of the operators.
+            if isinstance(K, Operators.Krylov):                                     # The warm start of the Krylov solves.
+                data['history%d' % i] = np.array(K.history).reshape(len(K.history), *np.shape(u))
+
+        ## Checkpoint writing.
+        Files.Atomic(self.path, lambda file: np.savez(file, **data))                # The checkpoint is replaced atomically.
+        self.last = time.perf_counter()                                             # The time of the checkpoint.
+
+    def load(self):
+        """
+        load
+        Function to read the checkpoint of the run, if it is to be continued.
+
+        The Krylov history is restored in the operators. A checkpoint of another run (other cloud or parameters) is an error.
+
+        Output:
+            state                   tuple           k, up and u of the checkpoint (None if there is nothing to continue).
+        """
+
+        ## Checkpoint reading.
+        data = Load(self.path) if self.resume else None                             # The checkpoint, if any.
+        if data is None:                                                            # The run starts from the beginning.
+            return None
+        if str(data['key']) != self.key:                                            # A checkpoint of another run is not overwritten.
+            raise ValueError("The checkpoint '%s' belongs to another run (cloud or parameters)." % self.path)
+
+        ## Restart state.
+        for i, K in enumerate(self.operators or []):                                # For each of the operators.
+            if isinstance(K, Operators.Krylov) and 'history%d' % i in data:         # The warm start of the Krylov solves.
+                K.history = list(data['history%d' % i])
+        self.start = int(data['k'])                                                 # The time level of the checkpoint.
+
+        return self.start, data['up'], data['u']
+
+def Open(options, p, tt = None, params = None, settings = None):
+    """
+    Open
+    Function to prepare the checkpoints of a run.
+
+    Input:
+        options                     dict            Options of the checkpoints (path, every, seconds, resume), see Checkpoint.
+                                                        A Checkpoint is returned as it is, and None means no checkpoints.
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the triangulation indexes (Default: None).
+        params                      dict            Parameters that change the solution, they are part of the key.
+        settings                    dict            Parameters that do not change the solution (cache, workers). They are saved
+                                                        with the frequency of the checkpoints, so Resume can repeat the run.
+
+    Output:
+        checkpoint                  Checkpoint      The checkpoints of the run (None if there are no checkpoints).
+    """
+
+    if options is None or isinstance(options, Checkpoint):                          # Nothing to prepare.
+        return options
+    checkpoint        = Checkpoint(**options)                                       # The checkpoints of the run.
+    params            = json.loads(json.dumps(params, default = lambda x: np.asarray(x).tolist()))
+                                                                                    # The parameters as they are saved.
+    checkpoint.key    = Cache.Key(p, tt, **params)                                  # The key of the cloud and the parameters.
+    checkpoint.params = dict(params, every = checkpoint.every, seconds = checkpoint.seconds, **(settings or {}))
+                                                                                    # All the parameters of the run.
+
+    return checkpoint
+
+def Load(path):
+    """
+    Load
+    Function to read a checkpoint file.
+
+    Input:
+        path                        string          File of the checkpoint.
+
+    Output:
+        data                        dict            Arrays of the checkpoint (None if there is no checkpoint).
+    """
+
+    if not os.path.exists(path):                                                    # If there is no checkpoint.
+        return None
+    try:
+        with np.load(path) as z:
+            data = dict(z)                                                          # The arrays are loaded.
+    except (OSError, ValueError, EOFError, zipfile.BadZipFile):                     # A damaged file is not a checkpoint.
+        return None
+
+    return data
+
+def Parameters(path):
+    """
+    Parameters
+    Function to read the parameters of the run of a checkpoint.
+
+    Input:
+        path                        string          File of the checkpoint.
+
+    Output:
+        params                      dict            Parameters of the run, as given to Open.
+    """
+
+    data = Load(path)                                                               # The checkpoint.
+    if data is None:
+        raise FileNotFoundError("There is no checkpoint '%s'." % path)
+
+    return json.loads(str(data['params']))
@@ -0,0 +1,85 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import numpy as np
+
+def Evaluate(f, x, y, T, c, cho, r):
+    """
+    Evaluate
+    Function to evaluate a boundary or initial condition over a whole grid of nodes and time levels in one call.
+
+    The condition can be given in two ways:
+        A function f(x, y, t, c, cho, r) that supports numpy broadcasting. It is called once with x, y as columns and t as a row.
+        A separable pair (fs, ft), with f(x, y, t) = fs(x, y, c, cho, r)*ft(t, c, cho, r). Each factor is computed once and
+        the grid is their outer product.
+    
+    Input:
+        f                           function/tuple  Function declared with the condition, or a separable pair (fs, ft).
+        x           n x 1           ndarray         Array with the x coordinates of the nodes.
+        y           n x 1           ndarray         Array with the y coordinates of the nodes.
+        T           s x 1           ndarray         Array with the time levels.
+        c                           float           Wave propagation velocity.
+        cho                         int             Approximation Type.
+        r           1 x 2           ndarray         Coordinates of the water drop-like function.
+    
+    Output:
+        F           n x s           ndarray         Array with the condition on each node and time level.
+    """
+
+    ## Variable initialization.
+    x = np.asarray(x)                                                               # The x coordinates as an array.
+    y = np.asarray(y)                                                               # The y coordinates as an array.
+    T = np.atleast_1d(T)                                                            # The time levels as an array.
+    n = len(x)                                                                      # The number of nodes.
+    s = len(T)                                                                      # The number of time levels.
+
+    ## Condition evaluation.
+    if isinstance(f, tuple):                                                        # For a separable condition.
+        fs, ft = f                                                                  # The spatial and temporal factors.
+        Fs = np.broadcast_to(fs(x, y, c, cho, r), (n,))                             # The spatial profile is computed once.
+        Ft = np.broadcast_to(ft(T, c, cho, r), (s,))                                # The temporal factor is computed once.
+        F  = np.multiply.outer(Fs, Ft)                                              # The grid is the outer product of both factors.
+    else:                                                                           # For a general condition.
+        F  = f(x[:, None], y[:, None], T[None, :], c, cho, r)                       # One broadcast call over the whole grid.
+        F  = np.zeros([n, s]) + F                                                   # Scalar or partial results are expanded to the grid.
+    
+    return F
+
+def Stream(f, x, y, T, c, cho, r, block = 256, start = 0):
+    """
+    Stream
+    Function to evaluate a condition time level by time level, computing it in blocks of time levels.
+
+    Each block is evaluated with a single call to Evaluate, so the memory grows with n*block instead of n*s.
+    
+    Input:
+        f, x, y, T, c, cho, r                       Same as in Evaluate.
+        block                       int             Number of time levels computed on each call (Default: 256).
+        start                       int             First time level to be yielded (Default: 0).
+                                                        The blocks are the same as from 0, so the values do not change.
+    
+    Output (yielded for each time level):
+        F           n x 1           ndarray         Array with the condition on each node at the time level.
+    """
+
+    ## Condition evaluation.
+    for k in np.arange(start - start%block, len(T), block):                         # For each block of time levels.
+        F = Evaluate(f, x, y, T[k:k + block], c, cho, r)                            # The condition over the block.
+        for j in np.arange(max(start - k, 0), F.shape[1]):                          # For each time level in the block.
+            yield F[:, j]                                                           # The condition at the time level.
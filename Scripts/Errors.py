@@ -13,11 +13,15 @@ Date:
     November, 2022.
 
 Last Modification:
-    March, 2024.
+    October, 2026.
 """
 ## Library importation.
+import hashlib
 import numpy as np
 
+## Areas already computed for each cloud.
+Areas = {}
+
 def PolyArea(x,y):
     """
     PolyArea
@@ -34,17 +38,22 @@ def PolyArea(x,y):
     area = 0.5*np.abs(np.dot(x, np.roll(y, 1)) - np.dot(y, np.roll(x, 1)))          # Compute the area of the element.
     return area
 
-def Cloud(p, vec, u_ap, u_ex):
+def Cloud(p, vec, u_ap, u_ex, block = 256, dtype = np.float64):
     """
     Cloud
     Function to compute the error in a triangulation or an unstructured cloud of points for a problem that depends on time.
     The polygon used to calculate the area is the one defined by all the immediate neighbors of the central node.
+    The error of a whole block of time steps is reduced with a single matrix product, so memory-mapped inputs are read blockwise.
     
     Input:
         p           m x 2           Array           Array with the coordinates of the nodes.
         vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
         u_ap        m x t           Array           Array with the computed solution.
         u_ex        m x t           Array           Array with the theoretical solution.
+        block                       Integer         Number of time steps reduced at once (Default: 256).
+        dtype                       type            Type in which the error is accumulated.
+                                                        float64: Single-precision solutions are accumulated in double precision (Default).
+                                                        None: The type of the inputs.
     
     Output:
         er          t x 1           Array           Mean square error computed on each time step.
@@ -53,21 +62,82 @@ def Cloud(p, vec, u_ap, u_ex):
     ## Variable initialization.
     m, t = p.shape[0], u_ap.shape[1]                                                # The size of the region.
     er   = np.zeros(t)                                                              # er initialization with zeros.
-    area = np.zeros(m)                                                              # area initialization with zeros.
-
-    ## Area computation for each node.
-    for i in np.arange(m):
-        nvec     = sum(vec[i,:] != -1)                                              # The number of neighbors of the central node.
-        polix    = np.zeros([nvec])                                                 # The x-values of the polygon are stored.
-        poliy    = np.zeros([nvec])                                                 # The y-values of the polygon are stored.
-        nindex   = vec[i, :nvec].astype(int)                                        # Indices of the neighbors.
-        polix[:] = p[nindex, 0]                                                     # The x coordinate of the node is stored.
-        poliy[:] = p[nindex, 1]                                                     # The y coordinate of the node is stored.
-        area[i]  = PolyArea(polix, poliy)                                           # Area computation.
+    area = Area(p, vec)                                                             # The area associated to each node.
 
     ## Error computation.
-    for k in np.arange(t):                                                          # For each time step.
-        err   = np.square(u_ap[:, k] - u_ex[:, k])*area                             # Mean square error computation.
-        er[k] = np.sqrt(np.mean(err))                                               # The square root is computed.
+    for k in np.arange(0, t, block):                                                # For each block of time steps.
+        err = np.square(np.subtract(u_ap[:, k:k + block], u_ex[:, k:k + block], dtype = dtype))
+                                                                                    # Square error of the block.
+        er[k:k + block] = np.sqrt((area.astype(err.dtype, copy = False)@err)/m)     # Area-weighted mean and square root.
+    
+    return er
+
+def Area(p, vec, cache = True):
+    """
+    Area
+    Function to compute the area associated to each node of a triangulation or an unstructured cloud of points.
+    The polygon used to calculate the area is the one defined by all the immediate neighbors of the central node.
+    The shoelace formula is applied to all the nodes at once, masking the missing neighbors of the padded vec array.
+    
+    Input:
+        p           m x 2           Array           Array with the coordinates of the nodes.
+        vec         m x nvec        Array           Array with the correspondence of the nvec neighbors of each node.
+        cache                       Bool            Reuse the areas already computed for the same cloud.
+                                                        True: Areas are cached (Default).
+                                                        False: Areas are always computed.
+    
+    Output:
+        area        m x 1           Array           Area associated to each node.
+    """
+
+    ## Cached areas.
+    if cache == True:                                                               # If the cache is used.
+        key = hashlib.sha1(np.ascontiguousarray(p[:, 0:2]).tobytes() + np.ascontiguousarray(vec).tobytes()).hexdigest()
+                                                                                    # The key identifies the cloud and its neighbors.
+        if key in Areas:                                                            # If the areas were already computed.
+            return Areas[key]                                                       # The cached areas are returned.
+
+    ## Variable initialization.
+    vec  = np.asarray(vec).astype(int)                                              # Indices of the neighbors.
+    mask = vec != -1                                                                # Mask with the existing neighbors.
+    nvec = mask.sum(axis = 1)                                                       # The number of neighbors of each node.
+    j    = np.arange(vec.shape[1])[None, :]                                         # Position of each neighbor in the polygon.
+    prev = np.where(j == 0, nvec[:, None] - 1, j - 1)                               # The previous vertex of the polygon (rolled by one).
+    prev = np.maximum(prev, 0)                                                      # Nodes without neighbors point to the first column.
+
+    ## Area computation for all the nodes.
+    polix = np.where(mask, p[vec, 0], 0)                                            # The x-values of the polygons are stored.
+    poliy = np.where(mask, p[vec, 1], 0)                                            # The y-values of the polygons are stored.
+    rollx = np.take_along_axis(polix, prev, axis = 1)                               # The x-values rolled by one.
+    rolly = np.take_along_axis(poliy, prev, axis = 1)                               # The y-values rolled by one.
+    area  = 0.5*np.abs(np.sum(polix*rolly, axis = 1) - np.sum(poliy*rollx, axis = 1))
+                                                                                    # Area computation.
+
+    ## Cache update.
+    if cache == True:                                                               # If the cache is used.
+        if len(Areas) >= 64:                                                        # If the cache is full.
+            Areas.pop(next(iter(Areas)))                                            # The oldest cloud is discarded.
+        Areas[key] = area                                                           # The areas are saved.
+
+    return area
+
+def Level(u_ap, u_ex, area, dtype = np.float64):
+    """
+    Level
+    Function to compute the error at a single time level.
     
+    Input:
+        u_ap        m x 1           Array           Array with the computed solution at the time level.
+        u_ex        m x 1           Array           Array with the theoretical solution at the time level.
+        area        m x 1           Array           Area associated to each node.
+        dtype                       type            Type in which the error is accumulated, as in Cloud (Default: float64).
+    
+    Output:
+        er                          Float           Mean square error at the time level.
+    """
+
+    ## Error computation.
+    err = np.square(np.subtract(u_ap, u_ex, dtype = dtype))*area                    # Mean square error computation.
+    er  = np.sqrt(np.mean(err))                                                     # The square root is computed.
+
     return er
\ No newline at end of file
@@ -0,0 +1,68 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Atomic writing of files.
+
+Every file that other runs read back (cached operators, checkpoints, stores, binary clouds, manifests and benchmark results) is
+written under a temporary name, flushed to the disk and then renamed. A run killed at any moment leaves either the complete new
+file or the previous one, never a truncated file under the final name.
+"""
+
+## Library importation.
+import os
+
+def Atomic(path, writer, binary = True):
+    """
+    Atomic
+    Function to write a file atomically.
+
+    Input:
+        path                        string          Name of the file.
+        writer                      function        Function called as writer(file) to write the contents to the open file.
+        binary                      bool            Select the mode of the file.
+                                                        True: Binary file (Default).
+                                                        False: Text file.
+
+    Output:
+        None
+    """
+
+    ## Variable initialization.
+    folder = os.path.dirname(path)                                                  # Folder of the file.
+    temp   = '%s.%d.tmp' % (path, os.getpid())                                      # Temporary file for the atomic write.
+    if folder:
+        os.makedirs(folder, exist_ok = True)                                        # The folder is created if needed.
+
+    ## Atomic writing.
+    try:
+        with open(temp, 'wb' if binary else 'w') as file:
+            writer(file)                                                            # The contents are written.
+            file.flush()
+            os.fsync(file.fileno())                                                 # The contents reach the disk before the rename.
+        os.replace(temp, path)                                                      # The file is published atomically.
+    except BaseException:
+        if os.path.exists(temp):                                                    # The incomplete file is removed.
+            os.remove(temp)
+        raise
+
+    ## Folder synchronization.
+    if hasattr(os, 'O_DIRECTORY'):                                                  # The rename itself reaches the disk (POSIX only).
+        fd = os.open(folder or '.', os.O_RDONLY | os.O_DIRECTORY)
+        try:
+            os.fsync(fd)
+        finally:
+            os.close(fd)
@@ -13,13 +13,14 @@ Date:
     November, 2022.
 
 Last Modification:
-    March, 2024.
+    October, 2026.
 """
 
 ## Library importation.
 import numpy as np
+from scipy import sparse
 
-def Cloud(p, vec, L):
+def Cloud(p, vec, L, dtype = np.float64):
     """
     2D Clouds of Points Gammas Computation.
      
@@ -29,6 +30,8 @@ def Cloud(p, vec, L):
         p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
         vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
         L           5 x 1           Array           Array with the values of the differential operator.
+        dtype                       type            Type in which K is stored (Default: float64).
+                                                        The pseudoinverses are always computed in float64.
      
      Output:
         K           m x m           Array           K Matrix with the computed Gammas.
@@ -37,7 +40,7 @@ def Cloud(p, vec, L):
     ## Variable initialization.
     nvec  = len(vec[0,:])                                                           # The maximum number of neighbors.
     m     = len(p[:,0])                                                             # The total number of nodes.
-    K     = np.zeros([m,m])                                                         # K initialization with zeros.
+    K     = np.zeros([m,m], dtype = dtype)                                          # K initialization with zeros.
     
     ## Gammas computation and Matrix assembly.
     for i in np.arange(m):                                                          # For each of the nodes.
@@ -61,4 +64,48 @@ def Cloud(p, vec, L):
             K[i,i] = 0                                                              # Central node weight is equal to 0.
             for j in np.arange(nvec):                                               # For each of the neighbor nodes.
                 K[i, vec[i,j]] = 0                                                  # Neighbor node weight is equal to 0.
+    return K
+
+def Cloud_Sparse(p, vec, L, dtype = np.float64):
+    """
+    2D Clouds of Points Gammas Computation (Sparse).
+     
+    This function computes the Gamma values for clouds of points, and assemble the K matrix for the computations in sparse format.
+    The local systems of all the inner nodes are stacked into a single n x 5 x nvec array and solved in one batched call.
+    Missing neighbors (marked with -1) give zero columns in M, so their Gammas are zero and the result matches Gammas.Cloud.
+     
+    Input:
+        p           m x 3           Array           Array with the coordinates of the nodes and a flag for the boundary.
+        vec         m x nvec        Array           Array with the correspondence of the 'nvec' neighbors of each node.
+        L           5 x 1           Array           Array with the values of the differential operator.
+        dtype                       type            Type in which K is stored (Default: float64).
+                                                        The pseudoinverses are always computed in float64.
+     
+     Output:
+        K           m x m           csr_matrix      Sparse K Matrix with the computed Gammas.
+    """
+    
+    ## Variable initialization.
+    m     = len(p[:,0])                                                             # The total number of nodes.
+    nvec  = len(vec[0,:])                                                           # The maximum number of neighbors.
+    inne  = np.flatnonzero(p[:,2] == 0)                                             # Indices of the inner nodes.
+    mask  = vec[inne, :] != -1                                                      # Mask with the existing neighbors.
+    nbr   = np.where(mask, vec[inne, :], inne[:, None]).astype(int)                 # Missing neighbors point to the central node.
+
+    ## Local systems assembly.
+    dx    = p[nbr, 0] - p[inne, 0][:, None]                                         # dx is computed for all the stencils.
+    dy    = p[nbr, 1] - p[inne, 1][:, None]                                         # dy is computed for all the stencils.
+    M     = np.stack([dx, dy, dx**2, dx*dy, dy**2], axis = 1)                       # M matrices are stacked in a n x 5 x nvec array.
+
+    ## Gammas computation.
+    M     = np.linalg.pinv(M)                                                       # The pseudoinverse of all the matrices at once.
+    YY    = (M@np.asarray(L, dtype = float).reshape(5))*mask                        # M*L computation for all the nodes.
+    Gamma = np.hstack([-YY.sum(axis = 1, keepdims = True), YY])                     # Gamma values are found.
+
+    ## Sparse matrix assembly.
+    rows  = np.repeat(inne, nvec + 1)                                               # Row index for each Gamma.
+    cols  = np.hstack([inne[:, None], nbr]).ravel()                                 # Column index for each Gamma.
+    K     = sparse.csr_matrix((Gamma.ravel(), (rows, cols)), shape = (m, m))        # K assembly (repeated entries are summed).
+    K     = K.astype(dtype, copy = False)                                           # K is stored in the requested type.
+    K.eliminate_zeros()                                                             # Remove the padded entries.
     return K
\ No newline at end of file
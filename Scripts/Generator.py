@@ -0,0 +1,351 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Generator of large clouds of points.
+
+The boundary of a bundled region (the edges of its triangulation that belong to a single triangle) or a polygon is resampled
+with the spacing of the cloud, and the interior is filled with a jittered square lattice. The spacing is adjusted until the
+cloud has the requested number of nodes, and circular holes can be cut from the domain. The clouds are written with the p/tt
+layout of the bundled regions, so they can be loaded with Loader.Load. With the same seed, the same cloud is generated.
+
+The explicit scheme is only bounded on the generated clouds up to about 10^4 nodes. The stencils next to the boundary are not
+symmetric, so the GFD Laplacian has eigenvalues off the negative real axis, and their growth over a run increases as the spacing
+decreases (with the time step of Wave_2D.Stable, ENG grows by 3 x 10^3 at 2 x 10^4 nodes and by 7 x 10^9 at 5 x 10^4 nodes).
+The larger clouds are solved with the implicit scheme, which t = None selects by itself (see Wave_2D.Stable).
+
+Usage:
+    python -m Scripts.Generator --region Data/Clouds/3/ENG --nodes 100000 [--holes x y r ...] [--seed 0] [--output Data/Large]
+    python -m Scripts.Generator --polygon 0 0 1 0 1 1 0 1 --name SQU --nodes 100000 [--output Data/Large]
+
+The cloud is written as {output}/{nodes}/{name}_p.csv and {name}_tt.csv (and the .npy files read by Loader.Load).
+"""
+
+## Library importation.
+import os
+import argparse
+import numpy as np
+from matplotlib.path import Path
+from matplotlib.tri import Triangulation
+from scipy.spatial import Delaunay, cKDTree
+import Scripts.Loader as Loader
+
+def Region(p, tt, m, holes = None, seed = 0):
+    """
+    Region
+    Function to fill a bundled region with a cloud of about m nodes.
+
+    Input:
+        p           k x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles.
+        m                           int             Approximate number of nodes of the new cloud.
+        holes       h x 3           ndarray         Circular holes (x, y, radius) cut from the region (Default: None).
+        seed                        int             Seed of the random jitter (Default: 0).
+
+    Output:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles.
+    """
+
+    ## Variable initialization.
+    p      = np.asarray(p)                                                          # The nodes of the region.
+    tt     = np.asarray(tt, dtype = int)                                            # The triangles of the region.
+    tt     = tt - 1 if tt.min() == 1 else tt                                        # Triangles with zero-based indexes.
+    finder = Triangulation(p[:, 0], p[:, 1], tt).get_trifinder()                    # Search of the triangle of a point.
+
+    ## Boundary loops.
+    edges         = np.sort(tt[:, [0, 1, 1, 2, 2, 0]].reshape(-1, 2), axis = 1)     # The edges of all the triangles.
+    edges, counts = np.unique(edges, axis = 0, return_counts = True)                # Each edge and the number of its triangles.
+    edges         = edges[counts == 1]                                              # The boundary edges have a single triangle.
+    adjacent      = {}                                                              # The two boundary neighbors of each boundary node.
+    for i, j in edges:
+        adjacent.setdefault(i, []).append(j)
+        adjacent.setdefault(j, []).append(i)
+    loops, seen = [], set()                                                         # loops initialization.
+    for start in adjacent:                                                          # For each boundary node not yet visited.
+        if start in seen:
+            continue
+        loop, prev, node = [start], None, start
+        seen.add(start)
+        while True:                                                                 # The loop is walked until it closes.
+            node, prev = next((j for j in adjacent[node] if j != prev), start), node
+            if node in seen:
+                break
+            loop.append(node)
+            seen.add(node)
+        flags = np.where((p[loop, 2] == 2) & (p[np.roll(loop, -1), 2] == 2), 2, 1)  # The edges of the holes keep their flag.
+        loops.append(np.column_stack([p[loop, 0:2], flags]))
+
+    return Fill(loops, lambda x, y: finder(x, y) >= 0, m, holes, seed)
+
+def Polygon(vertices, m, holes = None, seed = 0):
+    """
+    Polygon
+    Function to fill a polygon with a cloud of about m nodes.
+
+    Input:
+        vertices    k x 2           ndarray         Vertices of the polygon, in order.
+        m                           int             Approximate number of nodes of the new cloud.
+        holes       h x 3           ndarray         Circular holes (x, y, radius) cut from the polygon (Default: None).
+        seed                        int             Seed of the random jitter (Default: 0).
+
+    Output:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles.
+    """
+
+    ## Variable initialization.
+    vertices = np.asarray(vertices, dtype = float)                                  # The vertices of the polygon.
+    path     = Path(vertices)                                                       # The polygon, for the inside test.
+    loops    = [np.column_stack([vertices, np.ones(len(vertices))])]                # The boundary loop (x, y, flag).
+
+    return Fill(loops, lambda x, y: path.contains_points(np.column_stack([x, y])), m, holes, seed)
+
+def Fill(loops, inside, m, holes = None, seed = 0):
+    """
+    Fill
+    Function to build a cloud of about m nodes from the boundary loops of a domain and its inside test.
+
+    The spacing h starts from the area of the bounding box and it is corrected a few times with the number of nodes obtained,
+    since the number of nodes grows as 1/h^2.
+
+    Input:
+        loops                       list            Boundary loops of the domain, each one a k x 3 ndarray with its vertices in
+                                                        order and the flag of the edge that starts at each vertex.
+        inside                      function        Function that tells if the points (x, y) are inside the domain.
+        m                           int             Approximate number of nodes of the new cloud.
+        holes       h x 3           ndarray         Circular holes (x, y, radius) cut from the domain (Default: None).
+        seed                        int             Seed of the random jitter (Default: 0).
+
+    Output:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles.
+    """
+
+    ## Variable initialization.
+    holes = np.zeros([0, 3]) if holes is None else np.asarray(holes, dtype = float).reshape(-1, 3)
+                                                                                    # The circular holes.
+    lo    = np.min([loop[:, 0:2].min(axis = 0) for loop in loops], axis = 0)        # Lower corner of the bounding box.
+    hi    = np.max([loop[:, 0:2].max(axis = 0) for loop in loops], axis = 0)        # Upper corner of the bounding box.
+    h     = np.sqrt(np.prod(hi - lo)/m)                                             # First guess of the spacing.
+
+    ## Spacing adjustment.
+    for _ in range(4):                                                              # The count converges in a few corrections.
+        p = Sample(loops, inside, holes, lo, hi, h, seed)                           # The cloud with the spacing h.
+        if abs(len(p) - m) <= 0.005*m:                                              # Close enough to the requested size.
+            break
+        h = h*np.sqrt(len(p)/m)                                                     # The spacing is corrected.
+
+    ## Triangulation.
+    tt = Delaunay(p[:, 0:2]).simplices                                              # Delaunay triangulation of the convex hull.
+    c  = p[tt, 0:2].mean(axis = 1)                                                  # The centroid of each triangle.
+    tt = tt[Domain(c[:, 0], c[:, 1], inside, holes)]                                # Only the triangles inside the domain remain.
+
+    return p, tt
+
+def Sample(loops, inside, holes, lo, hi, h, seed = 0):
+    """
+    Sample
+    Function to sample the boundary and the interior of a domain with the spacing h.
+
+    The interior is a square lattice with a small jitter, so each inner node has its 8 neighbors in two symmetric rings. The
+    inner nodes closer than 0.6h to the boundary (to the boundary itself, not only to its nodes) are removed: a node squeezed
+    between two boundary nodes, or a first row too far for the neighbor search to reach the boundary, gets a one-sided stencil
+    with spurious growing modes.
+
+    Input:
+        loops                       list            Boundary loops of the domain, as in Fill.
+        inside                      function        Function that tells if the points (x, y) are inside the domain.
+        holes       h x 3           ndarray         Circular holes (x, y, radius).
+        lo, hi      2               ndarray         Corners of the bounding box.
+        h                           float           Spacing of the nodes.
+        seed                        int             Seed of the random jitter (Default: 0).
+
+    Output:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+                                                        The boundary nodes go first, as in the bundled regions.
+    """
+
+    ## Variable initialization.
+    rng = np.random.default_rng(seed)                                               # Reproducible jitter.
+
+    ## Boundary of the domain.
+    boun = np.vstack([Resample(loop, h) for loop in loops])                         # The nodes of the boundary loops.
+    boun = boun[Domain(boun[:, 0], boun[:, 1], lambda x, y: np.ones(len(x), dtype = bool), holes)]
+                                                                                    # The boundary nodes inside the holes are removed.
+    fine = [Resample(loop, h/8) for loop in loops]                                  # The boundary, finely sampled.
+
+    ## Boundary of the holes.
+    for x0, y0, radius in holes:                                                    # For each of the holes.
+        circle = Circle(x0, y0, radius, h)                                          # The nodes of the hole.
+        boun   = np.vstack([boun, circle[Domain(circle[:, 0], circle[:, 1], inside, holes, 1e-9*h)]])
+                                                                                    # Only the part inside the domain and the other holes.
+        fine.append(Circle(x0, y0, radius, h/8))
+    fine = np.vstack(fine)
+
+    ## Interior of the domain.
+    x, y  = np.meshgrid(np.arange(lo[0], hi[0] + h, h), np.arange(lo[1], hi[1] + h, h))
+    x, y  = x.ravel(), y.ravel()                                                    # A square lattice, 8 neighbors in two rings.
+    x    += rng.uniform(-0.05*h, 0.05*h, len(x))                                    # The jitter.
+    y    += rng.uniform(-0.05*h, 0.05*h, len(y))
+    keep  = Domain(x, y, inside, holes)                                             # The lattice nodes inside the domain.
+    x, y  = x[keep], y[keep]
+    keep  = cKDTree(fine[:, 0:2]).query(np.column_stack([x, y]), distance_upper_bound = 0.6*h)[0] >= 0.6*h
+                                                                                    # The nodes too close to the boundary are removed.
+    inne  = np.column_stack([x[keep], y[keep], np.zeros(np.count_nonzero(keep))])
+
+    return np.vstack([boun[np.argsort(boun[:, 2], kind = 'stable')], inne])
+
+def Resample(loop, h):
+    """
+    Resample
+    Function to place nodes along a closed loop with a spacing close to h.
+
+    The loop is split at its corners (turns sharper than 30 degrees), which are kept as nodes, and each piece is sampled
+    uniformly by its length. The short edges of a polygonal boundary do not produce clusters of nodes.
+
+    Input:
+        loop        k x 3           ndarray         Vertices of the loop and the flag of the edge that starts at each vertex.
+        h                           float           Spacing of the nodes.
+
+    Output:
+        p           n x 3           ndarray         The nodes and the flag of their edge.
+    """
+
+    ## Variable initialization.
+    loop   = loop[np.any(np.roll(loop[:, 0:2], -1, axis = 0) != loop[:, 0:2], axis = 1)]
+                                                                                    # Repeated vertices are removed.
+    v      = loop[:, 0:2]                                                           # The vertices of the loop.
+    e      = np.roll(v, -1, axis = 0) - v                                           # The edge that starts at each vertex.
+    length = np.hypot(e[:, 0], e[:, 1])                                             # The length of each edge.
+    cum    = np.concatenate([[0], np.cumsum(length)])                               # Length along the loop at each vertex.
+    turn   = np.abs(np.angle((e[:, 0] + 1j*e[:, 1])/np.roll(e[:, 0] + 1j*e[:, 1], 1)))
+                                                                                    # The turn of the loop at each vertex.
+    corner = np.flatnonzero(turn > np.pi/6)                                         # The vertices kept as nodes.
+    corner = np.array([0]) if len(corner) == 0 else corner                          # A smooth loop starts anywhere.
+
+    ## Nodes of the pieces.
+    a, b   = cum[corner], np.append(cum[corner[1:]], cum[-1] + cum[corner[0]])      # Start and end of each piece along the loop.
+    pieces = np.round((b - a)/h).astype(int)                                        # Number of nodes of each piece (none if it is short).
+    piece  = np.repeat(np.arange(len(a)), pieces)                                   # The piece of each node.
+    s      = a[piece] + (np.arange(len(piece)) - np.repeat(np.cumsum(pieces) - pieces, pieces))*((b - a)/np.maximum(pieces, 1))[piece]
+    s      = np.mod(s, cum[-1])                                                     # The position of each node along the loop.
+    k      = np.minimum(np.searchsorted(cum, s, side = 'right') - 1, len(v) - 1)    # The edge of each node.
+    t      = (s - cum[k])/length[k]                                                 # The position of each node on its edge.
+
+    return np.column_stack([v[k, 0] + t*e[k, 0], v[k, 1] + t*e[k, 1], loop[k, 2]])
+
+def Circle(x0, y0, radius, h):
+    """
+    Circle
+    Function to place nodes along the boundary of a circular hole with a spacing of at most h.
+
+    Input:
+        x0, y0                      float           Center of the hole.
+        radius                      float           Radius of the hole.
+        h                           float           Largest spacing of the nodes.
+
+    Output:
+        p           n x 3           ndarray         The nodes, with flag 2.
+    """
+
+    ## Nodes of the circle.
+    n     = max(int(np.ceil(2*np.pi*radius/h)), 3)                                  # The number of nodes.
+    theta = 2*np.pi*np.arange(n)/n
+
+    return np.column_stack([x0 + radius*np.cos(theta), y0 + radius*np.sin(theta), 2*np.ones(n)])
+
+def Domain(x, y, inside, holes, tol = 0.0):
+    """
+    Domain
+    Function to tell which points are inside a domain and outside all its holes.
+
+    Input:
+        x, y        n               ndarray         Coordinates of the points.
+        inside                      function        Function that tells if the points (x, y) are inside the domain.
+        holes       h x 3           ndarray         Circular holes (x, y, radius).
+        tol                         float           Points closer than tol to a hole are kept (Default: 0).
+
+    Output:
+        keep        n               ndarray         Boolean array with the points inside the domain.
+    """
+
+    ## Inside test.
+    keep = np.asarray(inside(x, y), dtype = bool)                                   # The points inside the domain.
+    for x0, y0, radius in holes:                                                    # For each of the holes.
+        keep &= np.hypot(x - x0, y - y0) >= radius - tol                            # The points inside the hole are removed.
+
+    return keep
+
+def Write(data_path, cloud, reg, p, tt):
+    """
+    Write
+    Function to write a cloud with the layout of the bundled regions.
+
+    Both the CSV files and the binary .npy files read by Loader.Load are written.
+
+    Input:
+        data_path                   string          Folder of the clouds (e.g. 'Data/Large').
+        cloud                       string          Size of the cloud (e.g. '100000').
+        reg                         string          Name of the region (e.g. 'ENG').
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles.
+
+    Output:
+        base                        string          Name of the files without the _p/_tt suffixes.
+    """
+
+    ## Variable initialization.
+    folder = os.path.join(data_path, str(cloud))                                    # The folder of the cloud.
+    base   = os.path.join(folder, reg)                                              # Base name of the files of the region.
+    os.makedirs(folder, exist_ok = True)                                            # The folder is created if needed.
+
+    ## Files.
+    np.savetxt(base + '_p.csv', p, delimiter = ',', fmt = '%.16g')                  # The nodes.
+    np.savetxt(base + '_tt.csv', tt, delimiter = ',', fmt = '%d')                   # The triangles.
+    np.save(base + '_p.npy', np.asarray(p, dtype = float))                          # The binary nodes.
+    np.save(base + '_tt.npy', np.asarray(tt, dtype = int))                          # The binary triangles.
+
+    return base
+
+if __name__ == '__main__':
+    ## Command line.
+    parser = argparse.ArgumentParser(description = 'Fill a region or a polygon with a large cloud of points.')
+    parser.add_argument('--region', help = 'Base name of a bundled region (e.g. Data/Clouds/3/ENG).')
+    parser.add_argument('--polygon', type = float, nargs = '+', help = 'Vertices x0 y0 x1 y1 ... of a polygon.')
+    parser.add_argument('--name', help = 'Name of the new region (Default: the name of the bundled region).')
+    parser.add_argument('--nodes', type = int, nargs = '+', required = True, help = 'Approximate number of nodes of each cloud.')
+    parser.add_argument('--holes', type = float, nargs = '+', default = [], help = 'Circular holes x y r ...')
+    parser.add_argument('--seed', type = int, default = 0, help = 'Seed of the random jitter.')
+    parser.add_argument('--output', default = 'Data/Large', help = 'Folder where the clouds are written.')
+    args = parser.parse_args()
+
+    ## Clouds generation.
+    if (args.region is None) == (args.polygon is None):
+        parser.error('Give either --region or --polygon.')
+    if args.region is not None:                                                     # A bundled region.
+        folder, reg = os.path.split(args.region)                                    # The folder and the name of the region.
+        data, size  = os.path.split(folder)                                         # The folder of the clouds and the size.
+        p0, tt0     = Loader.Load(data, size, reg)                                  # The bundled region.
+    name = args.name or (reg if args.region is not None else 'POL')                 # The name of the new region.
+    for m in args.nodes:                                                            # For each requested size.
+        if args.region is not None:
+            p, tt = Region(p0, tt0, m, args.holes or None, args.seed)               # The region is filled.
+        else:
+            p, tt = Polygon(np.reshape(args.polygon, (-1, 2)), m, args.holes or None, args.seed)
+                                                                                    # The polygon is filled.
+        base = Write(args.output, m, name, p, tt)                                   # The cloud is written.
+        print('%s: %d nodes (%d on the boundary), %d triangles.' % (base, len(p), np.count_nonzero(p[:, 2]), len(tt)))
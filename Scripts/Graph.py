@@ -13,15 +13,26 @@ Date:
     November, 2022.
 
 Last Modification:
-    March, 2024.
+    October, 2026.
 """
 
 ## Library importation.
+import os
+import subprocess
 import numpy as np
+import multiprocessing
+import matplotlib
 import matplotlib.pyplot as plt
 from matplotlib import cm
+from matplotlib.tri import Triangulation
+from matplotlib.figure import Figure
 from matplotlib.animation import FuncAnimation
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from collections import deque
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor
 plt.rcParams.update({'font.size': 18})
+Worker = None                                                                       # The Renderer of a rendering process (see Render_Start).
 
 def Cloud(p, tt, u_ap, u_ex, save = False, nom = ''):
     """
@@ -110,7 +121,6 @@ def Cloud(p, tt, u_ap, u_ex, save = False, nom = ''):
         plt.pause(0.1)
         plt.close()
 
-
 def Cloud_Steps(p, tt, u_ap, u_ex, nom):
     """
     Cloud_Steps
@@ -155,7 +165,6 @@ def Cloud_Steps(p, tt, u_ap, u_ex, nom):
         plt.savefig(nok)
         plt.close()
 
-
 def Cloud_1(p, tt, u_ap, save = False, nom = ''):
     """
     Cloud_1
@@ -232,7 +241,6 @@ def Cloud_1(p, tt, u_ap, save = False, nom = ''):
         plt.pause(0.1)
         plt.close()
 
-
 def Cloud_Steps_1(p, tt, u_ap, nom = ''):
     """
     Cloud_Steps_1
@@ -274,4 +282,181 @@ def Cloud_Steps_1(p, tt, u_ap, nom = ''):
         
         nok = nom + '_' + str(format(T[k], '.2f')) + 's.png'
         plt.savefig(nok)
-        plt.close()
\ No newline at end of file
+        plt.close()
+
+def Cloud_Fast(p, tt, u_ap, u_ex = None, nom = '', top = False, workers = None, fps = 10):
+    """
+    Cloud_Fast
+
+    This function renders the same frames as Cloud (or Cloud_1 when u_ex is not given) and saves them as a video or as numbered PNGs.
+    The triangulation and the surfaces are built once in each process, and each frame only updates the heights and colours of the
+    vertices. The frames are rendered off-screen by a pool of processes, one frame per task, and each one is written, in order,
+    to ffmpeg or to a PNG file as soon as it arrives, so only a few frames are held in memory.
+
+    Input:
+        p           m x 2           ndarray         Array with the coordinates of the nodes.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles.
+        u_ap        m x t           ndarray         Array with the computed solution.
+        u_ex        m x t           ndarray         Array with the theoretical solution (None for the approximation only).
+        nom                         string          Name of the files to be saved to drive.
+                                                        'name.mp4': A video is written with ffmpeg.
+                                                        'name': Frames are written as name_0000.png, name_0001.png, ...
+        top                         bool            Select the view of the solution.
+                                                        True: 2D top view with tripcolor.
+                                                        False: 3D surfaces, as in Cloud (Default).
+        workers                     int             Number of rendering processes (Default: all the available cores).
+        fps                         int             Frames per second of the video (Default: 10).
+        
+    Output:
+        None
+    """
+
+    ## Variable initialization.
+    tt      = tt - 1 if tt.min() == 1 else tt                                       # Triangles with zero-based indexes.
+    t       = len(u_ap[0, :])                                                       # The number of time levels.
+    step    = int(np.ceil(t/50))                                                    # Step between frames.
+    T       = np.linspace(0, 1, t)                                                  # Time discretization.
+    frames  = np.minimum(np.arange(0, t+1, step), t - 1)                            # The time levels of the frames.
+    ref     = u_ap if u_ex is None else u_ex                                        # Reference solution for the color limits.
+    limits  = (float(ref.min()), float(ref.max()))                                  # The color and height limits.
+    workers = min(workers or os.cpu_count(), len(frames))                           # The number of rendering processes.
+    panels  = 1 if u_ex is None else 2                                              # The number of panels of each frame.
+    jobs    = ((u_ap[:, k], None if u_ex is None else u_ex[:, k], T[k]) for k in frames)
+                                                                                    # The data of each frame, taken when it is submitted.
+
+    ## Frames rendering and writing.
+    video   = None                                                                  # The video writer.
+    context = multiprocessing.get_context('spawn')                                  # Fresh processes with their own off-screen figures.
+    try:
+        with ProcessPoolExecutor(max_workers = workers, mp_context = context, initializer = Render_Start,
+                                 initargs = (p[:, 0:2], tt, limits, top, panels)) as pool:
+            pending = deque(pool.submit(Render, job) for job in islice(jobs, 2*workers))
+                                                                                    # At most two frames per process are on the way.
+            number  = 0                                                             # Counter of the written frames.
+            while pending:                                                          # The frames are written in order.
+                image = pending.popleft().result()                                  # The next frame, as soon as it is rendered.
+                for job in islice(jobs, 1):                                         # A new frame takes its place.
+                    pending.append(pool.submit(Render, job))
+                if nom.endswith('.mp4'):                                            # For a video.
+                    if video is None:                                               # The ffmpeg process is started with the first frame.
+                        h, w = image.shape[0:2]                                     # The size of the frames.
+                        video = subprocess.Popen([matplotlib.rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+                                                  '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', '%dx%d' % (w, h), '-r', str(fps), '-i', '-',
+                                                  '-vf', 'scale=trunc(iw/2)*2:trunc(ih/2)*2', '-pix_fmt', 'yuv420p', nom],
+                                                 stdin = subprocess.PIPE)
+                    video.stdin.write(image.tobytes())                              # The frame is streamed to ffmpeg.
+                else:                                                               # For numbered PNGs.
+                    plt.imsave('%s_%04d.png' % (nom, number), image)                # The frame is saved.
+                number += 1                                                         # Increase the counter by 1.
+    except BaseException:
+        if video is not None:                                                       # The partial video is discarded.
+            video.kill()
+        raise
+    finally:
+        ## Video closing.
+        if video is not None:
+            try:
+                video.stdin.close()                                                 # No more frames.
+            except BrokenPipeError:                                                 # ffmpeg already finished.
+                pass
+            video.wait()                                                            # Wait for ffmpeg to finish, no zombie is left.
+
+class Renderer:
+    """
+    Renderer
+
+    This class renders frames off-screen. The figure is created once, and each frame only updates the surfaces.
+
+    Input:
+        p           m x 2           ndarray         Array with the coordinates of the nodes.
+        tt          n x 3           ndarray         Array with the zero-based correspondence of the n triangles.
+        limits                      tuple           The color and height limits.
+        top                         bool            Select the view of the solution, as in Cloud_Fast.
+        panels                      int             Number of panels: 1 for the approximation, 2 to add the theoretical solution.
+    """
+
+    def __init__(self, p, tt, limits, top = False, panels = 1):
+        ## Variable initialization.
+        titles      = ['Approximation', 'Theoretical Solution']                     # Titles of the panels.
+        triang      = Triangulation(p[:, 0], p[:, 1], tt)                           # The triangulation is built once.
+        self.p      = p                                                             # The coordinates of the nodes.
+        self.tt     = tt                                                            # The triangles.
+        self.top    = top                                                           # The view of the solution.
+        self.fig    = Figure(figsize = (5*panels, 5))                               # Off-screen figure.
+        self.canvas = FigureCanvasAgg(self.fig)                                     # Off-screen canvas.
+        self.surfs  = []                                                            # The surfaces of each panel.
+        z           = np.zeros(len(p[:, 0]))                                        # A flat solution to create the surfaces.
+
+        ## Figure creation.
+        for i in range(panels):                                                     # For each of the panels.
+            if top:                                                                 # 2D top view.
+                ax   = self.fig.add_subplot(1, panels, i + 1)
+                surf = ax.tripcolor(triang, z, cmap = cm.coolwarm, shading = 'gouraud', vmin = limits[0], vmax = limits[1])
+                ax.set_aspect('equal')
+                ax.set_axis_off()
+                self.fig.subplots_adjust(top = 0.85)                                # Room for both titles.
+            else:                                                                   # 3D surface.
+                ax   = self.fig.add_subplot(1, panels, i + 1, projection = '3d')
+                surf = ax.plot_trisurf(triang, z, cmap = cm.coolwarm, linewidth = 0, antialiased = False, vmin = limits[0], vmax = limits[1])
+                ax.set_zlim(limits)
+                if panels == 1:                                                     # The approximation alone is seen from above, as in Cloud_1.
+                    ax.view_init(90, 270)
+                    ax.set_zticks([])
+            ax.set_title(titles[i])
+            self.surfs.append(surf)
+        self.title = self.fig.suptitle('')
+
+    def __call__(self, u_ap, u_ex, Tk):
+        """
+        __call__
+
+        This function renders one frame.
+
+        Input:
+            u_ap    m               ndarray         The computed solution at the frame.
+            u_ex    m               ndarray         The theoretical solution at the frame (None for the approximation only).
+            Tk                      float           The time of the frame.
+
+        Output:
+            image   h x w x 4       ndarray         The RGBA image of the frame.
+        """
+
+        ## Frame rendering.
+        self.title.set_text('Solution at t = %1.3f s.' % float(Tk))
+        for surf, z in zip(self.surfs, [u_ap, u_ex]):                               # For each of the panels.
+            if self.top:                                                            # Only the colours are updated.
+                surf.set_array(z)
+            else:                                                                   # The heights and colours are updated.
+                surf.set_verts(np.stack([self.p[self.tt, 0], self.p[self.tt, 1], z[self.tt]], axis = -1))
+                surf.set_array(z[self.tt].mean(axis = 1))
+        self.canvas.draw()                                                          # The frame is rendered.
+
+        return np.asarray(self.canvas.buffer_rgba()).copy()
+
+def Render_Start(p, tt, limits, top, panels):
+    """
+    Render_Start
+
+    This function creates the Renderer of a rendering process, it is the initializer of the pool of Cloud_Fast.
+
+    Input:
+        p, tt, limits, top, panels                  Same as in Renderer.
+    """
+
+    global Worker
+    Worker = Renderer(p, tt, limits, top, panels)                                   # The figure of the process.
+
+def Render(job):
+    """
+    Render
+
+    This function renders one frame in a rendering process, with the Renderer created by Render_Start.
+
+    Input:
+        job                         tuple           (u_ap, u_ex, Tk) of the frame, as in Renderer.
+        
+    Output:
+        image       h x w x 4       ndarray         The RGBA image of the frame.
+    """
+
+    return Worker(*job)
@@ -0,0 +1,135 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import os
+import glob
+import numpy as np
+import Scripts.Files as Files
+
+def Pack(data_path = 'Data'):
+    """
+    Pack
+    Function to convert all the regions in a data folder from CSV to binary .npy files.
+
+    Each {reg}_p.csv and {reg}_tt.csv is converted into {reg}_p.npy and {reg}_tt.npy in the same folder. The binary files can be
+    memory-mapped by Load, so the regions are read without parsing any text.
+    
+    Input:
+        data_path                   string          Folder with the regions (Default: 'Data').
+    
+    Output:
+        packed                      list            List with the names of the written files.
+    """
+
+    ## Variable initialization.
+    packed = []                                                                     # packed initialization.
+
+    ## Conversion.
+    for path in sorted(glob.glob(os.path.join(data_path, '**', '*.csv'), recursive = True)):
+        if not (path.endswith('_p.csv') or path.endswith('_tt.csv')):               # Only the nodes and the triangles are converted.
+            continue
+        data = Read(path)                                                           # The CSV file is parsed.
+        name = path[:-len('.csv')] + '.npy'                                         # The name of the binary file.
+        Files.Atomic(name, lambda file: np.save(file, data))                        # The binary file is published atomically.
+        packed.append(name)                                                         # The file is listed.
+
+    return packed
+
+def Load(data_path, cloud, reg, mmap = True):
+    """
+    Load
+    Function to load the nodes and triangles of a region.
+
+    The binary .npy files written by Pack are memory-mapped (copy-on-write), so the coordinates, boundary flags and triangles are
+    accessed without copies. If there is no binary file for the region, or it is older than the CSV file, the CSV file is read.
+    
+    Input:
+        data_path                   string          Folder with the regions (e.g. 'Data/Clouds/').
+        cloud                       string          Size of the cloud (e.g. '1').
+        reg                         string          Name of the region (e.g. 'ENG').
+        mmap                        bool            Select whether or not memory-map the binary files.
+                                                        True: Memory-mapped arrays (Default).
+                                                        False: Arrays read into memory.
+    
+    Output:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles.
+    """
+
+    ## Variable initialization.
+    base = os.path.join(data_path, str(cloud), reg)                                 # Base name of the files of the region.
+
+    ## Files loading.
+    p    = Array(base + '_p', float, mmap)                                          # The nodes of the region.
+    tt   = Array(base + '_tt', int, mmap)                                           # The triangles of the region.
+
+    return p, tt
+
+def Array(base, dtype, mmap = True):
+    """
+    Array
+    Function to load a single array, from its binary file if it is up to date, or from its CSV file otherwise.
+    
+    Input:
+        base                        string          Name of the file without extension.
+        dtype                       type            Type of the array.
+        mmap                        bool            Select whether or not memory-map the binary file (Default: True).
+    
+    Output:
+        A                           ndarray         The loaded array.
+    """
+
+    ## Variable initialization.
+    npy = base + '.npy'                                                             # The binary file.
+    csv = base + '.csv'                                                             # The CSV file.
+
+    ## Array loading.
+    if os.path.exists(npy) and (not os.path.exists(csv) or os.path.getmtime(npy) >= os.path.getmtime(csv)):
+        A = np.load(npy, mmap_mode = 'c' if mmap else None)                         # The binary file is used.
+    else:
+        A = Read(csv, dtype)                                                        # The CSV file is used.
+
+    return A
+
+def Read(path, dtype = None):
+    """
+    Read
+    Function to parse a CSV file of a region.
+    
+    Input:
+        path                        string          Name of the CSV file.
+        dtype                       type            Type of the array (Default: int for triangles, float otherwise).
+    
+    Output:
+        A                           ndarray         The parsed array.
+    """
+
+    ## Variable initialization.
+    if dtype is None:
+        dtype = int if path.endswith('_tt.csv') else float                          # Triangles are stored as integers.
+
+    ## CSV parsing.
+    A = np.loadtxt(path, delimiter = ',', dtype = dtype, ndmin = 2)                 # The CSV file is parsed.
+
+    return A
+
+if __name__ == '__main__':
+    ## Convert all the bundled regions.
+    files = Pack('Data')
+    print('%d files written.' % len(files))
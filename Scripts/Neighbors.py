@@ -13,14 +13,14 @@ Date:
     November, 2022.
 
 Last Modification:
-    March, 2024.
+    October, 2026.
 """
 
 ## Library importation.
 import numpy as np
 from scipy.spatial import KDTree
 
-def Triangulation(p, tt, nvec):
+def Triangulation(p, tt, nvec, mode = 2, full = False):
     """
     Triangulation
     Function to find the neighbor nodes in a triangulation.
@@ -29,6 +29,12 @@ def Triangulation(p, tt, nvec):
         p           m x 2           double          Array with the coordinates of the nodes.
         tt          n x 3           double          Array with the correspondence of the n triangles.
         nvec                        integer         Maximum number of neighbors.
+        mode                        integer         Choose the way to find the neighbors:
+                                                    1: node by node
+                                                    2: vectorized adjacency (default)
+        full                        bool            Keep the full ring of neighbors of each node (only for mode 2).
+                                                        True: vec grows to as many columns as the largest ring.
+                                                        False: Rings are cut off at nvec (Default).
     
     Output:
         vec         m x nvec        double          Array with matching neighbors of each node.
@@ -36,20 +42,66 @@ def Triangulation(p, tt, nvec):
 
     ## Variable initialization.
     m   = len(p[:,0])                                                               # The size if the triangulation is obtained.
-    vec = np.zeros([m, nvec], dtype=int)-1                                          # The array for the neighbors is initialized.
 
-    ## Neighbor search.
-    for i in np.arange(m):                                                          # For each of the nodes.
-        kn    = np.argwhere(tt == i)                                                # Search in which triangles the node appears.
-        vec2  = np.setdiff1d(tt[kn[:,0]], i)                                        # Neighbors are stored inside vec2.
-        vec2  = np.vstack([vec2])                                                   # Convert vec2 to a column.
-        nvec2 = sum(vec2[0,:] != -1)                                                # The number of neighbors of the node is calculated.
-        nnvec = np.minimum(nvec, nvec2)                                             # The real number of neighbors.
-        for j in np.arange(nnvec):                                                  # For each of the nodes.
-            vec[i,j] = vec2[0,j]                                                    # Neighbors are saved.
+    if mode == 1:
+        ## Node by node.
+        vec = np.zeros([m, nvec], dtype=int)-1                                      # The array for the neighbors is initialized.
+        for i in np.arange(m):                                                      # For each of the nodes.
+            kn    = np.argwhere(tt == i)                                            # Search in which triangles the node appears.
+            vec2  = np.setdiff1d(tt[kn[:,0]], i)                                    # Neighbors are stored inside vec2.
+            vec2  = np.vstack([vec2])                                               # Convert vec2 to a column.
+            nvec2 = sum(vec2[0,:] != -1)                                            # The number of neighbors of the node is calculated.
+            nnvec = np.minimum(nvec, nvec2)                                         # The real number of neighbors.
+            for j in np.arange(nnvec):                                              # For each of the nodes.
+                vec[i,j] = vec2[0,j]                                                # Neighbors are saved.
+
+    if mode == 2:
+        ## Vectorized adjacency.
+        indptr, indices = Adjacency(tt, m)                                          # CSR node-to-node adjacency of the triangulation.
+        ring = np.diff(indptr)                                                      # The number of neighbors of each node.
+        if full == True:                                                            # If the full rings are requested.
+            nvec = max(int(ring.max(initial = 0)), nvec)                            # The number of columns grows up to the largest ring.
+        vec  = np.zeros([m, nvec], dtype=int)-1                                     # The array for the neighbors is initialized.
+        rows = np.repeat(np.arange(m), ring)                                        # The central node of each entry.
+        cols = np.arange(len(indices)) - np.repeat(indptr[:-1], ring)               # The position of each entry in its ring.
+        keep = cols < nvec                                                          # Only the first nvec neighbors remains.
+        vec[rows[keep], cols[keep]] = indices[keep]                                 # Neighbors are saved.
+
     return vec
 
-def Cloud(p, nvec):
+def Adjacency(tt, m):
+    """
+    Adjacency
+    Function to build the node-to-node adjacency of a triangulation in CSR format.
+
+    The edges of all the triangles are listed in both directions, sorted and made unique in a single vectorized pass.
+    The neighbors of node i are indices[indptr[i]:indptr[i+1]], sorted in ascending order.
+    
+    Input:
+        tt          n x 3           double          Array with the correspondence of the n triangles.
+        m                           integer         The total number of nodes.
+    
+    Output:
+        indptr      m + 1           ndarray         Pointers to the start of the neighbors of each node.
+        indices     nnz             ndarray         Indices of the neighbors of all the nodes.
+    """
+
+    ## Edge list.
+    tt      = np.asarray(tt, dtype = int)                                           # The triangles are used as integer indexes.
+    a       = tt[:, [0, 1, 2, 1, 2, 0]].ravel()                                     # First node of each edge, in both directions.
+    b       = tt[:, [1, 2, 0, 0, 1, 2]].ravel()                                     # Second node of each edge, in both directions.
+    keep    = (a >= 0) & (b >= 0) & (a != b)                                        # Discard the missing and degenerate edges.
+
+    ## Sort and unique.
+    key     = np.unique(a[keep]*m + b[keep])                                        # Each edge is encoded as a single sorted key.
+    rows    = key//m                                                                # The central node of each edge.
+    indices = key%m                                                                 # The neighbor node of each edge.
+    indptr  = np.zeros(m + 1, dtype = int)                                          # indptr initialization with zeros.
+    indptr[1:] = np.cumsum(np.bincount(rows, minlength = m))                        # The pointers are the cumulative number of neighbors.
+
+    return indptr, indices
+
+def Cloud(p, nvec, mode = 3):
     """
     Cloud
     Function to find the neighbor nodes in a cloud of points.
@@ -57,16 +109,21 @@ def Cloud(p, nvec):
     Input:
         p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
         nvec                        integer         Maximum number of neighbors.
+        mode                        integer         Choose the way to find the neighbors:
+                                                    1: brute force
+                                                    2: optimized
+                                                    3: KD-tree (default), the same neighbors as mode 2 without
+                                                       the m x m distance matrices.
     
     Output:
         vec         m x nvec        ndarray         Array with matching neighbors of each node.
     """
 
     ## Delta computation.
-    dist = find_distances(p, mode = 2)
+    dist = find_distances(p, mode = mode)
 
     ## Neighbor search.
-    vec = find_neighbors(p, dist, nvec, mode = 2)
+    vec = find_neighbors(p, dist, nvec, mode = mode)
 
     return vec
 
@@ -80,6 +137,7 @@ def find_distances(p, mode = 2):
         mode                        integer         Choose the way to compute the distances:
                                                     1: brute force
                                                     2: optimized (default)
+                                                    3: KD-tree
     
     Output:
         dist                        float           The maximum distance between two consecutive nodes.
@@ -111,6 +169,12 @@ def find_distances(p, mode = 2):
         np.fill_diagonal(distances, np.inf)                                         # Distances to the self node are state as infinity and not zero.
         min_distances = np.sqrt(np.min(distances, axis=1))                          # Look for the distance to the closest node.
         dist          = (3/2)*np.max(min_distances)                                 # The distance is the maximum distance between two consecutive nodes.
+
+    if mode == 3:
+        ## KD-tree.
+        tree          = KDTree(p)                                                   # The KD-tree with all the columns of p, as in mode 2.
+        distances, _  = tree.query(p, k = 2)                                        # Look for the closest node (the first one is the node itself).
+        dist          = (3/2)*np.max(distances[:, 1])                               # The distance is the maximum distance between two consecutive nodes.
     
     return dist
 
@@ -126,6 +190,7 @@ def find_neighbors(p, dist, nvec, mode = 2):
         mode                        integer         Choose the way to compute the distances:
                                                     1: brute force
                                                     2: optimized (default)
+                                                    3: KD-tree
     
     Output:
         vec         m x nvec        ndarray         Array with matching neighbors of each node.
@@ -175,6 +240,45 @@ def find_neighbors(p, dist, nvec, mode = 2):
                 neighbors = neighbors[np.argsort(radius[i, neighbors])]             # The neighbors are sorted by distance and only the closest nvec neighbors remains.
                 vec[i, :len(neighbors)] = neighbors                                 # The neighbors are stored.
 
+    if mode == 3:
+        ## KD-tree
+        tree       = KDTree(p[:, 0:2])                                              # The KD-tree with the coordinates of the nodes is built.
+        bound      = dist*(1 + 1e-12)                                               # The search radius, widened by the rounding of the tree.
+        within     = tree.query_ball_point(p[:, 0:2], bound, return_length = True)  # The number of nodes within the radius of each node.
+        sort       = np.argsort(within, kind = 'stable')                            # The nodes with similar counts are searched together.
+        size       = within[sort]                                                   # The count of each node, in the order of the search.
+        budget     = m*max(nvec, 2)                                                 # Largest number of candidates held at once, as in vec.
+        start      = 0                                                              # First node of the chunk.
+
+        while start < m:                                                            # For each chunk of nodes.
+            lo, hi = start + 1, m                                                   # The chunk holds at most budget candidates.
+            while lo < hi:
+                mid = (lo + hi + 1)//2
+                if (mid - start)*size[mid - 1] <= budget:
+                    lo = mid
+                else:
+                    hi = mid - 1
+            rows   = sort[start:lo]                                                 # The nodes of the chunk.
+            fill   = np.arange(size[lo - 1]) < size[start:lo, None]                 # The place of the candidates of each node.
+            start  = lo
+            nb     = np.full(fill.shape, m)                                         # m for the missing candidates.
+            nb[fill] = np.concatenate(tree.query_ball_point(p[rows, 0:2], bound, return_sorted = True)).astype(int)
+                                                                                    # All the nodes within the radius, in ascending order.
+            radius = np.sqrt((p[rows, 0, None] - p[np.minimum(nb, m - 1), 0])**2 + (p[rows, 1, None] - p[np.minimum(nb, m - 1), 1])**2)
+                                                                                    # The distances are computed as in mode 2.
+            nb     = np.where((nb < m) & (radius < dist) & (nb != rows[:, None]), nb, m)
+                                                                                    # Discard the central node and the nodes out of the radius.
+            order  = np.argsort(nb == m, axis = 1, kind = 'stable')                 # The neighbors first, in ascending order as in mode 2.
+            nb     = np.take_along_axis(nb, order, axis = 1)
+            radius = np.take_along_axis(radius, order, axis = 1)
+            count  = np.sum(nb < m, axis = 1)                                       # The number of neighbors of each node.
+
+            for n in np.unique(count[count > 0]):                                   # For each number of neighbors.
+                same = np.where(count == n)[0]                                      # The nodes with n neighbors.
+                near = np.argsort(radius[same, :n], axis = 1)[:, :nvec]             # The same sort of the distances as in mode 2.
+                vec[rows[same], :near.shape[1]] = np.take_along_axis(nb[same, :n], near, axis = 1)
+                                                                                    # The closest nvec neighbors are stored.
+
     return vec
 
 def Cloud_old(p, nvec):
@@ -0,0 +1,394 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+"""
+
+## Library importation.
+import warnings
+import numpy as np
+from scipy import sparse
+from scipy.sparse import linalg as spla
+try:
+    from scipy.sparse import _sparsetools
+except ImportError:                                                                 # The in-place sparse kernels are private to SciPy.
+    _sparsetools = None
+
+def Explicit(K):
+    """
+    Explicit
+    Function to assemble the sparse time-stepping operators for the explicit scheme.
+
+    The new time level is computed as u^{k+1} = K1(K2 u^k + dt g) for k = 1, and as u^{k+1} = K3(K4 u^k - u^{k-1}) for k = 2, ..., t.
+    
+    Input:
+        K           m x m           csr_matrix      Sparse K Matrix with the computed Gammas.
+    
+    Output:
+        K1          m x m           csr_matrix      Operator for k = 1 (identity).
+        K2          m x m           csr_matrix      Operator for k = 1.
+        K3          m x m           csr_matrix      Operator for k = 2, ..., t (identity).
+        K4          m x m           csr_matrix      Operator for k = 2, ..., t.
+    """
+
+    ## Variable initialization.
+    m  = K.shape[0]                                                                 # The total number of nodes.
+    I  = sparse.identity(m, dtype = K.dtype, format = 'csr')                        # Sparse identity matrix.
+
+    ## Operators assembly.
+    K1 = I                                                                          # Explicit formulation of K for k = 1.
+    K3 = I                                                                          # Explicit formulation of K for k = 2, ..., t.
+    if K.dtype == np.float64:                                                       # The identity is added to K.
+        K2 = (I + (1/2)*K).tocsr()                                                  # Explicit formulation of K for k = 1.
+        K4 = (2*I + K).tocsr()                                                      # Explicit formulation of K for k = 2, ..., t.
+    else:                                                                           # In single precision the identity is applied apart.
+        K2 = Shifted((1/2)*K, 1)                                                    # Explicit formulation of K for k = 1.
+        K4 = Shifted(K, 2)                                                          # Explicit formulation of K for k = 2, ..., t.
+
+    return K1, K2, K3, K4
+
+def Implicit(K, lam = 0.5, krylov = None):
+    """
+    Implicit
+    Function to assemble the sparse time-stepping operators for the implicit scheme.
+
+    The matrices I - (1 - lam)K/2 and I - (1 - lam)K are factorized once with a sparse LU decomposition. K1 and K3 apply the inverse
+    of these matrices through the factorization, so each time step costs a sparse matrix-vector product and two triangular solves.
+    The factorizations (or the Krylov solves) are always done in float64, also when K is stored in single precision.
+    
+    Input:
+        K           m x m           csr_matrix      Sparse K Matrix with the computed Gammas.
+        lam                         float           Lambda parameter for the implicit scheme.
+                                                        Must be between 0 and 1 (Default: 0.5).
+        krylov                      dict            Options of the Krylov solver (see Krylov).
+                                                        None: Sparse LU factorizations (Default).
+                                                        dict: The matrices are never factorized, each solve is iterative.
+    
+    Output:
+        K1          m x m           LinearOperator  Inverse of I - (1 - lam)K/2, for k = 1.
+        K2          m x m           csr_matrix      Operator for k = 1.
+        K3          m x m           LinearOperator  Inverse of I - (1 - lam)K, for k = 2, ..., t.
+        K4          m x m           csr_matrix      Operator for k = 2, ..., t.
+    """
+
+    ## Variable initialization.
+    m   = K.shape[0]                                                                # The total number of nodes.
+    I   = sparse.identity(m, dtype = K.dtype, format = 'csr')                       # Sparse identity matrix.
+    lam = float(lam)                                                                # A Python float keeps the type of K.
+    I64 = sparse.identity(m, format = 'csr')                                        # Sparse identity matrix for the solves.
+    K64 = K.astype(np.float64, copy = False)                                        # K for the solves.
+
+    ## Operators assembly.
+    if krylov is None:                                                              # Sparse LU factorizations.
+        solver = Solver
+    else:                                                                           # Preconditioned Krylov solves.
+        solver = lambda A: Krylov(A, **krylov)
+    K1 = solver(I64 - (1 - lam)*(1/2)*K64)                                          # Implicit formulation of K for k = 1.
+    K3 = solver(I64 - (1 - lam)*K64)                                                # Implicit formulation of K for k = 2, ..., t.
+    if K.dtype == np.float64:                                                       # The identity is added to K.
+        K2 = (I + lam*(1/2)*K).tocsr()                                              # Implicit formulation of K for k = 1.
+        K4 = (2*I + lam*K).tocsr()                                                  # Implicit formulation of K for k = 2, ..., t.
+    else:                                                                           # In single precision the identity is applied apart.
+        K2 = Shifted(lam*(1/2)*K, 1)                                                # Implicit formulation of K for k = 1.
+        K4 = Shifted(lam*K, 2)                                                      # Implicit formulation of K for k = 2, ..., t.
+
+    return K1, K2, K3, K4
+
+def Solver(A):
+    """
+    Solver
+    Function to factorize a sparse matrix once and wrap its inverse as a linear operator.
+    
+    Input:
+        A           m x m           sparse matrix   Matrix to be factorized.
+    
+    Output:
+        Ainv        m x m           LinearOperator  Operator that applies the inverse of A (Ainv@b solves A x = b).
+    """
+
+    ## Factorization.
+    A    = sparse.csc_matrix(A)                                                     # CSC format is required for the factorization.
+    lu   = spla.splu(A)                                                             # Sparse LU factorization of A.
+    Ainv = spla.LinearOperator(A.shape, matvec = lu.solve, matmat = lu.solve, dtype = A.dtype)
+                                                                                    # The inverse is applied with triangular solves.
+    return Ainv
+
+class Shifted(spla.LinearOperator):
+    """
+    Shifted
+    Class to apply sI + K without adding the identity to K.
+
+    In single precision the entries of K are much smaller than the ones of the identity, so most of their digits are lost when
+    sI + K is assembled. Here K is applied first and s x is added afterwards, so K keeps all its digits.
+
+    Input:
+        K           m x m           matrix          Sparse or dense matrix.
+        shift                       float           The shift s.
+    """
+
+    def __init__(self, K, shift):
+        super().__init__(dtype = K.dtype, shape = K.shape)
+        self.K     = K.tocsr() if sparse.issparse(K) else K                         # The matrix.
+        self.shift = shift                                                          # The shift.
+
+    def _matvec(self, x):
+        return self._matmat(x)
+
+    def _matmat(self, X):
+        Y  = self.K@X                                                               # K is applied.
+        Y += self.shift*X                                                           # The shift is added.
+        return Y
+
+class Krylov(spla.LinearOperator):
+    """
+    Krylov
+    Class to apply the inverse of a sparse matrix with a preconditioned Krylov method, without ever forming it or factorizing it.
+
+    The preconditioner is built once. Each solve is warm-started with the linear extrapolation 2x^k - x^{k-1} of the two previous
+    solutions, which is a close guess when the solutions are successive time levels of a smooth field. It can replace the LU
+    factorizations of Implicit as K1 or K3, and its memory is O(nnz) of A and of the preconditioner.
+
+    Input:
+        A           m x m           sparse matrix   Matrix to be inverted.
+        method                      string          Krylov method: 'gmres' (Default) or 'bicgstab'.
+                                                        The GFD K is not symmetric, so CG is not offered.
+        preconditioner              string          Preconditioner: 'ilu' (Default), 'jacobi' or None.
+        rtol                        float           Relative tolerance of each solve (Default: 1e-10).
+        atol                        float           Absolute tolerance of each solve (Default: 0).
+        maxiter                     int             Maximum number of iterations of each solve (Default: None, the method default).
+        drop_tol                    float           Drop tolerance of the incomplete LU (Default: 1e-4).
+        fill_factor                 float           Fill factor of the incomplete LU (Default: 10).
+
+    The number of iterations of each solve is appended to the iterations list, and info to the info list (0 for converged).
+    A solve that does not converge gives a RuntimeWarning, and it is counted in the failures of Stats.
+    """
+
+    def __init__(self, A, method = 'gmres', preconditioner = 'ilu', rtol = 1e-10, atol = 0.0, maxiter = None, drop_tol = 1e-4, fill_factor = 10):
+        ## Variable initialization.
+        A = sparse.csr_matrix(A)                                                    # CSR format for the matrix-vector products.
+        super().__init__(dtype = A.dtype, shape = A.shape)
+        self.A          = A                                                         # Matrix to be inverted.
+        if method not in ('gmres', 'bicgstab'):
+            raise ValueError("Unknown Krylov method '%s'." % method)
+        self.method     = {'gmres': spla.gmres, 'bicgstab': spla.bicgstab}[method]  # The Krylov method.
+        self.options    = {'rtol': rtol, 'atol': atol, 'maxiter': maxiter}          # The tolerances of each solve.
+        self.history    = []                                                        # The two previous solutions.
+        self.iterations = []                                                        # Number of iterations of each solve.
+        self.info       = []                                                        # Convergence flag of each solve.
+
+        ## Preconditioner.
+        self.M = None                                                               # No preconditioner.
+        if preconditioner == 'ilu':                                                 # Incomplete LU, built once.
+            ilu    = spla.spilu(A.tocsc(), drop_tol = drop_tol, fill_factor = fill_factor)
+            self.M = spla.LinearOperator(A.shape, matvec = ilu.solve, dtype = A.dtype)
+        elif preconditioner == 'jacobi':                                            # Inverse of the diagonal.
+            d      = 1/A.diagonal()
+            self.M = spla.LinearOperator(A.shape, matvec = lambda x: d*np.ravel(x), dtype = A.dtype)
+
+    def _matvec(self, b):
+        return self.solve(np.ravel(b))
+
+    def _matmat(self, B):
+        return self.solve(np.asarray(B))
+
+    def solve(self, b):
+        """
+        solve
+        Function to solve A x = b, warm-started from the previous solutions.
+
+        Input:
+            b       m (x n)         ndarray         Right-hand side (one column for each of n systems).
+
+        Output:
+            x       m (x n)         ndarray         Solution.
+        """
+
+        ## Initial guess.
+        history = [x for x in self.history if x.shape == b.shape]                   # Only the solutions of the same shape.
+        if len(history) == 2:                                                       # Linear extrapolation of the last two solutions.
+            x0 = 2*history[1] - history[0]
+        elif len(history) == 1:                                                     # The last solution.
+            x0 = history[0]
+        else:                                                                       # A is close to the identity.
+            x0 = b
+
+        ## Solve, column by column.
+        x = np.empty(b.shape, dtype = np.result_type(self.dtype, b.dtype))          # x initialization.
+        for j in range(1 if b.ndim == 1 else b.shape[1]):                           # For each of the systems.
+            col   = slice(None) if b.ndim == 1 else (slice(None), j)                # The column of the system.
+            count = [0]                                                             # Counter of the iterations.
+            extra = {'callback_type': 'pr_norm'} if self.method is spla.gmres else {}
+            xj, info = self.method(self.A, b[col], x0 = x0[col], M = self.M, callback = lambda _: count.__setitem__(0, count[0] + 1),
+                                   **self.options, **extra)
+            x[col] = xj                                                             # The solution of the system.
+            self.iterations.append(count[0])                                        # The iterations are saved.
+            self.info.append(info)                                                  # The convergence flag is saved.
+            if info != 0:                                                           # The solve did not converge.
+                warnings.warn('A Krylov solve did not converge (info = %d, %d iterations), the time level is inaccurate.' % (info, count[0]),
+                              RuntimeWarning)
+
+        ## History update.
+        self.history = (history + [x])[-2:]                                         # The last two solutions are kept.
+
+        return x
+
+def Radius(A, tol = 1e-3):
+    """
+    Radius
+    Function to estimate the spectral radius of a sparse matrix.
+
+    The eigenvalue of largest magnitude is found with a few implicitly restarted Arnoldi (Lanczos) iterations, so only sparse
+    matrix-vector products with A are needed. Small matrices are solved directly.
+
+    Input:
+        A           m x m           sparse matrix   Matrix whose spectral radius is estimated.
+        tol                         float           Relative tolerance of the eigenvalue (Default: 1e-3).
+
+    Output:
+        rho                         float           Spectral radius of A.
+    """
+
+    ## Variable initialization.
+    A = sparse.csr_matrix(A)                                                        # CSR format for the matrix-vector products.
+
+    ## Spectral radius.
+    if A.shape[0] < 64:                                                             # Small matrices are solved directly.
+        return float(np.abs(np.linalg.eigvals(A.toarray())).max(initial = 0))
+    lam = spla.eigs(A, k = 1, which = 'LM', tol = tol, return_eigenvectors = False) # The eigenvalue of largest magnitude.
+
+    return float(np.abs(lam).max())
+
+def Growth(K, steps, order = 2, seed = 0):
+    """
+    Growth
+    Function to measure the growth of the energy of the explicit scheme over a run.
+
+    The homogeneous explicit scheme u^{k+1} = 2u^k - u^{k-1} + Su^k, with S = K (or K + K^2/12 for the fourth-order scheme), is
+    advanced from a random initial condition with zero velocity. The spectral radius does not bound this growth, since the GFD
+    Laplacian is not symmetric and its eigenvalues off the negative real axis grow for any time step.
+
+    Input:
+        K           m x m           sparse matrix   c^2 dt^2 times the Laplacian between the inner nodes.
+        steps                       int             Number of time steps of the run.
+        order                       int             Order of the time integrator, 2 or 4 (Default: 2).
+        seed                        int             Seed of the random initial condition (Default: 0).
+
+    Output:
+        growth                      float           Largest ratio between the energy at a time level and the initial energy.
+    """
+
+    ## Variable initialization.
+    K      = sparse.csr_matrix(K)                                                   # CSR format for the matrix-vector products.
+    S      = (lambda u: K@u + K@(K@u)/12) if order == 4 else (lambda u: K@u)        # The spatial part of the time step.
+    u      = np.random.default_rng(seed).standard_normal(K.shape[0])                # The random initial condition.
+    energy = u@u                                                                    # The initial energy.
+    up, u  = u, u + S(u)/2                                                          # The first time level, with zero velocity.
+    growth = 1.0                                                                    # growth initialization.
+
+    ## Homogeneous explicit scheme.
+    with np.errstate(over = 'ignore', invalid = 'ignore'):                          # A growing run may overflow.
+        for _ in range(steps - 1):                                                  # For all the other time levels.
+            up, u  = u, 2*u - up + S(u)                                             # The new time level is computed.
+            growth = max(growth, np.sqrt((u@u + up@up)/(2*energy)))                 # The energy of the last two time levels.
+            if not np.isfinite(growth):                                             # The run already overflowed.
+                return np.inf
+
+    return float(growth)
+
+def Rows(K, index):
+    """
+    Rows
+    Function to keep some rows of a time-stepping operator for the fused stepping engine, the other rows are set to zero.
+
+    Input:
+        K           m x m           matrix          Sparse or dense matrix, or a Shifted operator.
+        index       r               ndarray         Integer array with the rows to keep.
+
+    Output:
+        S           m x m           matrix          The matrix (K.K for a Shifted operator) with only the kept rows.
+        shift                       float           The shift of a Shifted operator (0 otherwise).
+    """
+
+    ## Variable initialization.
+    shift = 0                                                                       # No shift for a plain matrix.
+    if isinstance(K, Shifted):                                                      # For the single precision operators.
+        K, shift = K.K, K.shift                                                     # The shift is applied apart.
+    keep        = np.zeros(K.shape[0], dtype = bool)                                # The rows to keep.
+    keep[index] = True
+
+    ## Rows removal.
+    if sparse.issparse(K):                                                          # For the sparse operators.
+        S = sparse.csr_matrix(K, copy = True)                                       # A copy in CSR format.
+        S.data[~np.repeat(keep, np.diff(S.indptr))] = 0                             # The other rows are set to zero.
+        S.eliminate_zeros()
+        S.sort_indices()                                                            # Sorted columns for the matrix-vector products.
+    else:                                                                           # For the dense operators.
+        S = np.array(K, order = 'C')                                                # A contiguous copy.
+        S[~keep] = 0                                                                # The other rows are set to zero.
+
+    return S, shift
+
+def Product(S, x, y):
+    """
+    Product
+    Function to compute y = S x in place, without allocating the result.
+
+    Sparse matrices use the CSR kernels of SciPy, dense matrices use np.dot with out. When the types or the layouts do not allow
+    an in-place product, S x is computed as usual and copied into y.
+
+    Input:
+        S           r x m           matrix          Sparse (CSR) or dense matrix.
+        x           m (x n)         ndarray         Vector or matrix to multiply.
+        y           r (x n)         ndarray         Buffer where the product is written.
+    """
+
+    ## Matrix-vector product.
+    inplace = x.dtype == y.dtype == S.dtype and x.flags.c_contiguous and y.flags.c_contiguous
+    if sparse.issparse(S) and inplace and _sparsetools is not None:                 # For the sparse operators.
+        y.fill(0)                                                                   # The kernels add to y.
+        if x.ndim == 1:                                                             # For a single vector.
+            _sparsetools.csr_matvec(S.shape[0], S.shape[1], S.indptr, S.indices, S.data, x, y)
+        else:                                                                       # For several vectors.
+            _sparsetools.csr_matvecs(S.shape[0], S.shape[1], x.shape[1], S.indptr, S.indices, S.data, x.ravel(), y.ravel())
+    elif not sparse.issparse(S) and inplace:                                        # For the dense operators.
+        np.dot(S, x, out = y)                                                       # The product is written in y.
+    else:                                                                           # Any other case.
+        y[...] = S@x                                                                # The product is copied into y.
+
+def Partition(S, parts):
+    """
+    Partition
+    Function to split the rows of a matrix into contiguous blocks with about the same number of nonzeros.
+
+    Input:
+        S           r x m           matrix          Sparse (CSR) or dense matrix.
+        parts                       int             Number of blocks.
+
+    Output:
+        bounds      parts + 1       ndarray         The block j holds the rows bounds[j], ..., bounds[j + 1] - 1.
+    """
+
+    ## Variable initialization.
+    r = S.shape[0]                                                                  # The number of rows.
+    if sparse.issparse(S):                                                          # For the sparse operators.
+        nnz = S.indptr                                                              # Cumulative number of nonzeros of the rows.
+    else:                                                                           # For the dense operators.
+        nnz = np.arange(r + 1)                                                      # All the rows have the same cost.
+
+    ## Blocks.
+    bounds = np.searchsorted(nnz, np.linspace(0, nnz[-1], parts + 1))               # Rows where each block starts.
+    bounds[0], bounds[-1] = 0, r                                                    # The first and the last rows.
+
+    return np.maximum.accumulate(bounds)
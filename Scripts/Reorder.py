@@ -0,0 +1,164 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Reordering of the nodes of a cloud.
+
+The nodes in the region files are in the order of the mesh generator, with the boundary nodes first, so the neighbors of a node
+are scattered all over the arrays. Renumbering the nodes so that neighbors get close indexes narrows the band of K, which
+improves the cache locality of the matrix-vector products and reduces the fill-in of the sparse LU factorizations.
+"""
+
+## Library importation.
+import numpy as np
+from scipy import sparse
+from scipy.sparse import csgraph
+import Scripts.Neighbors as Neighbors
+
+def Permutation(p, tt = None, method = 'rcm', nvec = 8):
+    """
+    Permutation
+    Function to compute a new order for the nodes of a cloud.
+
+    Input:
+        p           m x 3           ndarray         Array with the coordinates of the nodes and a flag for the boundary.
+        tt          n x 3           ndarray         Array with the correspondence of the n triangles (Default: None).
+        method                      string          Reordering method:
+                                                        'rcm': Reverse Cuthill-McKee on the neighbor graph (Default).
+                                                               The graph of the triangulation is used if tt is given, the
+                                                               graph of the nvec nearest neighbors otherwise.
+                                                        'hilbert': Sort of the coordinates along a Hilbert curve.
+        nvec                        int             Maximum number of neighbors of the graph without triangulation (Default: 8).
+
+    Output:
+        perm        m               ndarray         The node i of the new order is the node perm[i] of p.
+    """
+
+    ## Variable initialization.
+    m = len(p[:, 0])                                                                # The total number of nodes.
+
+    ## Reordering.
+    if method == 'rcm':                                                             # Reverse Cuthill-McKee.
+        if tt is not None:                                                          # The graph of the triangulation.
+            tt              = np.asarray(tt, dtype = int)                           # The triangles as integer indexes.
+            tt              = tt - 1 if tt.min() == 1 else tt                       # Triangles with zero-based indexes.
+            indptr, indices = Neighbors.Adjacency(tt, m)                            # Adjacency of the triangulation.
+        else:                                                                       # The graph of the nearest neighbors.
+            vec     = Neighbors.Cloud(p, nvec)                                      # The neighbors of each node.
+            valid   = vec >= 0                                                      # The existing neighbors.
+            indptr  = np.concatenate([[0], np.cumsum(valid.sum(axis = 1))])         # Pointers to the neighbors of each node.
+            indices = vec[valid]                                                    # The neighbors of all the nodes.
+        graph = sparse.csr_matrix((np.ones(len(indices)), indices, indptr), shape = (m, m))
+                                                                                    # The neighbor graph.
+        perm  = csgraph.reverse_cuthill_mckee(graph, symmetric_mode = False)        # The graph is symmetrized by the routine.
+    elif method == 'hilbert':                                                       # Hilbert curve.
+        perm  = np.argsort(Hilbert(p[:, 0], p[:, 1]), kind = 'stable')              # The nodes are sorted along the curve.
+    else:
+        raise ValueError("Unknown reordering method '%s'." % method)
+
+    return np.asarray(perm, dtype = int)
+
+def Hilbert(x, y, bits = 16):
+    """
+    Hilbert
+    Function to compute the position of some points along a Hilbert curve.
+
+    The coordinates are scaled to a 2^bits x 2^bits grid, and the positions of all the points are computed together, one bit
+    at a time.
+
+    Input:
+        x           m               ndarray         x coordinates of the points.
+        y           m               ndarray         y coordinates of the points.
+        bits                        int             Number of bits of each coordinate (Default: 16).
+
+    Output:
+        d           m               ndarray         Position of each point along the curve.
+    """
+
+    ## Variable initialization.
+    n    = 2**bits                                                                  # The size of the grid.
+    span = max(np.ptp(x), np.ptp(y)) or 1.0                                         # The same scale is used for both axes.
+    X    = np.minimum(((x - np.min(x))/span*n).astype(np.int64), n - 1)             # Integer x coordinates.
+    Y    = np.minimum(((y - np.min(y))/span*n).astype(np.int64), n - 1)             # Integer y coordinates.
+    d    = np.zeros(len(X), dtype = np.int64)                                       # d initialization with zeros.
+
+    ## Curve position.
+    s = n//2
+    while s > 0:                                                                    # From the most significant bit.
+        rx = (X & s) > 0                                                            # The quadrant of each point.
+        ry = (Y & s) > 0
+        d += s*s*((3*rx) ^ ry)                                                      # The position of the quadrant.
+        flip    = ~ry & rx                                                          # The quadrant is rotated.
+        X[flip] = n - 1 - X[flip]
+        Y[flip] = n - 1 - Y[flip]
+        swap    = ~ry
+        X[swap], Y[swap] = Y[swap], X[swap]
+        s //= 2
+
+    return d
+
+def Restore(vec, perm):
+    """
+    Restore
+    Function to take the neighbors of a reordered cloud back to the original order.
+
+    Input:
+        vec         m x o           ndarray         The neighbors of the reordered cloud (-1 for no neighbor).
+        perm        m               ndarray         The order used, as returned by Permutation.
+
+    Output:
+        vec         m x o           ndarray         The neighbors with the original indexes and in the original order.
+    """
+
+    ## Neighbors.
+    out       = np.full_like(vec, -1)                                               # out initialization with no neighbors.
+    out[perm] = np.where(vec >= 0, perm[np.maximum(vec, 0)], -1)                    # The rows and the indexes are renumbered.
+
+    return out
+
+def Renumber(vec, perm):
+    """
+    Renumber
+    Function to take the neighbors of a cloud to a new order of its nodes.
+
+    The columns of each row are kept, so each node keeps its neighbors in the same order (Restore undoes this function).
+
+    Input:
+        vec         m x o           ndarray         The neighbors of the cloud in the original order (-1 for no neighbor).
+        perm        m               ndarray         The new order, as returned by Permutation.
+
+    Output:
+        vec         m x o           ndarray         The neighbors with the new indexes and in the new order.
+    """
+
+    ## Neighbors.
+    inv = np.argsort(perm)                                                          # The new index of each node.
+    vec = np.asarray(vec)[perm]                                                     # The rows in the new order.
+
+    return np.where(vec >= 0, inv[np.maximum(vec, 0)], -1)
+
+def Hook(callback, inv, k, tk, u, elapsed):
+    """
+    Hook
+    Function to call a per-step callback of Wave_2D with the solution in the original order of the nodes.
+
+    Input:
+        callback                    function        The callback, called as callback(k, tk, u, elapsed).
+        inv         m               ndarray         The new index of each node (argsort of the permutation).
+        k, tk, u, elapsed                           The arguments of the callback, with u in the new order.
+    """
+
+    callback(k, tk, u[inv], elapsed)
@@ -0,0 +1,160 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Phase timers for the solvers.
+
+A Stats object is passed to the solvers to record the wall time and the peak memory of each of their phases. When no Stats
+object is given, the phases are entered through a null context, so the solvers run exactly as before. The time stepping is
+a generator, so it is timed step by step with Timed, and the time spent by the caller between the steps is left out.
+"""
+
+## Library importation.
+import time
+import contextlib
+import tracemalloc
+try:
+    import resource
+except ImportError:                                                                 # The peak resident memory is only available on Unix.
+    resource = None
+
+class Stats:
+    """
+    Stats
+    Class to record the wall time and the peak memory of the phases of a run.
+
+    Each phase is recorded in the phases dict as {'seconds': ..., 'peak_mb': ...} or {'seconds': ..., 'rss_mb': ...}. A phase
+    entered several times accumulates its time and keeps its largest peak.
+
+    Input:
+        memory                      bool            Select how the peak memory is measured.
+                                                        True: peak_mb, the peak of the allocations during the phase, traced
+                                                              with tracemalloc (slower).
+                                                        False: rss_mb, the peak resident memory of the process up to the end of
+                                                               the phase (Default). It is not a peak of the phase, it only grows
+                                                               along the run.
+    """
+
+    def __init__(self, memory = False):
+        ## Variable initialization.
+        self.memory     = memory                                                    # If the allocations are traced.
+        self.phases     = {}                                                        # The records of the phases.
+        self.steps      = 0                                                         # Number of computed time steps.
+        self.iterations = []                                                        # Iterations of each Krylov solve, if any.
+        self.failures   = 0                                                         # Number of Krylov solves that did not converge.
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """
+        phase
+        Context manager to record a phase.
+
+        Input:
+            name                    string          Name of the phase.
+        """
+
+        ## Variable initialization.
+        if self.memory == True:                                                     # If the allocations are traced.
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+            tracemalloc.reset_peak()                                                # The peak of this phase.
+        start = time.perf_counter()                                                 # Start time of the phase.
+
+        ## Phase.
+        try:
+            yield self
+        finally:
+            seconds = time.perf_counter() - start                                   # Wall time of the phase.
+            if self.memory == True:                                                 # Peak of the traced allocations.
+                field, peak = 'peak_mb', tracemalloc.get_traced_memory()[1]/2**20
+            elif resource is not None:                                              # Peak resident memory of the process.
+                field, peak = 'rss_mb', resource.getrusage(resource.RUSAGE_SELF).ru_maxrss/1024
+            else:
+                field, peak = 'rss_mb', float('nan')
+            record = self.phases.setdefault(name, {'seconds': 0.0, field: 0.0})
+            record['seconds'] += seconds                                            # The time is accumulated.
+            record[field]      = max(record[field], peak)                           # The largest peak is kept.
+
+    def total(self):
+        """
+        total
+        Function to compute the total wall time of the recorded phases.
+
+        Output:
+            seconds                 float           Total wall time.
+        """
+
+        return sum(record['seconds'] for record in self.phases.values())
+
+    def __repr__(self):
+        field = 'peak_mb' if self.memory == True else 'rss_mb'                      # The memory field of the records.
+        lines = ['%-12s %10.4f s %10.1f MB %s' % (name, record['seconds'], record[field], field[:-3]) for name, record in self.phases.items()]
+        if self.steps:
+            lines.append('%d steps, %1.1f steps/s' % (self.steps, self.steps/max(self.phases.get('stepping', {'seconds': 0})['seconds'], 1e-12)))
+        if self.iterations:
+            lines.append('%d Krylov solves, %1.1f iterations per solve, %d at most' % (len(self.iterations), sum(self.iterations)/len(self.iterations),
+                                                                                       max(self.iterations)))
+        if self.failures:
+            lines.append('%d Krylov solves did not converge' % self.failures)
+        return '\n'.join(lines)
+
+def Phase(stats, name):
+    """
+    Phase
+    Function to enter a phase of a run, with a null context when there are no Stats.
+
+    Input:
+        stats                       Stats           The Stats of the run (None when instrumentation is disabled).
+        name                        string          Name of the phase.
+
+    Output:
+        context                                     Context manager of the phase.
+    """
+
+    if stats is None:                                                               # Instrumentation disabled.
+        return contextlib.nullcontext()
+    return stats.phase(name)
+
+def Timed(stats, name, steps):
+    """
+    Timed
+    Function to record a phase that runs as a generator.
+
+    Only the work of the generator is timed. The time spent by the caller between two items (storing or plotting a time level)
+    is not part of the phase.
+
+    Input:
+        stats                       Stats           The Stats of the run (None when instrumentation is disabled).
+        name                        string          Name of the phase.
+        steps                       generator       The generator of the phase.
+
+    Output:
+        item                                        The items of the generator.
+    """
+
+    if stats is None:                                                               # Instrumentation disabled.
+        yield from steps
+        return
+    try:
+        while True:
+            with stats.phase(name):                                                 # Only the computation of the next item is timed.
+                try:
+                    item = next(steps)
+                except StopIteration:                                               # The generator is exhausted.
+                    return
+            yield item
+    finally:
+        steps.close()                                                               # The generator is closed if the caller stops early.
@@ -0,0 +1,228 @@
+"""
+All the codes presented below were developed by:
+    Dr. Gerardo Tinoco Guerrero
+    Universidad Michoacana de San Nicolás de Hidalgo
+    gerardo.tinoco@umich.mx
+
+With the funding of:
+    National Council of Humanities, Sciences and Technologies, CONAHCyT (Consejo Nacional de Humanidades, Ciencias y Tecnologías, CONAHCyT). México.
+    Coordination of Scientific Research, CIC-UMSNH (Coordinación de la Investigación Científica de la Universidad Michoacana de San Nicolás de Hidalgo, CIC-UMSNH). México
+    Aula CIMNE-Morelia. México
+
+Date:
+    October, 2026.
+
+Last Modification:
+    October, 2026.
+
+Chunked, compressed on-disk store for solution histories.
+
+A store is a folder with a meta.json file and one file per chunk. The m x t history is split into blocks of node_block nodes by
+time_block time levels, and each chunk is byte-shuffled and compressed with zlib. Time levels can be appended while the solver
+runs, and any time range or node subset can be read back decompressing only the chunks it touches.
+"""
+
+## Library importation.
+import os
+import json
+import zlib
+import numpy as np
+import Scripts.Files as Files
+
+class Writer:
+    """
+    Writer
+    Class to append time levels to a store.
+
+    The time levels are buffered until a time block is complete, and then each of its node blocks is written as a chunk.
+    An existing store is opened for appending, so an interrupted run can continue writing after its last saved time level.
+    
+    Input:
+        folder                      string          Folder of the store.
+        m                           int             The total number of nodes.
+        meta                        dict            Metadata of the store (cloud, parameters, etc.).
+        time_block                  int             Number of time levels in each chunk (Default: 64).
+        node_block                  int             Number of nodes in each chunk (Default: 4096).
+        dtype                       type            Type of the stored values (Default: float64).
+        level                       int             zlib compression level (Default: 1).
+    """
+
+    def __init__(self, folder, m, meta = None, time_block = 64, node_block = 4096, dtype = np.float64, level = 1):
+        ## Variable initialization.
+        self.folder = folder                                                        # Folder of the store.
+        self.level  = level                                                         # zlib compression level.
+        os.makedirs(folder, exist_ok = True)                                        # The folder is created if needed.
+
+        ## Store header.
+        if os.path.exists(os.path.join(folder, 'meta.json')):                       # An existing store is opened for appending.
+            self.head = Meta(folder)                                                # The header of the store.
+        else:                                                                       # A new store is created.
+            self.head = {'m': int(m), 'dtype': np.dtype(dtype).str, 'time_block': int(time_block), 'node_block': int(node_block),
+                         'T': [], 'meta': meta or {}}
+
+        ## Buffer of the current time block.
+        self.buffer = np.zeros([self.head['m'], self.head['time_block']], dtype = self.head['dtype'])
+                                                                                    # The buffer is initialized with zeros.
+        self.count  = len(self.head['T'])%self.head['time_block']                   # Time levels already in the current time block.
+        if self.count > 0:                                                          # If the last time block is partial.
+            start = len(self.head['T']) - self.count                                # First time level of the block.
+            self.buffer[:, :self.count] = Read(folder, start, len(self.head['T']))[0]
+                                                                                    # The partial block is reloaded.
+
+    def append(self, u, time):
+        """
+        Append a time level to the store.
+        
+        Input:
+            u           m x 1           ndarray         Solution at the time level.
+            time                        float           Time of the time level.
+        """
+        self.buffer[:, self.count] = u                                              # The time level is buffered.
+        self.head['T'].append(float(time))                                          # The time is saved.
+        self.count += 1                                                             # Increase the counter by 1.
+        if self.count == self.head['time_block']:                                   # If the time block is complete.
+            self.flush()                                                            # The time block is written.
+            self.count = 0                                                          # A new time block starts.
+
+    def flush(self):
+        """
+        Write the current time block (complete or partial) and the header of the store.
+        """
+        tb = (len(self.head['T']) - 1)//self.head['time_block']                     # Index of the current time block.
+        for nb, n0 in enumerate(range(0, self.head['m'], self.head['node_block'])): # For each node block.
+            chunk = self.buffer[n0:n0 + self.head['node_block'], :self.count]       # The chunk of the time block.
+            Files.Atomic(os.path.join(self.folder, '%06d_%06d.z' % (tb, nb)), lambda file: file.write(Compress(chunk, self.level)))
+        Files.Atomic(os.path.join(self.folder, 'meta.json'), lambda file: json.dump(self.head, file), binary = False)
+
+    def close(self):
+        """
+        Write the last partial time block, if any.
+        """
+        if self.count > 0:                                                          # If there are buffered time levels.
+            self.flush()                                                            # The partial time block is written.
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+def Save(folder, u, T, meta = None, time_block = 64, node_block = 4096, dtype = np.float64):
+    """
+    Save
+    Function to save a whole solution history into a new store.
+    
+    Input:
+        folder                      string          Folder of the store.
+        u           m x t           ndarray         Array with the solution history.
+        T           t x 1           ndarray         Array with the times of the time levels.
+        meta                        dict            Metadata of the store (cloud, parameters, etc.).
+        time_block, node_block, dtype               Same as in Writer.
+    
+    Output:
+        None
+    """
+
+    ## Store writing.
+    with Writer(folder, u.shape[0], meta, time_block, node_block, dtype) as store:
+        for k in np.arange(u.shape[1]):                                             # For each time level.
+            store.append(u[:, k], T[k])                                             # The time level is appended.
+
+def Read(folder, start = 0, stop = None, nodes = None):
+    """
+    Read
+    Function to read a time range and a node subset from a store. Only the chunks that contain them are decompressed.
+    
+    Input:
+        folder                      string          Folder of the store.
+        start                       int             First time level to read (Default: 0).
+        stop                        int             Time level after the last one to read (Default: all).
+        nodes       n x 1           ndarray         Indices of the nodes to read (Default: all).
+    
+    Output:
+        u           n x s           ndarray         Array with the solution at the nodes and time levels.
+        T           s x 1           ndarray         Array with the times of the time levels.
+    """
+
+    ## Variable initialization.
+    head  = Meta(folder)                                                            # The header of the store.
+    m, tb, nb = head['m'], head['time_block'], head['node_block']                   # Size of the store and of its chunks.
+    t     = len(head['T'])                                                          # The number of time levels in the store.
+    stop  = t if stop is None else min(stop, t)                                     # The last time level to read.
+    nodes = np.arange(m) if nodes is None else np.asarray(nodes).reshape(-1)        # The nodes to read.
+    T     = np.array(head['T'][start:stop])                                         # The times of the time levels.
+    u     = np.zeros([len(nodes), len(T)], dtype = head['dtype'])                   # u initialization with zeros.
+
+    ## Chunks reading.
+    for i in np.unique(nodes//nb):                                                  # For each node block that is needed.
+        rows = np.flatnonzero(nodes//nb == i)                                       # The requested nodes in the block.
+        for j in range(start//tb, (stop - 1)//tb + 1 if stop > start else 0):       # For each time block that is needed.
+            k0, k1 = max(start, j*tb), min(stop, (j + 1)*tb)                        # The requested time levels in the block.
+            n      = min(tb, t - j*tb)                                              # The number of time levels in the chunk.
+            chunk  = Decompress(os.path.join(folder, '%06d_%06d.z' % (j, i)), head['dtype'], (min(nb, m - i*nb), n))
+                                                                                    # The chunk is decompressed.
+            u[rows, k0 - start:k1 - start] = chunk[nodes[rows] - i*nb, k0 - j*tb:k1 - j*tb]
+                                                                                    # The requested values are copied.
+
+    return u, T
+
+def Meta(folder):
+    """
+    Meta
+    Function to read the header of a store (sizes, times and metadata).
+    
+    Input:
+        folder                      string          Folder of the store.
+    
+    Output:
+        head                        dict            The header of the store.
+    """
+
+    ## Header reading.
+    with open(os.path.join(folder, 'meta.json')) as file:
+        head = json.load(file)                                                      # The header is parsed.
+
+    return head
+
+def Compress(chunk, level = 1):
+    """
+    Compress
+    Function to byte-shuffle and compress a chunk. Shuffling groups the bytes of equal significance, which compresses much better.
+    
+    Input:
+        chunk       n x s           ndarray         The chunk to be compressed.
+        level                       int             zlib compression level (Default: 1).
+    
+    Output:
+        data                        bytes           The compressed chunk.
+    """
+
+    ## Compression.
+    chunk = np.ascontiguousarray(chunk)                                             # The chunk is stored contiguously.
+    data  = chunk.view(np.uint8).reshape(-1, chunk.dtype.itemsize).T.tobytes()      # The bytes are shuffled.
+    data  = zlib.compress(data, level)                                              # The bytes are compressed.
+
+    return data
+
+def Decompress(path, dtype, shape):
+    """
+    Decompress
+    Function to read, decompress and unshuffle a chunk.
+    
+    Input:
+        path                        string          File of the chunk.
+        dtype                       type            Type of the stored values.
+        shape                       tuple           Shape of the chunk.
+    
+    Output:
+        chunk       n x s           ndarray         The decompressed chunk.
+    """
+
+    ## Decompression.
+    with open(path, 'rb') as file:
+        data = zlib.decompress(file.read())                                         # The bytes are decompressed.
+    size  = np.dtype(dtype).itemsize                                                # The number of bytes of each value.
+    data  = np.frombuffer(data, dtype = np.uint8).reshape(size, -1).T               # The bytes are unshuffled.
+    chunk = np.ascontiguousarray(data).view(dtype).reshape(shape)                   # The chunk with its shape.
+
+    return chunk
@@ -0,0 +1,11 @@
+"""
+Configuration of the tests.
+
+The tests are run from any folder with python -m pytest Tests, so the root of the repository is added to the path.
+"""
+
+## Library importation.
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
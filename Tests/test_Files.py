@@ -0,0 +1,27 @@
+"""
+Tests of the atomic writing of files (Scripts/Files).
+"""
+
+## Library importation.
+import os
+import pytest
+import Scripts.Files as Files
+
+def test_write(tmp_path):
+    path = os.path.join(tmp_path, 'folder', 'data.txt')                             # The folder is created.
+    Files.Atomic(path, lambda file: file.write('new'), binary = False)
+    assert open(path).read() == 'new'
+    assert os.listdir(os.path.dirname(path)) == ['data.txt']
+
+def test_failure(tmp_path):
+    path = os.path.join(tmp_path, 'data.bin')
+    Files.Atomic(path, lambda file: file.write(b'old'))
+
+    def writer(file):                                                               # A run killed while writing.
+        file.write(b'partial')
+        raise KeyboardInterrupt
+
+    with pytest.raises(KeyboardInterrupt):
+        Files.Atomic(path, writer)
+    assert open(path, 'rb').read() == b'old'                                        # The previous file is kept.
+    assert os.listdir(tmp_path) == ['data.bin']                                     # No temporary file is left.
@@ -0,0 +1,45 @@
+"""
+Tests of the explicit and implicit schemes on the generated clouds (Scripts/Generator).
+"""
+
+## Library importation.
+import os
+import warnings
+import numpy as np
+import pytest
+import Wave_2D
+import Scripts.Generator as Generator
+import Scripts.Loader as Loader
+
+## Problem parameters.
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))                 # Root of the repository.
+c    = np.sqrt(1/2)                                                                 # Wave propagation velocity.
+cho  = 1                                                                            # Function boundary condition.
+r    = np.array([0.5, 0.5])                                                         # Not used by f and g.
+
+def f(x, y, t, c, cho, r):
+    return np.sin(np.pi*x)*np.sin(np.pi*y)*np.cos(np.sqrt(2)*np.pi*c*t)
+
+def g(x, y, t, c, cho, r):
+    return -np.sqrt(2)*np.pi*c*np.sin(np.pi*x)*np.sin(np.pi*y)*np.sin(np.sqrt(2)*np.pi*c*t)
+
+def Region(region, m):
+    p, tt = Loader.Load(os.path.join(root, 'Data', 'Clouds'), 3, region)           # The largest bundled cloud of the region.
+    tt    = np.array(tt) - 1 if np.min(tt) == 1 else np.array(tt)                   # Triangles with zero-based indexes.
+    return Generator.Region(np.array(p), tt, m)[0]
+
+@pytest.mark.parametrize('region', ['ENG', 'TIT'])
+def test_explicit(region):
+    p = Region(region, 5000)                                                        # The explicit scheme is bounded on this cloud.
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        t, _, _, implicit, _, *_ = Wave_2D.Stable(p, c)
+        er = Wave_2D.Cloud_Error(p, f, g, t, c, cho, r, sparse = True)[1]
+    assert implicit == False
+    assert er.max() < 1e-3
+
+def test_implicit():
+    p = Region('TIT', 20000)                                                        # The explicit scheme grows on this cloud.
+    with pytest.warns(RuntimeWarning, match = 'the implicit scheme is used'):
+        er = Wave_2D.Cloud_Error(p, f, g, None, c, cho, r, sparse = True)[1]
+    assert er.max() < 1e-3
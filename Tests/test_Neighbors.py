@@ -0,0 +1,25 @@
+"""
+Tests of the KD-tree neighbor search (Scripts/Neighbors, mode 3) against the optimized search (mode 2).
+"""
+
+## Library importation.
+import numpy as np
+import pytest
+import Scripts.Neighbors as Neighbors
+
+def Outlier(m, seed = 0):
+    rng = np.random.default_rng(seed)                                               # A uniform cloud and a far node.
+    p   = np.column_stack([rng.random((m, 2)), np.zeros(m)])
+    return np.vstack([p, [3, 3, 0]])
+
+def Cluster(m, seed = 0):
+    rng = np.random.default_rng(seed)                                               # A sparse cloud with a dense cluster.
+    p   = np.vstack([rng.random((m//2, 2)), 0.5 + 0.01*rng.random((m//2, 2))])
+    return np.column_stack([p, (p[:, 0] < 0.02).astype(float)])
+
+@pytest.mark.parametrize('cloud', [Outlier, Cluster])
+def test_mode_2(cloud):
+    p    = cloud(1500)
+    dist = Neighbors.find_distances(p, mode = 2)
+    assert Neighbors.find_distances(p, mode = 3) == dist
+    assert np.array_equal(Neighbors.find_neighbors(p, dist, 8, mode = 3), Neighbors.find_neighbors(p, dist, 8, mode = 2))
@@ -0,0 +1,25 @@
+"""
+Tests of the output time levels of the streaming runs (Wave_2D.Schedule).
+"""
+
+## Library importation.
+import numpy as np
+import pytest
+import Wave_2D
+
+def test_every():
+    out = Wave_2D.Schedule(np.linspace(0, 1, 11), 5)                                # Every 5 time steps.
+    assert np.flatnonzero(out).tolist() == [0, 5, 10]
+
+def test_final():
+    out = Wave_2D.Schedule(np.linspace(0, 1, 11))                                   # Only the final time level.
+    assert np.flatnonzero(out).tolist() == [10]
+
+def test_times():
+    out = Wave_2D.Schedule(np.linspace(0, 1, 11), [0.31, 0.7])                      # The closest time levels.
+    assert np.flatnonzero(out).tolist() == [3, 7]
+
+@pytest.mark.parametrize('snapshots', [0, -2])
+def test_invalid(snapshots):
+    with pytest.raises(ValueError, match = 'snapshots must be at least 1'):
+        Wave_2D.Schedule(np.linspace(0, 1, 11), snapshots)
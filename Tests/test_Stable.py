@@ -0,0 +1,43 @@
+"""
+Tests of the automatic time step of the explicit scheme (Wave_2D.Stable).
+"""
+
+## Library importation.
+import os
+import warnings
+import numpy as np
+import pytest
+import Wave_2D
+import Scripts.Loader as Loader
+
+## Problem parameters.
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))                 # Root of the repository.
+c    = np.sqrt(1/2)                                                                 # Wave propagation velocity.
+cho  = 1                                                                            # Function boundary condition.
+r    = np.array([0.5, 0.5])                                                         # Not used by f and g.
+
+def f(x, y, t, c, cho, r):
+    return np.sin(np.pi*x)*np.sin(np.pi*y)*np.cos(np.sqrt(2)*np.pi*c*t)
+
+def g(x, y, t, c, cho, r):
+    return -np.sqrt(2)*np.pi*c*np.sin(np.pi*x)*np.sin(np.pi*y)*np.sin(np.sqrt(2)*np.pi*c*t)
+
+def Region(region):
+    p, _ = Loader.Load(os.path.join(root, 'Data', 'Clouds'), 3, region)            # The largest bundled cloud of the region.
+    return np.array(p)
+
+@pytest.mark.parametrize('order', [2, 4])
+def test_growing(order):
+    p = Region('CAB')                                                               # The explicit scheme grows on this cloud.
+    with pytest.warns(RuntimeWarning, match = 'the implicit scheme is used'):
+        er = Wave_2D.Cloud_Error(p, f, g, None, c, cho, r, sparse = True, order = order)[1]
+    assert er.max() < 1e-3
+
+def test_explicit():
+    p = Region('CUI')                                                               # The explicit scheme is kept on this cloud.
+    with warnings.catch_warnings():
+        warnings.simplefilter('error', RuntimeWarning)
+        t, _, _, implicit, order, *_ = Wave_2D.Stable(p, c)
+        er = Wave_2D.Cloud_Error(p, f, g, t, c, cho, r, sparse = True)[1]
+    assert (implicit, order) == (False, 2)
+    assert er.max() < 1e-3
@@ -13,15 +13,30 @@ Date:
     November, 2022.
 
 Last Modification:
-    March, 2024.
+    October, 2026.
 """
 
 ## Library importation.
+import os
+import time
+import warnings
 import numpy as np
+from itertools import repeat
+from functools import partial
+from concurrent.futures import ThreadPoolExecutor
+from scipy import sparse as sp
+import Scripts.Cache as Cache
+import Scripts.Checkpoint as Checkpoint
+import Scripts.Conditions as Conditions
+import Scripts.Errors as Errors
 import Scripts.Gammas as Gammas
 import Scripts.Neighbors as Neighbors
+import Scripts.Operators as Operators
+import Scripts.Reorder as Reorder
+import Scripts.Stats as Stats
 
-def Cloud(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5):
+def Cloud(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = False, exact = True, cache = False, stats = None, callback = None,
+          order = 2, krylov = None, dtype = np.float64, workers = 1, reorder = None, checkpoint = None):
     '''
     Numerical solution of the 2D wave equation on irregular domains using a Meshless Generalized Finite Difference Scheme.
     
@@ -35,8 +50,12 @@ def Cloud(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = Fa
     Input:
         p           m x 2           ndarray         Array with the coordinates of the nodes.
         f                           function        Function declared with the boundary condition.
+                                                        It can also be a separable pair (fs, ft), see Conditions.Evaluate.
         g                           function        Function declared with the boundary condition.
+                                                        It can also be a separable pair (fs, ft), see Conditions.Evaluate.
         t                           int             Number of time steps to be considered.
+                                                        None: The largest stable time step of the explicit scheme (see Stable).
+                                                        If the explicit scheme grows on the cloud, the implicit one is used.
         c                           float           Wave propagation velocity.
         cho                         int             Approximation Type.
                                                         (0 for zero boundary condition).
@@ -51,64 +70,847 @@ def Cloud(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = Fa
                                                         False: Explicit scheme used (Default).
         lam                         float           Lambda parameter for the implicit scheme.
                                                         Must be between 0 and 1 (Default: 0.5).
+        sparse                      bool            Select whether or not use sparse operators.
+                                                        True: Sparse K and LU-factorized implicit operators.
+                                                        False: Dense K and pseudoinverse operators (Default).
+        exact                       bool            Select whether or not compute the theoretical solution.
+                                                        True: u_ex is computed for all the time levels (Default).
+                                                        False: u_ex is not computed and None is returned.
+        cache                       bool            Select whether or not use the on-disk operator cache (see Setup).
+                                                        True: Operators are reused between runs.
+                                                        False: Operators are computed from scratch (Default).
+        stats                       Stats           Stats object to record the wall time and peak memory of each phase (see Scripts/Stats).
+                                                        None: No instrumentation (Default).
+        callback                    function        Function called after each time step as callback(k, T[k], u, elapsed).
+                                                        u is a view of the solution and elapsed the time since the stepping started.
+                                                        None: No callback (Default).
+        order                       int             Order of the time integrator.
+                                                        2: Central differences, explicit or implicit (Default).
+                                                        4: Fourth-order modified equation, explicit (implicit and lam are ignored).
+        krylov                      dict            Options of the iterative solver of the sparse implicit scheme (see Operators.Krylov).
+                                                        None: Sparse LU factorizations (Default).
+                                                        dict: Preconditioned Krylov solves, e.g. {'method': 'bicgstab', 'rtol': 1e-8}.
+        dtype                       type            Type of K, of the operators and of the solution (Default: float64).
+                                                        float32 halves the memory traffic of the time steps and the size of u_ap.
+                                                        The Gammas (pseudoinverses) and u_ex are always computed in float64.
+        workers                     int             Number of threads of the explicit scheme of order 2 (see Steps_Fused).
+                                                        1: Single-threaded time steps (Default).
+                                                        None: One thread per core.
+        reorder                     string          Reordering of the nodes before solving (see Scripts/Reorder).
+                                                        None: The nodes are used in the order of p (Default).
+                                                        'rcm': Reverse Cuthill-McKee on the neighbor graph.
+                                                        'hilbert': Sort of the coordinates along a Hilbert curve.
+                                                        The results are given back in the order of p.
+        checkpoint                  dict            Checkpoints of the restart state of the run (see Scripts/Checkpoint and Resume).
+                                                        None: No checkpoints (Default).
+                                                        dict: e.g. {'path': 'Results/run.npz', 'every': 1000, 'seconds': 600, 'resume': True}.
+                                                        A resumed run only computes the time levels after the checkpoint, the
+                                                        previous ones are NaN in u_ap.
     
     Output:
         u_ap        m x t           ndarray         Array with the approximation computed by the routine.
-        u_ex        m x t           ndarray         Array with the theoretical solution.
+        u_ex        m x t           ndarray         Array with the theoretical solution (None if exact is False).
         vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.  
     '''
     
     ## Variable initialization.
+    laplacian = None                                                                # The Laplacian of Stable, if any.
+    if t is None:                                                                   # The time step is selected automatically.
+        with Stats.Phase(stats, 'stable'):
+            t, _, _, implicit, order, *laplacian = Stable(p, c, triangulation, tt, order = order, cache = cache, implicit = implicit)
+                                                                                    # The number of time levels, the scheme, vec and A.
     m      = len(p[:, 0])                                                           # The total number of nodes is calculated.
-    nvec   = 8                                                                      # Maximum number of neighbors for each node.
     T      = np.linspace(0, 1, t)                                                   # Time discretization.
-    dt     = T[1] - T[0]                                                            # dt computation.
-    u_ap   = np.zeros([m, t])                                                       # u_ap initialization with zeros.
-    u_ex   = np.zeros([m, t])                                                       # u_ex initialization with zeros.
-    cdt    = (c**2)*(dt**2)                                                         # cdt is equals to c^2 dt^2.
+    u_ap   = np.zeros([m, t], dtype = dtype)                                        # u_ap initialization with zeros.
+    u_ex   = None                                                                   # u_ex is only computed if requested.
+    perm   = np.arange(m)                                                           # The nodes are used in the order of p.
+
+    ## Checkpoints.
+    checkpoint = Checkpoint.Open(checkpoint, p, tt if triangulation == True else None,
+                                 dict(t = t, c = c, cho = cho, r = r, triangulation = triangulation, implicit = implicit, lam = lam, sparse = sparse,
+                                      order = order, krylov = krylov, dtype = np.dtype(dtype).str, reorder = reorder), dict(cache = cache, workers = workers))
+                                                                                    # The checkpoints of the run, if any.
+
+    ## Nodes reordering.
+    if reorder is not None:                                                         # The cloud is solved in a new order.
+        with Stats.Phase(stats, 'reorder'):
+            perm = Reorder.Permutation(p, tt if triangulation == True else None, reorder)
+                                                                                    # The new order of the nodes.
+        if callback is not None:                                                    # The callback sees the original order.
+            callback = partial(Reorder.Hook, callback, np.argsort(perm))
+
+    ## Neighbor search and operators assembly.
+    operators = Setup(p, t, c, triangulation, tt, implicit and order == 2, lam, sparse, cache, stats, krylov, dtype, perm if reorder else None, laplacian)
+                                                                                    # vec and the K1, ..., K4 operators.
+    if checkpoint is not None and cache == True:                                    # The reference to the cached operators.
+        checkpoint.reference = Setup_Key(p, t, c, triangulation, tt, implicit and order == 2, lam, sparse, dtype, perm if reorder else None)
+
+    ## Generalized Finite Differences Method
+    for k, _, u in Cloud_Stream(p[perm], f, g, t, c, cho, r, snapshots = 1, operators = operators, stats = stats, callback = callback, order = order,
+                                krylov = krylov, dtype = dtype, workers = workers, checkpoint = checkpoint):
+        u_ap[perm, k] = u                                                           # Save the computed solution, in the order of p.
+    if checkpoint is not None and checkpoint.start > 0:                             # For a resumed run.
+        u_ap[:, :checkpoint.start] = np.nan                                         # The time levels before the checkpoint are unknown.
+    vec = Reorder.Restore(operators[0], perm)                                       # The neighbors of each node, in the order of p.
+
+    ## Theoretical Solution
+    if exact == True:                                                               # If the theoretical solution is requested.
+        with Stats.Phase(stats, 'exact'):
+            u_ex = Conditions.Evaluate(f, p[:, 0], p[:, 1], T, c, cho, r)           # The theoretical solution is computed for all the time steps.
+
+    return u_ap, u_ex, vec
+
+def Cloud_Error(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = False, snapshots = 1, cache = False, order = 2,
+                krylov = None, dtype = np.float64, workers = 1, reorder = None):
+    '''
+    Numerical solution of the 2D wave equation with a running error computation.
+
+    This function advances the same scheme as Cloud, but instead of the theoretical solution it returns the error of Errors.Cloud.
+    The error is accumulated at every time level while integrating, and the theoretical solution is evaluated one time level at a
+    time without ever being stored. The approximation is only kept at the requested output time levels.
+
+    Input:
+        p, f, g, t, c, cho, r, triangulation, tt, implicit, lam, sparse, cache, order, krylov, dtype, workers, reorder
+                                                    Same as in Cloud.
+        snapshots                   int/array       Output time levels, as in Cloud_Stream (Default: every time level).
+
+    Output:
+        u_ap        m x n           ndarray         Array with the approximation at the n output time levels.
+        er          t x 1           ndarray         Mean square error computed on each time step.
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+    '''
+
+    ## Nodes reordering.
+    perm = np.arange(len(p[:, 0]))                                                  # The nodes are used in the order of p.
+    if reorder is not None:                                                         # The cloud is solved in a new order.
+        perm = Reorder.Permutation(p, tt if triangulation == True else None, reorder)
+                                                                                    # The new order of the nodes.
+
+    ## Neighbor search and operators assembly.
+    laplacian = None                                                                # The Laplacian of Stable, if any.
+    if t is None:                                                                   # The time step is selected automatically.
+        t, _, _, implicit, order, *laplacian = Stable(p, c, triangulation, tt, order = order, cache = cache, implicit = implicit)
+                                                                                    # The number of time levels, the scheme, vec and A.
+    operators = Setup(p, t, c, triangulation, tt, implicit and order == 2, lam, sparse, cache, krylov = krylov, dtype = dtype,
+                      perm = perm if reorder else None, laplacian = laplacian)      # vec and the K1, ..., K4 operators.
+    q         = p[perm]                                                             # The nodes in the order of the operators.
+
+    ## Variable initialization.
+    T      = np.linspace(0, 1, t)                                                   # Time discretization.
+    out    = Schedule(T, snapshots)                                                 # Time levels to be saved.
+    u_ap   = np.zeros([len(p[:, 0]), np.count_nonzero(out)], dtype = dtype)         # u_ap initialization with zeros.
+    er     = np.zeros(t)                                                            # er initialization with zeros.
+    area   = Errors.Area(q, operators[0])                                           # The area associated to each node.
+    i      = 0                                                                      # Counter of the saved time levels.
+    u_ex   = Conditions.Stream(f, q[:, 0], q[:, 1], T, c, cho, r)                   # The theoretical solution, evaluated by blocks.
+
+    ## Generalized Finite Differences Method and running error.
+    for k, _, u in Cloud_Stream(q, f, g, t, c, cho, r, snapshots = 1, operators = operators, order = order, dtype = dtype,
+                                workers = workers):
+        er[k] = Errors.Level(u, next(u_ex), area)                                   # The error at the time level.
+        if out[k]:                                                                  # If the time level is requested.
+            u_ap[perm, i] = u                                                       # Save the computed solution, in the order of p.
+            i            += 1                                                       # Increase the counter by 1.
+    vec = Reorder.Restore(operators[0], perm)                                       # The neighbors of each node, in the order of p.
+
+    return u_ap, er, vec
+
+def Cloud_Stream(p, f, g, t, c, cho, r, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = False, snapshots = None, operators = None, cache = False,
+                 stats = None, callback = None, order = 2, krylov = None, dtype = np.float64, workers = 1, reorder = None, checkpoint = None):
+    '''
+    Streaming numerical solution of the 2D wave equation on irregular domains using a Meshless Generalized Finite Difference Scheme.
+
+    This generator advances the same scheme as Cloud, but only the last three time levels are kept in a rotating buffer, so the memory
+    grows with m instead of m*t. The solution is yielded only at the requested output times.
+
+    Input:
+        p, f, g, t, c, cho, r, triangulation, tt, implicit, lam, sparse, cache, stats, callback, order, krylov, dtype, workers, reorder, checkpoint
+                                                    Same as in Cloud.
+        snapshots                   int/array       Output time levels.
+                                                        None: Only the final time level (Default).
+                                                        N: Every N time steps and the final one.
+                                                        array: The time levels closest to the listed times.
+        operators                   tuple           vec, K1, K2, K3, K4 as returned by Setup.
+                                                        If None, they are computed here (Default).
+                                                        reorder is only used when the operators are computed here.
+
+    Output (yielded at each output time level):
+        k                           int             Index of the time level.
+        T[k]                        float           Time of the time level.
+        u           m               ndarray         View of the solution at the time level.
+                                                        The buffer is reused, copy it to keep it.
+                                                        A resumed run starts at the time level of the checkpoint.
+    '''
+
+    ## Time discretization.
+    laplacian = None                                                                # The Laplacian of Stable, if any.
+    if t is None:                                                                   # The time step is selected automatically.
+        with Stats.Phase(stats, 'stable'):
+            t, _, _, implicit, order, *laplacian = Stable(p, c, triangulation, tt, order = order, cache = cache, implicit = implicit)
+                                                                                    # The number of time levels, the scheme, vec and A.
+
+    ## Checkpoints.
+    checkpoint = Checkpoint.Open(checkpoint, p, tt if triangulation == True else None,
+                                 dict(t = t, c = c, cho = cho, r = r, triangulation = triangulation, implicit = implicit, lam = lam, sparse = sparse,
+                                      order = order, krylov = krylov, dtype = np.dtype(dtype).str, reorder = reorder), dict(cache = cache, workers = workers))
+                                                                                    # The checkpoints of the run, if any.
+
+    ## Nodes reordering.
+    if reorder is not None and operators is None:                                   # The cloud is solved in a new order.
+        with Stats.Phase(stats, 'reorder'):
+            perm = Reorder.Permutation(p, tt if triangulation == True else None, reorder)
+                                                                                    # The new order of the nodes.
+        inv       = np.argsort(perm)                                                # The new index of each node.
+        operators = Setup(p, t, c, triangulation, tt, implicit and order == 2, lam, sparse, cache, stats, krylov, dtype, perm, laplacian)
+                                                                                    # vec and the K1, ..., K4 operators, in the new order.
+        callback  = None if callback is None else partial(Reorder.Hook, callback, inv)
+                                                                                    # The callback sees the original order.
+        if checkpoint is not None and cache == True:                                # The reference to the cached operators.
+            checkpoint.reference = Setup_Key(p, t, c, triangulation, tt, implicit and order == 2, lam, sparse, dtype, perm)
+        for k, tk, u in Cloud_Stream(p[perm], f, g, t, c, cho, r, snapshots = snapshots, operators = operators, stats = stats, callback = callback,
+                                     order = order, dtype = dtype, workers = workers, checkpoint = checkpoint):
+            yield k, tk, u[inv]                                                     # The solution in the order of p.
+        return
+
+    ## Variable initialization.
+    T      = np.linspace(0, 1, t)                                                   # Time discretization.
+    out    = Schedule(T, snapshots)                                                 # Time levels to be yielded.
+    boun_n = (p[:, 2] == 1) | (p[:, 2] == 2)                                        # Save the boundary nodes.
+    inne_n = p[:, 2] == 0                                                           # Save the inner nodes.
+    u_bo   = None                                                                   # Zero boundary condition.
+
+    ## Neighbor search and operators assembly.
+    if operators is None:                                                           # If the operators are not given.
+        operators = Setup(p, t, c, triangulation, tt, implicit and order == 2, lam, sparse, cache, stats, krylov, dtype, laplacian = laplacian)
+                                                                                    # vec and the K1, ..., K4 operators.
+        if checkpoint is not None and cache == True:                                # The reference to the cached operators.
+            checkpoint.reference = Setup_Key(p, t, c, triangulation, tt, implicit and order == 2, lam, sparse, dtype)
+
+    ## Restart state.
+    state = None                                                                    # The run starts from the initial condition.
+    if checkpoint is not None:                                                      # If there are checkpoints.
+        checkpoint.operators = operators                                            # The Krylov history is saved and restored.
+        state = checkpoint.load()                                                   # The checkpoint to continue, if any.
+    k0 = 0 if state is None else state[0]                                           # The last computed time level.
+
+    with Stats.Phase(stats, 'conditions'):
+        ## Boundary conditions.
+        if cho == 1:                                                                # Approximation Type selection.
+            u_bo = Conditions.Stream(f, p[boun_n, 0], p[boun_n, 1], T[1:], c, cho, r, start = k0)
+                                                                                    # The boundary condition, evaluated by blocks.
+
+        ## Initial conditions.
+        u0 = Conditions.Evaluate(f, p[:, 0], p[:, 1], T[0], c, cho, r)[:, 0].astype(dtype)
+                                                                                    # The initial condition.
+        v0 = Conditions.Evaluate(g, p[:, 0], p[:, 1], T[1 if order == 2 else 0], c, cho, r)[:, 0].astype(dtype)
+                                                                                    # The initial velocity.
+
+    ## Generalized Finite Differences Method
+    engine = Engine(operators, order, workers)                                      # The time integrator.
+    yield from Stats.Timed(stats, 'stepping', engine(operators, u0, v0, u_bo, boun_n, inne_n, T, out, callback, state = state, checkpoint = checkpoint))
+                                                                                    # The time between the yields is left out.
+    if stats is not None:
+        stats.steps += t - 1 - k0                                                   # The number of computed time steps.
+        for K in operators[1::2]:                                                   # K1 and K3.
+            if isinstance(K, Operators.Krylov):                                     # The iterations of the Krylov solves.
+                stats.iterations += K.iterations
+                stats.failures   += np.count_nonzero(K.info)                        # The solves that did not converge.
+
+def Resume(path, p, f, g, tt = None, snapshots = None, stats = None, callback = None):
+    '''
+    Continuation of a run from its last checkpoint.
+
+    The parameters of the run are read from the checkpoint, and the time steps continue from its time level with exactly the same
+    values as the uninterrupted run. The cloud and the conditions can not be stored in the checkpoint, so they must be given again
+    (the cloud is checked against the key of the checkpoint). The new checkpoints are written to the same file.
+
+    Input:
+        path                        string          File of the checkpoint, as given in the checkpoint option of Cloud or Cloud_Stream.
+        p, f, g, tt, snapshots, stats, callback     Same as in Cloud_Stream.
+
+    Output (yielded at each output time level, from the time level of the checkpoint on):
+        k, T[k], u                                  Same as in Cloud_Stream.
+    '''
+
+    ## Parameters of the run.
+    params = Checkpoint.Parameters(path)                                            # The parameters saved with the checkpoint.
+    r      = np.asarray(params['r']) if isinstance(params['r'], list) else params['r']
+                                                                                    # The parameters of the conditions.
+
+    return Cloud_Stream(p, f, g, params['t'], params['c'], params['cho'], r, params['triangulation'], tt, params['implicit'], params['lam'],
+                        params['sparse'], snapshots, cache = params['cache'], stats = stats, callback = callback, order = params['order'],
+                        krylov = params['krylov'], dtype = np.dtype(params['dtype']), workers = params['workers'], reorder = params['reorder'],
+                        checkpoint = {'path': path, 'every': params['every'], 'seconds': params['seconds'], 'resume': True})
+
+def Cloud_Ensemble(p, f, g, t, c, cho, R, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = False, snapshots = 1, operators = None, cache = False,
+                   order = 2, krylov = None, dtype = np.float64, workers = 1, reorder = None):
+    '''
+    Numerical solution of the 2D wave equation for several scenarios at once.
+
+    All the scenarios share the cloud and the operators, and they are advanced together as an m x n state matrix. Each time step
+    is a single sparse matrix-matrix product (and a multi right-hand side solve for the implicit scheme) instead of n matvecs.
+
+    Input:
+        p, t, c, cho, triangulation, tt, implicit, lam, sparse, operators, cache, order, krylov, dtype, workers, reorder
+                                                    Same as in Cloud_Stream.
+        f                           function/list   Function declared with the boundary condition, or a list with one function per scenario.
+        g                           function/list   Function declared with the boundary condition, or a list with one function per scenario.
+        R           n x 2           ndarray         Parameters r of each of the n scenarios (e.g. the drop coordinates).
+        snapshots                   int/array       Output time levels, as in Cloud_Stream (Default: every time level).
+
+    Output:
+        u_ap        m x n x s       ndarray         Array with the approximation of the n scenarios at the s output time levels.
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+    '''
+
+    ## Nodes reordering.
+    perm = np.arange(len(p[:, 0]))                                                  # The nodes are used in the order of p.
+    if reorder is not None and operators is None:                                   # The cloud is solved in a new order.
+        perm = Reorder.Permutation(p, tt if triangulation == True else None, reorder)
+                                                                                    # The new order of the nodes.
+
+    ## Variable initialization.
+    laplacian = None                                                                # The Laplacian of Stable, if any.
+    if t is None:                                                                   # The time step is selected automatically.
+        t, _, _, implicit, order, *laplacian = Stable(p, c, triangulation, tt, order = order, cache = cache, implicit = implicit)
+                                                                                    # The number of time levels, the scheme, vec and A.
+    m      = len(p[:, 0])                                                           # The total number of nodes is calculated.
+    n      = len(R)                                                                 # The number of scenarios.
+    T      = np.linspace(0, 1, t)                                                   # Time discretization.
+    out    = Schedule(T, snapshots)                                                 # Time levels to be saved.
+    u_ap   = np.zeros([m, n, np.count_nonzero(out)], dtype = dtype)                 # u_ap initialization with zeros.
     boun_n = (p[:, 2] == 1) | (p[:, 2] == 2)                                        # Save the boundary nodes.
     inne_n = p[:, 2] == 0                                                           # Save the inner nodes.
+    F      = f if isinstance(f, list) else [f]*n                                    # The condition f of each scenario.
+    G      = g if isinstance(g, list) else [g]*n                                    # The condition g of each scenario.
+    u_bo   = None                                                                   # Zero boundary condition.
+
+    ## Neighbor search and operators assembly.
+    if operators is None:                                                           # If the operators are not given.
+        operators = Setup(p, t, c, triangulation, tt, implicit and order == 2, lam, sparse, cache, krylov = krylov, dtype = dtype,
+                          perm = perm if reorder else None, laplacian = laplacian)  # vec and the K1, ..., K4 operators.
+    p      = p[perm]                                                                # The nodes in the order of the operators.
+    boun_n = boun_n[perm]
+    inne_n = inne_n[perm]
 
     ## Boundary conditions.
     if cho == 1:                                                                    # Approximation Type selection.
-        for k in np.arange(t):                                                      # For each time step.
-            u_ap[boun_n, k] = f(p[boun_n, 0], p[boun_n, 1], T[k], c, cho, r)        # The boundary condition is assigned.
+        u_bo = [Conditions.Stream(F[s], p[boun_n, 0], p[boun_n, 1], T[1:], c, cho, R[s]) for s in range(n)]
+                                                                                    # The boundary condition of each scenario.
+        u_bo = map(np.column_stack, zip(*u_bo))                                     # The boundary conditions as an nb x n matrix.
+
+    ## Initial conditions.
+    u0 = np.column_stack([Conditions.Evaluate(F[s], p[:, 0], p[:, 1], T[0], c, cho, R[s])[:, 0] for s in range(n)]).astype(dtype)
+                                                                                    # The initial condition of each scenario.
+    v0 = np.column_stack([Conditions.Evaluate(G[s], p[:, 0], p[:, 1], T[1 if order == 2 else 0], c, cho, R[s])[:, 0] for s in range(n)]).astype(dtype)
+                                                                                    # The initial velocity of each scenario.
+
+    ## Generalized Finite Differences Method
+    engine = Engine(operators, order, workers)                                      # The time integrator.
+    for i, (_, _, u) in enumerate(engine(operators, u0, v0, u_bo, boun_n, inne_n, T, out)):
+        u_ap[perm, :, i] = u                                                        # Save the computed solution, in the order of p.
+
+    return u_ap, Reorder.Restore(operators[0], perm)
+
+def Steps(operators, u0, v0, u_bo, boun_n, inne_n, T, out, callback = None, state = None, checkpoint = None):
+    '''
+    Time integration engine shared by the streaming solvers.
+
+    Only the last three time levels are kept in a rotating buffer. The state can be a vector (one scenario) or an m x n matrix
+    (n scenarios advanced together).
+
+    Input:
+        operators                   tuple           vec, K1, K2, K3, K4 as returned by Setup.
+        u0          m (x n)         ndarray         Initial condition.
+        v0          m (x n)         ndarray         Initial velocity.
+        u_bo                        iterator        Boundary condition for each time level k = 1, ..., t - 1 (None for zero).
+        boun_n      m               ndarray         Boolean array with the boundary nodes.
+        inne_n      m               ndarray         Boolean array with the inner nodes.
+        T           t               ndarray         Time discretization.
+        out         t               ndarray         Boolean array with the output time levels.
+        callback                    function        Function called after each time step as callback(k, T[k], u, elapsed) (Default: None).
+        state                       tuple           k, u^{k-1} and u^k to restart from (see Scripts/Checkpoint).
+                                                        None: The run starts from the initial condition (Default).
+                                                        tuple: The time steps continue from k, and u_bo starts at k + 1.
+        checkpoint                  function        Function called after each time step as checkpoint(k, u^{k-1}, u^k) (Default: None).
+
+    Output (yielded at each output time level):
+        k                           int             Index of the time level.
+        T[k]                        float           Time of the time level.
+        u           m (x n)         ndarray         View of the solution at the time level.
+    '''
+
+    ## Variable initialization.
+    t      = len(T)                                                                 # The number of time levels.
+    U      = np.zeros((3,) + np.shape(u0), dtype = np.result_type(u0))              # Rotating buffer with the last three time levels.
+    dt     = U.dtype.type(T[1] - T[0])                                              # dt computation, in the type of the solution.
+    _, K1, K2, K3, K4 = operators                                                   # The time-stepping operators.
+    start  = time.perf_counter()                                                    # Start time of the stepping.
 
     ## Initial condition.
-    u_ap[:, 0] = f(p[:, 0], p[:, 1], T[0], c, cho, r)                               # The initial condition is assigned.
-    
-    ## Neighbor search.
-    if triangulation == True:                                                       # If there are triangles available.
-        vec = Neighbors.Triangulation(p, tt, nvec)                                  # Neighbor search with the proper routine.
-    else:                                                                           # If there are no triangles available.
-        vec = Neighbors.Cloud(p, nvec)                                              # Neighbor search with the proper routine.
-
-    ## Gamma computation.
-    L = np.vstack([[0], [0], [2*cdt], [0], [2*cdt]])                                # The values of the differential operator are assigned.
-    K = Gammas.Cloud(p, vec, L)                                                     # K computation with the required Gammas.
-
-    if implicit == False:                                                           # For the explicit scheme.
-        K1 = np.identity(m)                                                         # Implicit formulation of K for k = 1.
-        K2 = np.identity(m) + (1/2)*K                                               # Implicit formulation of K for k = 1.
-        K3 = np.identity(m)                                                         # Implicit formulation of K for k = 2, ..., t.
-        K4 = 2*np.identity(m) + K                                                   # Implicit formulation of K for k = 2, ..., t.
-    else:                                                                           # For the implicit scheme.
-        K1 = np.linalg.pinv(np.identity(m) - (1 - lam)*(1/2)*K)                     # Implicit formulation of K for k = 1.
-        K2 = np.identity(m) + lam*(1/2)*K                                           # Implicit formulation of K for k = 1.
-        K3 = np.linalg.pinv(np.identity(m) - (1 - lam)*K)                           # Implicit formulation of K for k = 2, ..., t.
-        K4 = 2*np.identity(m) + lam*K                                               # Implicit formulation of K for k = 2, ..., t.
+    k0 = 0 if state is None else state[0]                                           # The last computed time level.
+    if state is None:                                                               # For a new run.
+        U[0] = u0                                                                   # The initial condition is assigned.
+    else:                                                                           # For a resumed run.
+        U[(k0 - 1)%3], U[k0%3] = state[1], state[2]                                 # The time levels of the checkpoint.
+    if out[k0]:                                                                     # If the time level is requested.
+        yield k0, T[k0], U[k0%3]                                                    # The time level is yielded.
 
     ## Generalized Finite Differences Method
-    for k in np.arange(1, t):                                                       # For al time levels.
+    for k in np.arange(k0 + 1, t):                                                  # For al time levels.
         if k == 1:                                                                  # For the first time level.
-            un = K1@(K2@u_ap[:, k - 1] + dt*g(p[:, 0], p[:, 1], T[k], c, cho, r))   # The new time-level is computed.
-            u_ap[inne_n, k] = un[inne_n]                                            # Save the computed solution.
+            un = K1@(K2@U[0] + dt*v0)                                               # The new time-level is computed.
         else:                                                                       # For all the other time levels.
-            un = K3@(K4@u_ap[:, k - 1] - u_ap[:, k - 2])                            # The new time-level is computed.
-            u_ap[inne_n, k] = un[inne_n]                                            # Save the computed solution.                
+            un = K3@(K4@U[(k - 1)%3] - U[(k - 2)%3])                                # The new time-level is computed.
+        u = U[k%3]                                                                  # The oldest time level is overwritten.
+        u[:] = 0                                                                    # The time level is cleared.
+        if u_bo is not None:                                                        # For a function boundary condition.
+            u[boun_n] = next(u_bo)                                                  # The boundary condition is assigned.
+        u[inne_n] = un[inne_n]                                                      # Save the computed solution.
+        if callback is not None:                                                    # If there is a per-step hook.
+            callback(k, T[k], u, time.perf_counter() - start)
+        if checkpoint is not None:                                                  # The restart state, when it is due.
+            checkpoint(k, U[(k - 1)%3], u)
+        if out[k]:                                                                  # If the time level is requested.
+            yield k, T[k], u                                                        # The time level is yielded.
 
-    ## Theoretical Solution
-    for k in np.arange(t):                                                          # For all the time steps.
-        u_ex[:, k] = f(p[:, 0], p[:, 1], T[k], c, cho, r)                           # The theoretical solution is computed.
+def Steps_Fused(operators, u0, v0, u_bo, boun_n, inne_n, T, out, callback = None, workers = 1, state = None, checkpoint = None):
+    '''
+    Fused time integration engine for the explicit scheme.
+
+    With K1 = K3 = I, each time level is u^{k+1} = K4 u^k - u^{k-1}, where K4 = 2I + K already holds the update 2u + Ku in a
+    single stencil. The rows of K4 on the boundary are removed once, the stencil is applied directly into the buffer of the new
+    time level and u^{k-1} is subtracted in place, and only the boundary nodes are assigned afterwards through an integer index
+    array. So the identity products, the boolean masks and the temporaries of Steps are avoided, and the time steps allocate no
+    memory (the boundary condition is still evaluated by blocks). The results are the ones of Steps.
+
+    With several workers, the nodes are split into contiguous blocks with about the same number of nonzeros of K4, and each
+    block is advanced by a thread of a pool that lives for the whole run. The kernels (SciPy CSR products, np.dot and the in-place
+    NumPy operations) release the GIL, and the threads only wait for each other once per time step. With sparse operators the
+    results do not depend on the number of workers (dense products may change in the last digits).
+
+    Input:
+        operators, u0, v0, u_bo, boun_n, inne_n, T, out, callback, state, checkpoint
+                                                    Same as in Steps. The operators are those of the explicit scheme.
+        workers                     int             Number of threads (Default: 1).
+                                                        None: One thread per core.
+
+    Output (yielded at each output time level):
+        k                           int             Index of the time level.
+        T[k]                        float           Time of the time level.
+        u           m (x n)         ndarray         View of the solution at the time level.
+    '''
+
+    ## Variable initialization.
+    t      = len(T)                                                                 # The number of time levels.
+    U      = np.zeros((3,) + np.shape(u0), dtype = np.result_type(u0))              # Rotating buffer with the last three time levels.
+    A      = np.zeros_like(U[0])                                                    # Buffer for the shifts and dt g.
+    dt     = U.dtype.type(T[1] - T[0])                                              # dt computation, in the type of the solution.
+    boun   = np.flatnonzero(boun_n)                                                 # Indexes of the boundary nodes.
+    inne   = np.flatnonzero(inne_n)                                                 # Indexes of the inner nodes.
+    S2, s2 = Operators.Rows(operators[2], inne)                                     # K2 without the boundary rows, for k = 1.
+    S4, s4 = Operators.Rows(operators[4], inne)                                     # K4 without the boundary rows, for k = 2, ..., t.
+    bounds = Operators.Partition(S4, workers or os.cpu_count() or 1)                # Row blocks balanced by nonzeros, one per thread.
+    blocks = [(slice(a, b), S2[a:b], s2, S4[a:b], s4, A[a:b], dt) for a, b in zip(bounds[:-1], bounds[1:]) if b > a]
+                                                                                    # The data of each block.
+    pool   = ThreadPoolExecutor(len(blocks)) if len(blocks) > 1 else None           # Persistent pool of threads.
+    start  = time.perf_counter()                                                    # Start time of the stepping.
+
+    try:
+        ## Initial condition.
+        k0 = 0 if state is None else state[0]                                       # The last computed time level.
+        if state is None:                                                           # For a new run.
+            U[0] = u0                                                               # The initial condition is assigned.
+        else:                                                                       # For a resumed run.
+            U[(k0 - 1)%3], U[k0%3] = state[1], state[2]                             # The time levels of the checkpoint.
+        if out[k0]:                                                                 # If the time level is requested.
+            yield k0, T[k0], U[k0%3]                                                # The time level is yielded.
+
+        ## Generalized Finite Differences Method
+        for k in range(k0 + 1, t):                                                  # For al time levels.
+            if k == 1:                                                              # For the first time level.
+                up, uo = U[0], v0                                                   # K2 u^0 + dt g.
+            else:                                                                   # For all the other time levels.
+                up, uo = U[(k - 1)%3], U[(k - 2)%3]                                 # K4 u^{k-1} - u^{k-2}.
+            u = U[k%3]                                                              # The oldest time level is overwritten.
+            if pool is None:                                                        # For a single block.
+                Steps_Block(blocks[0], up, uo, u, k == 1)                           # The new time level is computed.
+            else:                                                                   # For several blocks.
+                for _ in pool.map(Steps_Block, blocks, repeat(up), repeat(uo), repeat(u), repeat(k == 1)):
+                    pass                                                            # Barrier: all the blocks are computed.
+            u[boun] = 0 if u_bo is None else next(u_bo)                             # The boundary condition is assigned.
+            if callback is not None:                                                # If there is a per-step hook.
+                callback(k, T[k], u, time.perf_counter() - start)
+            if checkpoint is not None:                                              # The restart state, when it is due.
+                checkpoint(k, U[(k - 1)%3], u)
+            if out[k]:                                                              # If the time level is requested.
+                yield k, T[k], u                                                    # The time level is yielded.
+    finally:
+        if pool is not None:
+            pool.shutdown()                                                         # The threads are released.
+
+def Steps_Block(block, up, uo, u, first):
+    '''
+    Time step of a block of nodes for Steps_Fused.
+
+    Input:
+        block                       tuple           Rows, K2 rows and shift, K4 rows and shift, A buffer, and dt of the block.
+        up          m (x n)         ndarray         Previous time level (u^0 for the first time level).
+        uo          m (x n)         ndarray         Time level before (the initial velocity for the first time level).
+        u           m (x n)         ndarray         New time level, where the rows of the block are written.
+        first                       bool            Select whether or not it is the first time level.
+    '''
+
+    ## Variable initialization.
+    rows, S2, s2, S4, s4, A, dt = block                                             # The data of the block.
+    S, s = (S2, s2) if first else (S4, s4)                                          # The operator of the time level.
+    y    = u[rows]                                                                  # The rows of the new time level.
+
+    ## Time step.
+    Operators.Product(S, up, y)                                                     # The stencil is applied in place.
+    if s != 0:                                                                      # For the single precision operators.
+        np.multiply(up[rows], s, out = A)                                           # The shift is applied apart.
+        y += A
+    if first:                                                                       # For the first time level.
+        np.multiply(uo[rows], dt, out = A)
+        y += A                                                                      # dt g is added.
+    else:                                                                           # For all the other time levels.
+        y -= uo[rows]                                                               # u^{k-1} is subtracted.
+
+def Steps_Fourth(operators, u0, v0, u_bo, boun_n, inne_n, T, out, callback = None, state = None, checkpoint = None):
+    '''
+    Fourth-order time integration engine (modified equation, Lax-Wendroff type).
+
+    With K = c^2 dt^2 A, the central scheme is corrected with the next term of the Taylor expansion of u_tt, so each time level is
+    computed as u^{k+1} = 2u^k - u^{k-1} + W + KW/12, with W = Ku^k. The rows of W on the boundary are not given by K, they are taken
+    from the second difference of the boundary condition in time (zero for the zero boundary condition). The first time level
+    is the Taylor expansion u^1 = u^0 + dt v + W/2 + dt Kv/6 + KW/24, where v is the initial velocity g at t = 0.
+
+    Each time step costs two sparse matrix-vector products with K, and the scheme is stable while c^2 dt^2 rho(A) <= 12, a time
+    step sqrt(3) times larger than the one of the central scheme.
+
+    Input:
+        operators, u0, v0, u_bo, boun_n, inne_n, T, out, callback, state, checkpoint
+                                                    Same as in Steps. The operators are those of the explicit scheme (K = K4 - 2I).
+
+    Output (yielded at each output time level):
+        k                           int             Index of the time level.
+        T[k]                        float           Time of the time level.
+        u           m (x n)         ndarray         View of the solution at the time level.
+    '''
+
+    ## Variable initialization.
+    t      = len(T)                                                                 # The number of time levels.
+    U      = np.zeros((3,) + np.shape(u0), dtype = np.result_type(u0))              # Rotating buffer with the last three time levels.
+    dt     = U.dtype.type(T[1] - T[0])                                              # dt computation, in the type of the solution.
+    K4     = operators[4]                                                           # Explicit operator 2I + K.
+    m      = K4.shape[0]                                                            # The total number of nodes.
+    if isinstance(K4, Operators.Shifted):                                           # For the single precision operators.
+        K = K4.K                                                                    # K is kept apart.
+    elif sp.issparse(K4):                                                           # For the sparse operators.
+        K = (K4 - 2*sp.identity(m, dtype = K4.dtype, format = 'csr')).tocsr()       # K is recovered from K4.
+    else:                                                                           # For the dense operators.
+        K = K4 - 2*np.identity(m, dtype = K4.dtype)                                 # K is recovered from K4.
+    start  = time.perf_counter()                                                    # Start time of the stepping.
+
+    ## Initial condition.
+    k0 = 0 if state is None else state[0]                                           # The last computed time level.
+    if state is None:                                                               # For a new run.
+        U[0] = u0                                                                   # The initial condition is assigned.
+    else:                                                                           # For a resumed run.
+        U[(k0 - 1)%3], U[k0%3] = state[1], state[2]                                 # The time levels of the checkpoint.
+    if out[k0]:                                                                     # If the time level is requested.
+        yield k0, T[k0], U[k0%3]                                                    # The time level is yielded.
+
+    ## Generalized Finite Differences Method
+    for k in np.arange(k0 + 1, t):                                                  # For al time levels.
+        ub = None if u_bo is None else next(u_bo)                                   # The boundary condition at the new time level.
+        if k == 1:                                                                  # For the first time level.
+            W = K@U[0]                                                              # c^2 dt^2 Laplacian of the initial condition.
+            if ub is not None:                                                      # dt^2 u_tt on the boundary.
+                W[boun_n] = 2*(ub - U[0][boun_n] - dt*v0[boun_n])
+            un = U[0] + dt*v0 + W/2 + K@(dt*v0/6 + W/24)                            # The new time-level is computed.
+        else:                                                                       # For all the other time levels.
+            up = U[(k - 1)%3]                                                       # The previous time level.
+            uo = U[(k - 2)%3]                                                       # The time level before.
+            W  = K@up                                                               # c^2 dt^2 Laplacian of the previous time level.
+            if ub is not None:                                                      # dt^2 u_tt on the boundary.
+                W[boun_n] = ub - 2*up[boun_n] + uo[boun_n]
+            un = 2*up - uo + W + (K@W)/12                                           # The new time-level is computed.
+        u = U[k%3]                                                                  # The oldest time level is overwritten.
+        u[:] = 0                                                                    # The time level is cleared.
+        if ub is not None:                                                          # For a function boundary condition.
+            u[boun_n] = ub                                                          # The boundary condition is assigned.
+        u[inne_n] = un[inne_n]                                                      # Save the computed solution.
+        if callback is not None:                                                    # If there is a per-step hook.
+            callback(k, T[k], u, time.perf_counter() - start)
+        if checkpoint is not None:                                                  # The restart state, when it is due.
+            checkpoint(k, U[(k - 1)%3], u)
+        if out[k]:                                                                  # If the time level is requested.
+            yield k, T[k], u                                                        # The time level is yielded.
+
+def Engine(operators, order = 2, workers = 1):
+    '''
+    Selection of the time integration engine.
+
+    Input:
+        operators                   tuple           vec, K1, K2, K3, K4 as returned by Setup.
+        order                       int             Order of the time integrator, as in Cloud (Default: 2).
+        workers                     int             Number of threads of Steps_Fused, as in Cloud (Default: 1).
+
+    Output:
+        engine                      function        Steps_Fourth for order 4, Steps_Fused for the explicit scheme (K1 and K3 are
+                                                    the same identity), and Steps otherwise.
+    '''
+
+    if order == 4:                                                                  # Fourth-order modified equation.
+        return Steps_Fourth
+    if operators[1] is operators[3]:                                                # For the explicit scheme.
+        return partial(Steps_Fused, workers = workers)
+    return Steps
+
+def Setup(p, t, c, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = False, cache = False, stats = None, krylov = None,
+          dtype = np.float64, perm = None, laplacian = None):
+    '''
+    Neighbor search and assembly of the time-stepping operators.
+
+    The new time level is computed as K1(K2 u^0 + dt g) for k = 1, and as K3(K4 u^{k-1} - u^{k-2}) for k = 2, ..., t.
+
+    Input:
+        p, t, c, triangulation, tt, implicit, lam, sparse
+                                                    Same as in Cloud.
+        cache                       bool            Select whether or not use the on-disk operator cache (see Scripts/Cache).
+                                                        True: vec and K (and the dense pseudoinverses) are reused.
+                                                        False: Everything is computed from scratch (Default).
+        stats                       Stats           Stats object to record the phases (Default: None).
+        krylov                      dict            Options of the Krylov solver, as in Cloud (Default: None).
+        dtype                       type            Type of K and of the operators, as in Cloud (Default: float64).
+        perm        m               ndarray         New order of the nodes, as returned by Reorder.Permutation (Default: None).
+                                                        The neighbors are found on p, and vec and the operators are given for
+                                                        the nodes p[perm], so the stencils do not depend on the order.
+        laplacian                   tuple           vec and A of the cloud p, as returned by Stable (Default: None).
+                                                        K is c^2 dt^2 A, so the neighbor search and the Gammas are not repeated.
+
+    Output:
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+        K1          m x m           ndarray         Operator for k = 1.
+        K2          m x m           ndarray         Operator for k = 1.
+        K3          m x m           ndarray         Operator for k = 2, ..., t.
+        K4          m x m           ndarray         Operator for k = 2, ..., t.
+    '''
+
+    ## Variable initialization.
+    m      = len(p[:, 0])                                                           # The total number of nodes is calculated.
+    nvec   = 8                                                                      # Maximum number of neighbors for each node.
+    T      = np.linspace(0, 1, t)                                                   # Time discretization.
+    dt     = T[1] - T[0]                                                            # dt computation.
+    cdt    = (c**2)*(dt**2)                                                         # cdt is equals to c^2 dt^2.
+    data   = None                                                                   # Cached operators.
+
+    ## Cached operators.
+    if cache == True:                                                               # If the cache is used.
+        key  = Setup_Key(p, t, c, triangulation, tt, implicit, lam, sparse, dtype, perm)
+                                                                                    # The key of the cloud and the parameters.
+        with Stats.Phase(stats, 'cache'):
+            data = Cache.Load(key)                                                  # The cached operators, if any.
+
+    if data is not None:                                                            # If the operators were cached.
+        vec = data['vec']                                                           # The cached neighbors.
+        K   = data['K']                                                             # The cached Gammas.
+    elif laplacian is not None:                                                     # If the Laplacian is given by Stable.
+        ## Gamma scaling.
+        with Stats.Phase(stats, 'gammas'):
+            vec, A = laplacian                                                      # The neighbors and the Laplacian of Stable.
+            if perm is not None:                                                    # The operators are assembled in the new order.
+                vec = Reorder.Renumber(vec, perm)                                   # The neighbors with the new indexes.
+                A   = A[perm][:, perm]                                              # The Laplacian in the new order.
+            K = (cdt*A).astype(dtype)                                               # K computation, K = c^2 dt^2 A.
+            if sparse == False:                                                     # For the dense operators.
+                K = K.toarray()
+    else:
+        ## Neighbor search.
+        with Stats.Phase(stats, 'neighbors'):
+            if triangulation == True:                                               # If there are triangles available.
+                vec = Neighbors.Triangulation(p, tt, nvec)                          # Neighbor search with the proper routine.
+            else:                                                                   # If there are no triangles available.
+                vec = Neighbors.Cloud(p, nvec)                                      # Neighbor search with the proper routine.
+
+        ## Nodes reordering.
+        if perm is not None:                                                        # The operators are assembled in the new order.
+            vec = Reorder.Renumber(vec, perm)                                       # The neighbors with the new indexes.
+            p   = np.asarray(p)[perm]                                               # The nodes in the new order.
+
+        ## Gamma computation.
+        with Stats.Phase(stats, 'gammas'):
+            L = np.vstack([[0], [0], [2*cdt], [0], [2*cdt]])                        # The values of the differential operator are assigned.
+            if sparse == True:                                                      # For the sparse operators.
+                K = Gammas.Cloud_Sparse(p, vec, L, dtype)                           # K computation with the required Gammas.
+            else:                                                                   # For the dense operators.
+                K = Gammas.Cloud(p, vec, L, dtype)                                  # K computation with the required Gammas.
+
+    ## Operators assembly.
+    with Stats.Phase(stats, 'operators'):
+        if sparse == True:                                                          # For the sparse operators.
+            if implicit == False:                                                   # For the explicit scheme.
+                K1, K2, K3, K4 = Operators.Explicit(K)                              # Sparse explicit operators.
+            else:                                                                   # For the implicit scheme.
+                K1, K2, K3, K4 = Operators.Implicit(K, lam, krylov)                 # Sparse implicit operators, factorized once or iterative.
+        elif implicit == False:                                                     # For the explicit scheme.
+            I  = np.identity(m, dtype = dtype)                                      # Identity matrix.
+            K1 = I                                                                  # Implicit formulation of K for k = 1.
+            K2 = I + (1/2)*K                                                        # Implicit formulation of K for k = 1.
+            K3 = I                                                                  # Implicit formulation of K for k = 2, ..., t.
+            K4 = 2*I + K                                                            # Implicit formulation of K for k = 2, ..., t.
+            if K.dtype != np.float64:                                               # In single precision the identity is applied apart.
+                K2, K4 = Operators.Shifted((1/2)*K, 1), Operators.Shifted(K, 2)
+        else:                                                                       # For the implicit scheme.
+            if data is not None:                                                    # If the pseudoinverses were cached.
+                K1 = data['K1']                                                     # Implicit formulation of K for k = 1.
+                K3 = data['K3']                                                     # Implicit formulation of K for k = 2, ..., t.
+            else:
+                K1 = np.linalg.pinv(np.identity(m) - (1 - lam)*(1/2)*K).astype(dtype)
+                                                                                    # Implicit formulation of K for k = 1 (in float64).
+                K3 = np.linalg.pinv(np.identity(m) - (1 - lam)*K).astype(dtype)     # Implicit formulation of K for k = 2, ..., t (in float64).
+            I  = np.identity(m, dtype = dtype)                                      # Identity matrix.
+            K2 = I + lam*(1/2)*K                                                    # Implicit formulation of K for k = 1.
+            K4 = 2*I + lam*K                                                        # Implicit formulation of K for k = 2, ..., t.
+            if K.dtype != np.float64:                                               # In single precision the identity is applied apart.
+                K2, K4 = Operators.Shifted(lam*(1/2)*K, 1), Operators.Shifted(lam*K, 2)
+
+    ## Cache update.
+    if cache == True and data is None:                                              # If the operators were not cached.
+        with Stats.Phase(stats, 'cache'):
+            if sparse == False and implicit == True:                                # The dense pseudoinverses are the most expensive part.
+                Cache.Save(key, vec = vec, K = K, K1 = K1, K3 = K3)                 # The operators are saved.
+            else:                                                                   # Sparse factorizations are rebuilt from K.
+                Cache.Save(key, vec = vec, K = K)                                   # The operators are saved.
+
+    return vec, K1, K2, K3, K4
+
+def Setup_Key(p, t, c, triangulation = False, tt = None, implicit = False, lam = 0.5, sparse = False, dtype = np.float64, perm = None):
+    '''
+    Key of the cached operators of Setup.
+
+    Input:
+        p, t, c, triangulation, tt, implicit, lam, sparse, dtype, perm
+                                                    Same as in Setup.
+
+    Output:
+        key                         string          Key of the cache entry (see Scripts/Cache).
+    '''
+
+    ## Variable initialization.
+    nvec = 8                                                                        # Maximum number of neighbors for each node.
+    T    = np.linspace(0, 1, t)                                                     # Time discretization.
+    dt   = T[1] - T[0]                                                              # dt computation.
+
+    return Cache.Key(p, tt if triangulation == True else None, nvec = nvec, triangulation = triangulation, mode = 2 if triangulation == True else 3,
+                     c = c, dt = dt, implicit = implicit, lam = lam, sparse = sparse, dtype = np.dtype(dtype).str,
+                     perm = Cache.Key(perm) if perm is not None else None)
+
+def Stable(p, c, triangulation = False, tt = None, safety = 0.5, order = 2, cache = False, implicit = False, limit = 3e3):
+    '''
+    Stable
+    Function to select the largest stable time step of the explicit scheme.
+
+    The explicit scheme u^{k+1} = 2u^k - u^{k-1} + c^2 dt^2 A u^k, with A the GFD Laplacian of the inner nodes, needs
+    c^2 dt^2 rho(A) <= 4, with rho(A) the spectral radius of A. rho(A) is estimated with a few sparse Arnoldi iterations (see
+    Operators.Radius), and dt is reduced by the safety factor and rounded down to divide [0, 1] into a whole number of steps.
+    K = c^2 dt^2 A is linear in c^2 dt^2, so vec and A are given back for Setup, which then only scales A.
+
+    The bound is not enough on every cloud: A is not symmetric, and the modes of its eigenvalues off the negative real axis grow
+    for any time step. The explicit scheme is therefore run once on the inner nodes from a random initial condition (see
+    Operators.Growth), and if its energy grows more than the limit, a warning is raised and the implicit scheme of order 2 is
+    selected instead.
+
+    Input:
+        p, c, triangulation, tt, cache, implicit    Same as in Cloud. The check is skipped for the implicit scheme.
+        safety                      float           Safety factor applied to the largest stable time step (Default: 0.5).
+        order                       int             Order of the time integrator, as in Cloud (Default: 2).
+                                                        The bound is c^2 dt^2 rho(A) <= 12 for the fourth-order scheme.
+        limit                       float           Largest allowed growth of the energy of the explicit scheme (Default: 3e3).
+
+    Output:
+        t                           int             Number of time levels, to be used as t in Cloud.
+        dt                          float           Time step, equals to 1/(t - 1).
+        rho                         float           Estimated spectral radius of A.
+        implicit                    bool            The scheme to be used as implicit in Cloud.
+        order                       int             The order to be used as order in Cloud.
+        vec         m x o           ndarray         Array with the correspondence of the o neighbors of each node.
+        A           m x m           csr_matrix      The GFD Laplacian of all the nodes, without the c^2 dt^2 factor.
+    '''
+
+    ## Variable initialization.
+    nvec   = 8                                                                      # Maximum number of neighbors for each node.
+    inne_n = p[:, 2] == 0                                                           # Save the inner nodes.
+    L      = np.vstack([[0], [0], [2], [0], [2]])                                   # The Laplacian, without the c^2 dt^2 factor.
+    data   = None                                                                   # Cached Laplacian.
+
+    ## Cached Laplacian.
+    if cache == True:                                                               # If the cache is used.
+        key  = Cache.Key(p, tt if triangulation == True else None, nvec = nvec, triangulation = triangulation, mode = 2 if triangulation == True else 3,
+                         laplacian = True)                                          # The key of the cloud, without the time step.
+        data = Cache.Load(key)                                                      # The cached Laplacian, if any.
+
+    if data is not None:                                                            # If the Laplacian was cached.
+        vec, A, rho = data['vec'], data['A'], float(data['rho'])
+    else:
+        ## GFD Laplacian.
+        if triangulation == True:                                                   # If there are triangles available.
+            vec = Neighbors.Triangulation(p, tt, nvec)                              # Neighbor search with the proper routine.
+        else:                                                                       # If there are no triangles available.
+            vec = Neighbors.Cloud(p, nvec)                                          # Neighbor search with the proper routine.
+        A   = Gammas.Cloud_Sparse(p, vec, L)                                        # The Laplacian of all the nodes.
+        rho = Operators.Radius(A[inne_n][:, inne_n])                                # Spectral radius of the Laplacian between the inner nodes.
+        if cache == True:                                                           # The Laplacian is saved.
+            Cache.Save(key, vec = vec, A = A, rho = np.array(rho))
+
+    ## Time step.
+    dt  = safety*np.sqrt(4 if order == 2 else 12)/(c*np.sqrt(rho))                  # The largest stable time step with the safety factor.
+    t   = int(np.ceil(1/dt)) + 1                                                    # The number of time levels.
+    dt  = 1/(t - 1)                                                                 # The time step for T = linspace(0, 1, t).
+
+    ## Growth of the explicit scheme.
+    if implicit == False or order != 2:                                             # The explicit scheme is used.
+        growth = Operators.Growth((c**2)*(dt**2)*A[inne_n][:, inne_n], t - 1, order)
+                                                                                    # Growth of the energy over the run.
+        if growth > limit:                                                          # The explicit scheme is not stable on the cloud.
+            warnings.warn('The explicit scheme grows by %.3g over the run on this cloud, the implicit scheme is used.' % growth,
+                          RuntimeWarning)
+            implicit, order = True, 2
+
+    return t, dt, rho, implicit, order, vec, A
+
+def Schedule(T, snapshots = None):
+    '''
+    Schedule
+    Function to select the output time levels of a streaming run.
+
+    Input:
+        T           t               ndarray         Time discretization.
+        snapshots                   int/array       Output time levels.
+                                                        None: Only the final time level (Default).
+                                                        N: Every N time steps and the final one (N >= 1).
+                                                        array: The time levels closest to the listed times.
+
+    Output:
+        out         t               ndarray         Boolean array with the output time levels.
+    '''
+
+    ## Variable initialization.
+    t   = len(T)                                                                    # The number of time levels.
+    out = np.zeros(t, dtype = bool)                                                 # out initialization with False.
+    out[-1] = True                                                                  # The final time level is always saved.
+
+    ## Output time levels.
+    if np.ndim(snapshots) == 0 and snapshots is not None:                           # Every N time steps.
+        if int(snapshots) < 1:
+            raise ValueError("snapshots must be at least 1 (every N time steps), got %s." % snapshots)
+        out[::int(snapshots)] = True                                                # The time levels are marked.
+    elif snapshots is not None:                                                     # Listed times.
+        times = np.asarray(snapshots, dtype = float).reshape(-1)                    # The listed times as an array.
+        idx   = np.abs(T[None, :] - times[:, None]).argmin(axis = 1)                # The closest time level to each listed time.
+        out[:] = False                                                              # Only the listed times are saved.
+        out[idx] = True                                                             # The time levels are marked.
 
-    return u_ap, u_ex, vec
\ No newline at end of file
+    return out
\ No newline at end of file